@@ -0,0 +1,112 @@
+"""Item-by-item scoring of list answers ("propre coing comete oubli").
+
+A list answer is compared with the solution as a sequence of tokens: a
+small edit-distance DP over tokens in which inserting or deleting an item
+costs 1 and putting one item in place of another costs 1 - similarity, the
+character-level closeness of the two items. A single typo therefore costs
+a fraction of an item, a missing or extra item costs a whole one, and the
+score says how many items were right.
+
+The DP has one cell per pair of items. The character distances it needs
+come from an ItemMatcher built once per solution: every solution item is a
+lane of one bit-parallel pattern (the algorithm of utils.levenshtein_distance
+with carries and shifts kept inside each lane), so one pass over an answer
+item yields its distance to all solution items.
+"""
+
+import re
+
+_TOKEN = re.compile(r"[^\s,;]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Items of a list answer: split on whitespace, commas and semicolons."""
+    return _TOKEN.findall(text)
+
+
+class ItemMatcher:
+    """Levenshtein distances from any word to each of a fixed list of items, in one pass."""
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        self._peq: dict[str, int] = {}
+        self._lanes = []
+        low = high = 0
+        position = 0
+        for item in self.items:
+            for offset, char in enumerate(item):
+                self._peq[char] = self._peq.get(char, 0) | 1 << (position + offset)
+            if item:
+                low |= 1 << position
+                high |= 1 << (position + len(item) - 1)
+            self._lanes.append(((1 << len(item)) - 1) << position)
+            position += len(item)
+        self._mask = (1 << position) - 1
+        self._low = low
+        self._high = high
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def distances(self, word: str) -> list[int]:
+        """utils.levenshtein_distance(word, item) for every item, in order."""
+        peq, mask, low, high = self._peq, self._mask, self._low, self._high
+        below_high = mask & ~high
+        pv, mv = mask, 0
+        for c in word:
+            eq = peq.get(c, 0)
+            xv = eq | mv
+            x = eq & pv
+            # x + pv within each lane: the lanes' top bits are added without carry-out.
+            total = ((x & below_high) + (pv & below_high)) ^ ((x ^ pv) & high)
+            xh = (total ^ pv) | eq
+            ph = mv | (~(xh | pv) & mask)
+            mh = pv & xh
+            # Shift up within lanes; every lane's first row starts a new +1 boundary.
+            ph = (ph << 1 & ~low | low) & mask
+            mh = mh << 1 & ~low & mask
+            pv = mh | (~(xv | ph) & mask)
+            mv = ph & xv
+        # Distance = top row (len(word)) plus the vertical deltas down the lane.
+        n = len(word)
+        return [n + (pv & lane).bit_count() - (mv & lane).bit_count() for lane in self._lanes]
+
+    def similarities(self, word: str) -> list[float]:
+        """1 - distance / longer length for every item: 1.0 equal, 0.0 nothing in common."""
+        return [1.0 - d / max(len(word), len(item), 1) for d, item in zip(self.distances(word), self.items)]
+
+
+def token_distance(answer: list[str], solution, matcher: ItemMatcher | None = None) -> float:
+    """Cheapest alignment cost of answer to solution (see module docstring).
+
+    matcher, if given, must be ItemMatcher(solution); pass it to reuse one per problem.
+    """
+    solution = tuple(solution)
+    if matcher is None:
+        matcher = ItemMatcher(solution)
+    # Items that agree at the start or the end align with each other at no cost.
+    start = 0
+    while start < len(answer) and start < len(solution) and answer[start] == solution[start]:
+        start += 1
+    end = 0
+    while end < len(answer) - start and end < len(solution) - start and answer[-1 - end] == solution[-1 - end]:
+        end += 1
+    inner = solution[start:len(solution) - end]
+
+    previous = [float(j) for j in range(len(inner) + 1)]
+    for i, a in enumerate(answer[start:len(answer) - end], 1):
+        similar = matcher.similarities(a)
+        current = [float(i)]
+        for j in range(1, len(inner) + 1):
+            replace = previous[j - 1] + 1.0 - similar[start + j - 1]
+            current.append(min(previous[j] + 1.0, current[j - 1] + 1.0, replace))
+        previous = current
+    return previous[-1]
+
+
+def token_score(answer: list[str], solution, matcher: ItemMatcher | None = None) -> float:
+    """1.0 minus the alignment cost per item of the longer list, floored at 0.0."""
+    longest = max(len(answer), len(solution))
+    if longest == 0:
+        return 1.0
+    return max(0.0, 1.0 - token_distance(answer, solution, matcher) / longest)
@@ -0,0 +1,144 @@
+"""Score many (solution, response) pairs at once, for re-scoring session history.
+
+The default scorer (scoring.EditDistance) is normalization plus one
+Levenshtein distance. levenshtein_many() computes those distances for a
+whole batch: after dropping common prefixes and suffixes, pairs whose
+shorter string fits in 64 characters are sorted by length, cut into groups, and run through the
+bit-parallel algorithm of utils.levenshtein_distance with NumPy, one uint64
+lane per pair. Every character of the longer strings then costs a few array
+operations for the whole group. Each pair's distance is read off when its
+own longer string ends, so padding a group to its longest strings changes
+nothing. Longer pairs, which are rare, use the scalar function.
+
+NumPy is optional; without it every pair goes through utils.levenshtein_distance.
+"""
+
+from scoring import normalize
+from utils import _trim_affixes, levenshtein_distance, osa_distance
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Pairs per NumPy group: large enough to amortize per-row overhead, small
+# enough that sorted neighbours have similar lengths.
+GROUP_SIZE = 2048
+_LANE_BITS = 64
+
+
+def _codes(strings: list[str], width: int):
+    """(len(strings), width) array of code points, zero padded."""
+    packed = ''.join(s.ljust(width, '\0') for s in strings).encode('utf-32-le')
+    return np.frombuffer(packed, dtype=np.uint32).reshape(len(strings), width)
+
+
+def _group_distances(longer: list[str], shorter: list[str], transpositions: bool = False) -> list[int]:
+    """Distances of one group; shorter[k] is non-empty, at most 64 long and no longer than longer[k].
+
+    With transpositions, utils.osa_distance's extra term is added to every lane.
+    """
+    la = np.fromiter(map(len, longer), dtype=np.int64, count=len(longer))
+    lb = np.fromiter(map(len, shorter), dtype=np.int64, count=len(shorter))
+    a = _codes(longer, int(la.max()))
+    b = _codes(shorter, int(lb.max()))
+    weights = np.left_shift(np.uint64(1), np.arange(b.shape[1], dtype=np.uint64))
+    one = np.uint64(1)
+    mask = np.array([(1 << length) - 1 for length in lb.tolist()], dtype=np.uint64)
+    last = np.left_shift(one, (lb - 1).astype(np.uint64))
+
+    pv = mask.copy()
+    mv = np.zeros_like(mask)
+    d0 = np.zeros_like(mask)
+    previous_eq = np.zeros_like(mask)
+    score = lb.copy()
+    result = np.zeros_like(lb)
+    for i in range(a.shape[1]):
+        eq = (b == a[:, i:i + 1]).astype(np.uint64) @ weights & mask
+        if transpositions:
+            # From the previous column's d0, before it is replaced.
+            tr = ((~d0 & eq) << one) & previous_eq
+            previous_eq = eq
+        d0 = (((eq & pv) + pv) ^ pv) | eq | mv
+        if transpositions:
+            d0 |= tr
+        ph = mv | (~(d0 | pv) & mask)
+        mh = pv & d0
+        up = (ph & last) != 0
+        score += up
+        score -= ~up & ((mh & last) != 0)
+        ph = ((ph << one) | one) & mask
+        mh = (mh << one) & mask
+        pv = mh | (~(d0 | ph) & mask)
+        mv = ph & d0
+        done = np.flatnonzero(la == i + 1)
+        if done.size:
+            result[done] = score[done]
+    return result.tolist()
+
+
+def levenshtein_many(pairs, transpositions: bool = False) -> list[int]:
+    """utils.levenshtein_distance (with transpositions, utils.osa_distance) for every (a, b) in pairs, in order."""
+    scalar = osa_distance if transpositions else levenshtein_distance
+    pairs = [_trim_affixes(a, b) if len(a) >= len(b) else _trim_affixes(b, a) for a, b in pairs]
+    if np is None:
+        return [scalar(a, b) for a, b in pairs]
+    distances = [len(a) for a, _ in pairs]  # right for every empty shorter string
+    lanes = [k for k, (_, b) in enumerate(pairs) if 0 < len(b) <= _LANE_BITS]
+    for k, (a, b) in enumerate(pairs):
+        if len(b) > _LANE_BITS:
+            distances[k] = scalar(a, b)
+    lanes.sort(key=lambda k: len(pairs[k][0]))
+    for start in range(0, len(lanes), GROUP_SIZE):
+        group = lanes[start:start + GROUP_SIZE]
+        found = _group_distances([pairs[k][0] for k in group], [pairs[k][1] for k in group], transpositions)
+        for k, distance in zip(group, found):
+            distances[k] = distance
+    return distances
+
+
+def score_many(pairs, transpositions: bool = False) -> list[float]:
+    """scoring.EditDistance's score for every (solution, response) pair.
+
+    A response of None scores 0.0, as in the scalar path.
+    """
+    scores: list[float | None] = []
+    todo = []
+    for solution, response in pairs:
+        if response is None:
+            scores.append(0.0)
+            continue
+        user = normalize(response)
+        expected = normalize(solution)
+        if user == expected:
+            scores.append(1.0)
+        else:
+            todo.append((len(scores), user, expected))
+            scores.append(None)
+    distances = levenshtein_many([(user, expected) for _, user, expected in todo], transpositions)
+    for (k, user, expected), distance in zip(todo, distances):
+        max_length = max(len(user), len(expected))
+        scores[k] = max(0.0, 1.0 - (distance / max_length))
+    return scores
+
+
+def evaluate_many(problems, responses) -> list[float]:
+    """problem.evaluate_solution(response) for each pair, one score_many() call per scorer.
+
+    The default EditDistance scorer batches through score_many() above; other
+    scorers score their problems one by one unless they override score_many().
+    """
+    problems = list(problems)
+    responses = list(responses)
+    if len(problems) != len(responses):
+        raise ValueError("problems and responses must have the same length")
+    groups: dict[int, list[int]] = {}
+    for k, pb in enumerate(problems):
+        groups.setdefault(id(pb.scorer), []).append(k)
+    scores = [0.0] * len(problems)
+    for indexes in groups.values():
+        scorer = problems[indexes[0]].scorer
+        found = scorer.score_many([problems[k] for k in indexes], [responses[k] for k in indexes])
+        for k, score in zip(indexes, found):
+            scores[k] = score
+    return scores
@@ -0,0 +1,321 @@
+"""Throughput and latency benchmarks for the problem generators."""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from offload import create_many, generation_pool, is_free_threaded
+from problems import create_problems_dict
+from utils import _levenshtein_dp, distance_at_most, levenshtein_distance
+
+# (class, text compared): everyday answers, plus whole Metar and Road texts as
+# the long end, where the quadratic DP hurts most.
+DISTANCE_CASES = (
+    ('Number', 'solution'),
+    ('WordList', 'solution'),
+    ('FlightInfo', 'solution'),
+    ('Metar', 'memorize'),
+    ('Road', 'memorize'),
+)
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def _timing_stats(samples_ns: list[int]) -> dict:
+    """Summarize per-call timings (nanoseconds) as ops/sec and p50/p99 latency in microseconds."""
+    samples = sorted(samples_ns)
+    total_s = sum(samples) / 1e9
+    return {
+        'ops_per_sec': round(len(samples) / total_s, 1) if total_s > 0 else 0.0,
+        'p50_us': round(_percentile(samples, 0.50) / 1e3, 2),
+        'p99_us': round(_percentile(samples, 0.99) / 1e3, 2),
+    }
+
+
+def _peak_bytes_per_call(cls, iterations: int) -> int:
+    """Mean tracemalloc peak, in bytes above the traced baseline, of one create() + evaluate_solution() call."""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            pb = cls.create()
+            pb.evaluate_solution(pb.solution)
+            total += tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return int(total / iterations) if iterations else 0
+
+
+def benchmark_class(cls, iterations: int = 200, warmup: int = 5, peak_iterations: int | None = None) -> dict:
+    """Run cls.create() and evaluate_solution() `iterations` times and collect statistics."""
+    if iterations <= 0:
+        raise ValueError("iterations must be positive")
+    for _ in range(warmup):
+        pb = cls.create()
+        pb.evaluate_solution(pb.solution)
+
+    create_ns = []
+    evaluate_ns = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        t0 = clock()
+        pb = cls.create()
+        t1 = clock()
+        pb.evaluate_solution(pb.solution)
+        t2 = clock()
+        create_ns.append(t1 - t0)
+        evaluate_ns.append(t2 - t1)
+
+    if peak_iterations is None:
+        peak_iterations = min(iterations, 50)
+    return {
+        'name': cls.__name__,
+        'iterations': iterations,
+        'create': _timing_stats(create_ns),
+        'evaluate': _timing_stats(evaluate_ns),
+        'peak_bytes_per_call': _peak_bytes_per_call(cls, peak_iterations),
+    }
+
+
+def _selected_classes(only: list[str] | None) -> list:
+    classes = sorted(create_problems_dict(), key=lambda c: c.__name__)
+    if only:
+        wanted = set(only)
+        classes = [c for c in classes if c.__name__ in wanted]
+    return classes
+
+
+def run_benchmarks(iterations: int = 200, only: list[str] | None = None, seed: int | None = 0) -> dict:
+    """Benchmark every class from create_problems_dict() (or the ones named in `only`)."""
+    if seed is not None:
+        random.seed(seed)
+    classes = _selected_classes(only)
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'iterations': iterations,
+        'seed': seed,
+        'results': [benchmark_class(cls, iterations) for cls in classes],
+    }
+
+
+def run_scaling(worker_counts=(1, 2, 4, 8), per_worker: int = 200, only: list[str] | None = None) -> dict:
+    """Measure problems/sec per class as the generation pool grows.
+
+    Each worker creates `per_worker` problems per class, so perfect scaling
+    keeps wall time flat and multiplies throughput by the worker count.
+    """
+    if per_worker <= 0:
+        raise ValueError("per_worker must be positive")
+    classes = _selected_classes(only)
+    throughput: dict[str, dict[str, float]] = {cls.__name__: {} for cls in classes}
+    for workers in worker_counts:
+        with generation_pool(workers) as pool:
+            # Start every worker (and import problems there) before timing.
+            if classes:
+                list(pool.map(create_many, [classes[0]] * workers, [1] * workers))
+            for cls in classes:
+                t0 = time.perf_counter()
+                made = sum(pool.map(create_many, [cls] * workers, [per_worker] * workers))
+                elapsed = time.perf_counter() - t0
+                throughput[cls.__name__][str(workers)] = round(made / elapsed, 1) if elapsed > 0 else 0.0
+    return {
+        'python': platform.python_version(),
+        'free_threaded': is_free_threaded(),
+        'mode': 'threads' if is_free_threaded() else 'processes',
+        'workers': list(worker_counts),
+        'per_worker': per_worker,
+        'results': [{'name': name, 'problems_per_sec': rates} for name, rates in throughput.items()],
+    }
+
+
+def _mistype(text: str, rng: random.Random, rate: float = 0.1) -> str:
+    """text with about `rate` of its characters substituted, dropped or doubled."""
+    out = []
+    for char in text:
+        roll = rng.random()
+        if roll < rate / 3:
+            out.append(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789 '))
+        elif roll < 2 * rate / 3:
+            continue
+        elif roll < rate:
+            out.append(char * 2)
+        else:
+            out.append(char)
+    return ''.join(out)
+
+
+def _time_distance(fn, pairs: list) -> float:
+    """Mean microseconds per call of fn over pairs."""
+    t0 = time.perf_counter_ns()
+    for a, b in pairs:
+        fn(a, b)
+    return (time.perf_counter_ns() - t0) / len(pairs) / 1e3
+
+
+def run_distance_benchmark(iterations: int = 200, only: list[str] | None = None, seed: int | None = 0) -> dict:
+    """Time levenshtein_distance against the reference DP on generated answers.
+
+    Each pair is a generated text and a mistyped copy of it. Both
+    implementations must agree on every pair. distance_at_most() is timed
+    with the bound of the trainer's "close" threshold (score >= 0.7).
+    """
+    if iterations <= 0:
+        raise ValueError("iterations must be positive")
+    if seed is not None:
+        random.seed(seed)
+    rng = random.Random(seed)
+    classes = {cls.__name__: cls for cls in create_problems_dict()}
+    unknown = [name for name in only or () if name not in classes]
+    if unknown:
+        raise ValueError(f"unknown problem classes: {', '.join(unknown)}")
+    cases = [(name, field) for name, field in DISTANCE_CASES if not only or name in only]
+    cases += [(name, 'solution') for name in only or () if name not in dict(DISTANCE_CASES)]
+    results = []
+    for name, field in cases:
+        pairs = []
+        for _ in range(iterations):
+            text = getattr(classes[name].create(), field).lower()
+            pairs.append((_mistype(text, rng), text))
+        mismatches = sum(levenshtein_distance(a, b) != _levenshtein_dp(a, b) for a, b in pairs)
+        dp_us = _time_distance(_levenshtein_dp, pairs)
+        bit_us = _time_distance(levenshtein_distance, pairs)
+        bounded = [(a, b, int(0.3 * max(len(a), len(b)))) for a, b in pairs]
+        t0 = time.perf_counter_ns()
+        for a, b, k in bounded:
+            distance_at_most(a, b, k)
+        bounded_us = (time.perf_counter_ns() - t0) / len(bounded) / 1e3
+        results.append({
+            'name': name,
+            'text': field,
+            'mean_length': round(sum(len(b) for _, b in pairs) / len(pairs), 1),
+            'dp_us': round(dp_us, 2),
+            'bit_parallel_us': round(bit_us, 2),
+            'speedup': round(dp_us / bit_us, 1) if bit_us > 0 else 0.0,
+            'bounded_us': round(bounded_us, 2),
+            'mismatches': mismatches,
+        })
+    return {
+        'python': platform.python_version(),
+        'iterations': iterations,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def format_distance_report(report: dict) -> str:
+    """Format distance benchmark results, one row per answer source."""
+    results = report['results']
+    if not results:
+        return "No problem classes benchmarked."
+    width = max(len(r['name']) for r in results)
+    lines = [f"{'Answers':<{width}}  {'text':>9} {'length':>7} {'DP us':>10} {'bit us':>10} {'speedup':>8} {'bound us':>9} {'mismatch':>9}"]
+    for r in results:
+        lines.append(
+            f"{r['name']:<{width}}  {r['text']:>9} {r['mean_length']:>7.1f} {r['dp_us']:>10.1f} {r['bit_parallel_us']:>10.1f} "
+            f"{r['speedup']:>7.1f}x {r['bounded_us']:>9.1f} {r['mismatches']:>9d}"
+        )
+    return "\n".join(lines)
+
+
+def format_scaling_report(report: dict) -> str:
+    """Format scaling results: one row per class, one column per worker count."""
+    results = report['results']
+    if not results:
+        return "No problem classes benchmarked."
+    width = max(len(r['name']) for r in results)
+    counts = [str(w) for w in report['workers']]
+    lines = [f"Generation pool: {report['mode']} (free-threaded: {report['free_threaded']})",
+             f"{'Problem':<{width}}  " + " ".join(f"{w + ' w/s':>12}" for w in counts)]
+    for r in results:
+        lines.append(f"{r['name']:<{width}}  " + " ".join(f"{r['problems_per_sec'][w]:>12.0f}" for w in counts))
+    return "\n".join(lines)
+
+
+def format_report(report: dict) -> str:
+    """Format benchmark results as an aligned text table, slowest create() first."""
+    results = sorted(report['results'], key=lambda r: r['create']['ops_per_sec'])
+    if not results:
+        return "No problem classes benchmarked."
+    width = max(len(r['name']) for r in results)
+    lines = [
+        f"{'Problem':<{width}}  {'create/s':>10} {'p50 us':>9} {'p99 us':>9}  "
+        f"{'eval/s':>10} {'p50 us':>9} {'p99 us':>9}  {'peak B':>9}"
+    ]
+    for r in results:
+        c, e = r['create'], r['evaluate']
+        lines.append(
+            f"{r['name']:<{width}}  {c['ops_per_sec']:>10.0f} {c['p50_us']:>9.1f} {c['p99_us']:>9.1f}  "
+            f"{e['ops_per_sec']:>10.0f} {e['p50_us']:>9.1f} {e['p99_us']:>9.1f}  {r['peak_bytes_per_call']:>9d}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark problem generators")
+    parser.add_argument("-n", "--iterations", type=int, default=200, help="Calls per class (default: 200)")
+    parser.add_argument("--only", nargs="+", metavar="CLASS", help="Only benchmark these problem classes")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--json", metavar="PATH", help="Write machine-readable results to PATH")
+    parser.add_argument(
+        "--scaling",
+        metavar="COUNTS",
+        help="Measure generation-pool scaling for comma-separated worker counts (e.g. 1,2,4,8)",
+    )
+    parser.add_argument(
+        "--distance",
+        action="store_true",
+        help="Benchmark levenshtein_distance against the reference DP on generated answers",
+    )
+    args = parser.parse_args(argv)
+    known = {cls.__name__ for cls in create_problems_dict()}
+    unknown = [name for name in args.only or () if name not in known]
+    if unknown:
+        parser.error(f"unknown problem classes for --only: {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.iterations <= 0:
+        print("Error: Number of iterations must be positive", file=sys.stderr)
+        return 1
+    if args.scaling:
+        try:
+            counts = [int(c) for c in args.scaling.split(",")]
+        except ValueError:
+            counts = []
+        if not counts or min(counts) <= 0:
+            print("Error: --scaling expects positive comma-separated worker counts", file=sys.stderr)
+            return 1
+        report = run_scaling(counts, args.iterations, args.only)
+        print(format_scaling_report(report))
+    elif args.distance:
+        report = run_distance_benchmark(args.iterations, args.only, args.seed)
+        print(format_distance_report(report))
+    else:
+        report = run_benchmarks(args.iterations, args.only, args.seed)
+        print(format_report(report))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Square grids as integer bitboards.
+
+Cell (row, col) of a size x size grid is bit row * size + col, so a set of
+marked cells is one int: union, intersection and counting are single integer
+operations (&, |, int.bit_count) whatever the grid size. Cells are named like
+spreadsheet cells, column letter then row number ("A1", "C12"), so grids go
+up to 26 columns.
+
+Rows are rendered from a precomputed table of 8-cell row strings indexed by
+byte, one lookup per 8 columns.
+"""
+
+import random
+import re
+
+MAX_SIZE = 26
+MARK = 'X'
+EMPTY = '.'
+
+# _ROW_CHUNKS[b] renders 8 cells whose bits are b, least significant bit first.
+_ROW_CHUNKS = tuple(' '.join(MARK if b >> i & 1 else EMPTY for i in range(8)) for b in range(256))
+_CELL = re.compile(r'([A-Z])\s*(\d+)|(\d+)\s*([A-Z])')
+
+
+def _check_size(size: int) -> None:
+    if not 1 <= size <= MAX_SIZE:
+        raise ValueError(f"grid size must be between 1 and {MAX_SIZE}")
+
+
+def random_board(size: int, marks: int, rng=None) -> int:
+    """Bitboard with `marks` distinct random cells set."""
+    _check_size(size)
+    if not 0 <= marks <= size * size:
+        raise ValueError("marks must be between 0 and the number of cells")
+    board = 0
+    for bit in (rng or random).sample(range(size * size), marks):
+        board |= 1 << bit
+    return board
+
+
+def render(board: int, size: int) -> str:
+    """Grid as lines of 'X'/'.' separated by spaces, row 1 first."""
+    _check_size(size)
+    mask = (1 << size) - 1
+    width = 2 * size - 1
+    rows = []
+    for r in range(size):
+        bits = board >> (r * size) & mask
+        if size <= 8:
+            rows.append(_ROW_CHUNKS[bits][:width])
+        else:
+            rows.append(' '.join(_ROW_CHUNKS[bits >> shift & 0xFF] for shift in range(0, size, 8))[:width])
+    return '\n'.join(rows)
+
+
+def cell_names(board: int, size: int) -> list[str]:
+    """Names of the set cells in bit order (row by row, left to right)."""
+    names = []
+    while board:
+        low = board & -board
+        bit = low.bit_length() - 1
+        names.append(f"{chr(ord('A') + bit % size)}{bit // size + 1}")
+        board ^= low
+    return names
+
+
+def parse_cells(text: str, size: int) -> tuple[int, int]:
+    """Bitboard of the cells named in text ('A1 C3', '1a,3c', 'A 1') and the count of names off the grid."""
+    board = 0
+    off_grid = 0
+    for letter, row, row_first, letter_last in _CELL.findall(text.upper()):
+        col = ord(letter or letter_last) - ord('A')
+        r = int(row or row_first) - 1
+        if col < size and 0 <= r < size:
+            board |= 1 << (r * size + col)
+        else:
+            off_grid += 1
+    return board, off_grid
+
+
+def jaccard(a: int, b: int, extra: int = 0) -> float:
+    """|a & b| / (|a | b| + extra); 1.0 for two empty boards with no extra."""
+    union = (a | b).bit_count() + extra
+    if union == 0:
+        return 1.0
+    return (a & b).bit_count() / union
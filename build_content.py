@@ -0,0 +1,269 @@
+"""Validate the static content in dicts/ and compile it into content.py.
+
+The generators import content.py instead of parsing text files at runtime.
+Run this after editing any of the content files:
+
+    python build_content.py           # rewrite content.py
+    python build_content.py --check   # exit 1 if content.py is out of date
+
+Malformed content is refused with a file:line message; content.py is only
+written when every file validates.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent
+DICTS_DIR = _ROOT / 'dicts'
+OUTPUT = _ROOT / 'content.py'
+
+_FREQUENCY_SECTIONS = {
+    '# Approach frequencies': 'approach',
+    '# Tower frequencies': 'tower',
+    '# Ground frequencies': 'ground',
+}
+_AIRLINE_CODE = re.compile(r'[A-Z0-9]{2}')
+_VOR = re.compile(r'[A-Z0-9]{2,5}')
+_ICAO = re.compile(r'[A-Z]{4}')
+_RUNWAY = re.compile(r'(0[1-9]|[12][0-9]|3[0-6])[LCR]?')
+_FREQUENCY = re.compile(r'1[1-3]\d\.\d{1,3}')
+_FORMULA = re.compile(r'(?:[A-Z][a-z]?\d*|\(|\)\d*)+')
+_ELEMENT = re.compile(r'[A-Z][a-z]*')
+
+
+class ContentError(ValueError):
+    """A content file is missing or malformed."""
+
+    def __init__(self, path: Path, lineno: int | None, message: str):
+        where = f"{path.name}:{lineno}" if lineno else path.name
+        super().__init__(f"{where}: {message}")
+
+
+def _lines(path: Path):
+    """(line number, stripped line) for every non-blank line of path."""
+    if not path.exists():
+        raise ContentError(path, None, "file not found")
+    with open(path, encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if line:
+                yield lineno, line
+
+
+def _unique(path: Path, items, key=lambda item: item) -> tuple:
+    """Check that items (lineno, item) are non-empty and unique; return the items as a tuple."""
+    seen = {}
+    result = []
+    for lineno, item in items:
+        k = key(item)
+        if k in seen:
+            raise ContentError(path, lineno, f"duplicate entry {k!r} (first on line {seen[k]})")
+        seen[k] = lineno
+        result.append(item)
+    if not result:
+        raise ContentError(path, None, "no entries")
+    return tuple(result)
+
+
+def _matching(path: Path, pattern: re.Pattern, what: str) -> tuple:
+    def items():
+        for lineno, line in _lines(path):
+            if not pattern.fullmatch(line):
+                raise ContentError(path, lineno, f"not a valid {what}: {line!r}")
+            yield lineno, line
+    return _unique(path, items())
+
+
+def _pairs(path: Path, first: re.Pattern, what: str, check=None) -> tuple:
+    """Lines of the form 'KEY,Description' with KEY matching `first`.
+
+    check(key), if given, returns an error message for keys the pattern cannot reject.
+    """
+    def items():
+        for lineno, line in _lines(path):
+            key, sep, description = (part.strip() for part in line.partition(','))
+            if not sep or not description:
+                raise ContentError(path, lineno, f"expected '{what},description': {line!r}")
+            if not first.fullmatch(key):
+                raise ContentError(path, lineno, f"not a valid {what}: {key!r}")
+            error = check(key) if check else None
+            if error:
+                raise ContentError(path, lineno, error)
+            yield lineno, (key, description)
+    return _unique(path, items(), key=lambda pair: pair[0])
+
+
+def formula_elements(formula: str) -> tuple:
+    """Sorted distinct element symbols of a chemical formula."""
+    return tuple(sorted(set(_ELEMENT.findall(formula))))
+
+
+def read_airlines(path: Path) -> tuple:
+    return _pairs(path, _AIRLINE_CODE, "airline code")
+
+
+def read_lines(path: Path) -> tuple:
+    return _unique(path, _lines(path))
+
+
+def read_vors(path: Path) -> tuple:
+    return _matching(path, _VOR, "VOR identifier")
+
+
+def read_airports(path: Path) -> tuple:
+    return _matching(path, _ICAO, "ICAO airport code")
+
+
+def read_runways(path: Path) -> tuple:
+    return _matching(path, _RUNWAY, "runway designator")
+
+
+def read_frequencies(path: Path) -> dict:
+    """Frequencies per section ('approach', 'tower', 'ground'); every section must be present."""
+    sections: dict[str, list] = {}
+    current = None
+    for lineno, line in _lines(path):
+        if line.startswith('#'):
+            current = next((name for prefix, name in _FREQUENCY_SECTIONS.items() if line.startswith(prefix)), None)
+            if current is None:
+                raise ContentError(path, lineno, f"unknown section header: {line!r}")
+            if current in sections:
+                raise ContentError(path, lineno, f"section {current!r} appears twice")
+            sections[current] = []
+        elif current is None:
+            raise ContentError(path, lineno, "frequency before the first section header")
+        elif not _FREQUENCY.fullmatch(line):
+            raise ContentError(path, lineno, f"not a valid frequency: {line!r}")
+        elif line in sections[current]:
+            raise ContentError(path, lineno, f"duplicate frequency {line!r} in section {current!r}")
+        else:
+            sections[current].append(line)
+    for name in _FREQUENCY_SECTIONS.values():
+        if not sections.get(name):
+            raise ContentError(path, None, f"section {name!r} is missing or empty")
+    return {name: tuple(sections[name]) for name in _FREQUENCY_SECTIONS.values()}
+
+
+def read_tokyo_metro(path: Path) -> tuple:
+    """(line, line kanji, ((station, station kanji), ...)) per metro line.
+
+    A line header is 'English:Kanji' on its own; it is followed by one
+    comma-separated line of 'English:Kanji' stations (kanji may be omitted).
+    """
+    lines = []
+    names = {}
+    for lineno, line in _lines(path):
+        if ',' not in line and ':' in line:
+            english, kanji = (part.strip() for part in line.split(':', 1))
+            if not english or not kanji:
+                raise ContentError(path, lineno, f"expected 'Line:Kanji': {line!r}")
+            if english in names:
+                raise ContentError(path, lineno, f"duplicate line {english!r} (first on line {names[english]})")
+            names[english] = lineno
+            lines.append((english, kanji, []))
+        elif not lines:
+            raise ContentError(path, lineno, "stations before the first line header")
+        else:
+            for pair in line.split(','):
+                english, _, kanji = (part.strip() for part in pair.partition(':'))
+                if not english:
+                    raise ContentError(path, lineno, f"empty station name in {line!r}")
+                lines[-1][2].append((english, kanji or english))
+    for english, _, stations in lines:
+        if not stations:
+            raise ContentError(path, names[english], f"line {english!r} has no stations")
+    if not lines:
+        raise ContentError(path, None, "no entries")
+    return tuple((english, kanji, tuple(stations)) for english, kanji, stations in lines)
+
+
+def _unbalanced(formula: str) -> str | None:
+    depth = 0
+    for char in formula:
+        depth += {'(': 1, ')': -1}.get(char, 0)
+        if depth < 0:
+            break
+    return f"unbalanced parentheses in {formula!r}" if depth else None
+
+
+def read_formulas(path: Path) -> tuple:
+    """(formula, name, elements) per line; parentheses must balance."""
+    return tuple((formula, name, formula_elements(formula))
+                 for formula, name in _pairs(path, _FORMULA, "chemical formula", check=_unbalanced))
+
+
+def load_content(dicts_dir: Path | None = None) -> dict:
+    """Read and validate every content file; maps constant name to value."""
+    dicts_dir = dicts_dir or DICTS_DIR
+    airlines = read_airlines(dicts_dir / 'airlines.txt')
+    return {
+        'AIRLINES': airlines,
+        'AIRLINE_CODES': tuple(code for code, _ in airlines),
+        'CITIES': read_lines(dicts_dir / 'cities.txt'),
+        'VORS': read_vors(dicts_dir / 'vors.txt'),
+        'FREQUENCIES': read_frequencies(dicts_dir / 'frequencies.txt'),
+        'STREET_NAMES': read_lines(dicts_dir / 'street_names.txt'),
+        'TOKYO_METRO': read_tokyo_metro(dicts_dir / 'tokyo_metro.txt'),
+        'CHEMICAL_FORMULAS': read_formulas(dicts_dir / 'chemical_formulas.txt'),
+        'METAR_AIRPORTS': read_airports(dicts_dir / 'metar_airports.txt'),
+        'RUNWAYS': read_runways(dicts_dir / 'runways.txt'),
+        'APPOINTMENT_TYPES': read_lines(dicts_dir / 'appointment_types.txt'),
+    }
+
+
+def _format_value(value, indent: int = 0) -> str:
+    """repr(value), split one item per line wherever it would exceed 100 columns."""
+    text = repr(value)
+    if len(text) + indent <= 100 or not isinstance(value, (tuple, dict)):
+        return text
+    pad = " " * (indent + 4)
+    if isinstance(value, dict):
+        items = "".join(f"{pad}{k!r}: {_format_value(v, indent + 4)},\n" for k, v in value.items())
+        return "{\n" + items + " " * indent + "}"
+    items = "".join(f"{pad}{_format_value(item, indent + 4)},\n" for item in value)
+    return "(\n" + items + " " * indent + ")"
+
+
+def render(content: dict) -> str:
+    """Source text of content.py."""
+    parts = [
+        '"""Static problem content. Generated by build_content.py from dicts/; do not edit."""\n',
+        "\nfrom types import MappingProxyType\n",
+    ]
+    for name, value in content.items():
+        if isinstance(value, dict):
+            parts.append(f"\n{name} = MappingProxyType({_format_value(value)})\n")
+        else:
+            parts.append(f"\n{name} = {_format_value(value)}\n")
+    return "".join(parts)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Validate dicts/ content and generate content.py")
+    parser.add_argument("--check", action="store_true", help="Only check that content.py is up to date")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        source = render(load_content())
+    except ContentError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    current = OUTPUT.read_text(encoding='utf-8') if OUTPUT.exists() else None
+    if args.check:
+        if current != source:
+            print(f"Error: {OUTPUT.name} is out of date; run build_content.py", file=sys.stderr)
+            return 1
+        return 0
+    if current != source:
+        OUTPUT.write_text(source, encoding='utf-8')
+        print(f"Wrote {OUTPUT.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Any
-from unidecode import unidecode
 
-from utils import format_problem_name, levenshtein_distance
+from alignment import tokenize
+from scoring import EditDistance, normalize
+from similarity import classify_miss, miss_index, worst_miss
+from utils import format_problem_name
 
 
 @dataclass
@@ -14,6 +16,20 @@ class Problem:
   exposure_ms: int
   problem_type: str = ""  # matrix or single line
 
+  # Generators that are slow to create() set this to 'cpu' (run in a worker
+  # process) or 'io' (run in a worker thread) so offload.py can keep them off
+  # the interactive loop.
+  heavy = None
+  # False when create() depends on more than the random module (network,
+  # process-wide history), so the problem cannot be rebuilt from its seed.
+  reproducible = True
+  # How answers are scored (scoring.py). Subclasses declare their own scorer
+  # once; it is shared by every instance of the class.
+  scorer = EditDistance()
+  # True when answers are dictionary words, so wrong ones can be told apart
+  # as other real words or misspellings (classify_miss).
+  classify_misses = False
+
   def __post_init__(self) -> None:
     if not isinstance(self.name, str) or not self.name.strip():
       raise ValueError("name must be a non-empty, non-blank string")
@@ -27,6 +43,15 @@ class Problem:
       raise ValueError("exposure_ms must be a positive integer")
     if not isinstance(self.problem_type, str):
       raise TypeError("problem_type must be str")
+    # The solution side of scoring never changes, so it is computed once
+    # here: the normalized text plus whatever the class's scorer compiles.
+    self._normalized_solution = normalize(self.solution)
+    self._prepared = self.scorer.prepare(self)
+
+  @property
+  def normalized_solution(self) -> str:
+    """The solution as evaluate_solution compares it: stripped, lowercased, accent-folded."""
+    return self._normalized_solution
 
   @classmethod
   def display_name(cls) -> str:
@@ -41,31 +66,19 @@ class Problem:
     Evaluate how close the user's input is to the correct solution.
     Returns a score between 0.0 (no match) and 1.0 (perfect match).
     """
-    if user_input is None:
-      return 0.0
-
-    # Normalize both inputs using unidecode
-    normalized_user = unidecode(str(user_input).strip().lower())
-    normalized_solution = unidecode(self.solution.strip().lower())
-    
-    # Check for exact match first
-    if normalized_user == normalized_solution:
-      return 1.0
-    
-    # Calculate Levenshtein distance
-    distance = levenshtein_distance(normalized_user, normalized_solution)
-    
-    # Use the maximum length as the denominator to ensure score is between 0 and 1
-    max_length = max(len(normalized_user), len(normalized_solution))
-    
-    # Handle edge case where both strings are empty
-    if max_length == 0:
-      return 1.0
-    
-    # Calculate score: 1.0 for perfect match, approaching 0.0 for maximum distance
-    score = max(0.0, 1.0 - (distance / max_length))
-    
-    return score
+    return self.scorer.score(self, user_input)
+
+  def classify_miss(self, user_input):
+    """What kind of wrong word user_input holds (similarity.classify_miss), or None.
+
+    None for classes without classify_misses and for answers whose words are
+    all in the solution. A list answer gets the most telling label of its words.
+    """
+    if not self.classify_misses or user_input is None:
+      return None
+    expected = tokenize(self._normalized_solution)
+    index = miss_index(expected)
+    return worst_miss(classify_miss(word, expected, index) for word in tokenize(normalize(user_input)))
 
   def to_dict(self):
     return {
@@ -92,6 +105,7 @@ class Record:
     response: str
     response_ms: int
     score: float  # Score between 0.0 and 1.0
+    miss: str | None = None  # Problem.classify_miss() of a wrong answer
 
     def __post_init__(self) -> None:
         if not hasattr(self.problem, "to_dict"):
@@ -104,15 +118,22 @@ class Record:
             raise TypeError("score must be int or float")
         if not (0.0 <= self.score <= 1.0):
             raise ValueError("score must be between 0.0 and 1.0")
+        if self.miss is not None and not isinstance(self.miss, str):
+            raise TypeError("miss must be str or None")
 
     def to_dict(self):
-        return {
+        data = {
             'problem': self.problem.to_dict(),
             'response': self.response,
+        }
+        if self.miss is not None:
+            data['miss'] = self.miss
+        data.update({
             'response_ms': self.response_ms,
             'score': self.score,
             'correct': self.score >= 1.0  # Keep for backward compatibility
-        }
+        })
+        return data
 
     @property
     def correct(self):
@@ -0,0 +1,889 @@
+"""Static problem content. Generated by build_content.py from dicts/; do not edit."""
+
+from types import MappingProxyType
+
+AIRLINES = (
+    ('AA', 'American'),
+    ('AC', 'Air Canada'),
+    ('AF', 'Air France'),
+    ('AZ', 'Alitalia'),
+    ('BA', 'British Airways'),
+    ('CX', 'Cathay Pacific'),
+    ('DL', 'Delta'),
+    ('EK', 'Emirates'),
+    ('IB', 'Iberia'),
+    ('JL', 'Japan Airlines'),
+    ('KL', 'KLM'),
+    ('LH', 'Lufthansa'),
+    ('NH', 'ANA'),
+    ('QR', 'Qatar'),
+    ('SK', 'SAS'),
+    ('SQ', 'Singapore'),
+    ('TG', 'Thai Airways'),
+    ('TK', 'Turkish Airlines'),
+    ('UA', 'United'),
+    ('VS', 'Virgin Atlantic'),
+)
+
+AIRLINE_CODES = (
+    'AA',
+    'AC',
+    'AF',
+    'AZ',
+    'BA',
+    'CX',
+    'DL',
+    'EK',
+    'IB',
+    'JL',
+    'KL',
+    'LH',
+    'NH',
+    'QR',
+    'SK',
+    'SQ',
+    'TG',
+    'TK',
+    'UA',
+    'VS',
+)
+
+CITIES = (
+    'Adelaide',
+    'Amsterdam',
+    'Athens',
+    'Auckland',
+    'Bangkok',
+    'Barcelona',
+    'Beijing',
+    'Berlin',
+    'Bogotá',
+    'Brasília',
+    'Brisbane',
+    'Brussels',
+    'Budapest',
+    'Buenos Aires',
+    'Caracas',
+    'Cologne',
+    'Colombo',
+    'Copenhagen',
+    'Delhi',
+    'Dhaka',
+    'Dubai',
+    'Dublin',
+    'Edinburgh',
+    'Florence',
+    'Frankfurt',
+    'Guadalajara',
+    'Hamburg',
+    'Hanoi',
+    'Helsinki',
+    'Ho Chi Minh City',
+    'Hong Kong',
+    'Istanbul',
+    'Jakarta',
+    'Karachi',
+    'Kuala Lumpur',
+    'La Paz',
+    'Lima',
+    'Lisbon',
+    'London',
+    'Lyon',
+    'Madrid',
+    'Manchester',
+    'Manila',
+    'Medellín',
+    'Melbourne',
+    'Mexico City',
+    'Milan',
+    'Montevideo',
+    'Mumbai',
+    'Munich',
+    'Naples',
+    'New York',
+    'Nice',
+    'Osaka',
+    'Oslo',
+    'Panama City',
+    'Paris',
+    'Perth',
+    'Prague',
+    'Quito',
+    'Rio de Janeiro',
+    'Rome',
+    'San José',
+    'Santiago',
+    'Seoul',
+    'Shanghai',
+    'Singapore',
+    'Stockholm',
+    'Stuttgart',
+    'Sydney',
+    'São Paulo',
+    'Taipei',
+    'Tel Aviv',
+    'Tokyo',
+    'Venice',
+    'Vienna',
+    'Warsaw',
+    'Wellington',
+    'Zurich',
+)
+
+VORS = (
+    'JFK',
+    'LAX',
+    'ORD',
+    'ATL',
+    'DFW',
+    'DEN',
+    'SFO',
+    'LAS',
+    'MIA',
+    'BOS',
+    'PHX',
+    'IAD',
+    'MSP',
+    'DTW',
+    'PHL',
+    'SEA',
+    'CLT',
+    'IAH',
+    'MCO',
+    'EWR',
+    'BWI',
+    'SLC',
+    'MDW',
+    'FLL',
+    'PDX',
+    'HNL',
+    'STL',
+    'BNA',
+    'AUS',
+    'RDU',
+    'CLE',
+    'PIT',
+    'IND',
+    'CVG',
+    'MCI',
+    'MKE',
+    'RSW',
+    'JAX',
+    'CHS',
+    'GSP',
+    'LGA',
+    'DCA',
+    'BUR',
+    'OAK',
+    'SJC',
+    'SMF',
+    'SAC',
+    'ONT',
+    'SNA',
+    'LGB',
+    'MEM',
+    'TUL',
+    'OKC',
+    'ABQ',
+    'ELP',
+    'SAT',
+    'HOU',
+    'MSY',
+    'TPA',
+    'SAV',
+    'RIC',
+    'ORF',
+    'PHF',
+    'ROA',
+    'CRW',
+    'BLF',
+    'CKB',
+    'LWB',
+    'BKW',
+    'EKN',
+    'PKB',
+    'HTS',
+)
+
+FREQUENCIES = MappingProxyType({
+    'approach': (
+        '118.1',
+        '118.3',
+        '118.5',
+        '118.7',
+        '118.9',
+        '119.1',
+        '119.3',
+        '119.5',
+        '119.7',
+        '119.9',
+        '120.1',
+        '120.3',
+        '120.5',
+        '120.7',
+        '120.9',
+        '121.1',
+        '121.3',
+        '121.5',
+        '121.7',
+        '121.9',
+        '122.1',
+        '122.3',
+        '122.5',
+        '122.7',
+        '122.9',
+        '123.1',
+        '123.3',
+        '123.5',
+        '123.7',
+        '123.9',
+        '124.1',
+        '124.3',
+        '124.5',
+        '124.7',
+        '124.9',
+        '125.1',
+        '125.3',
+        '125.5',
+        '125.7',
+        '125.9',
+        '126.1',
+        '126.3',
+        '126.5',
+        '126.7',
+        '126.9',
+        '127.1',
+        '127.3',
+        '127.5',
+        '127.7',
+        '127.9',
+    ),
+    'tower': (
+        '118.0',
+        '118.2',
+        '118.4',
+        '118.6',
+        '118.8',
+        '119.0',
+        '119.2',
+        '119.4',
+        '119.6',
+        '119.8',
+        '120.0',
+        '120.2',
+        '120.4',
+        '120.6',
+        '120.8',
+        '121.0',
+        '121.2',
+        '121.4',
+        '121.6',
+        '121.8',
+        '122.0',
+        '122.2',
+        '122.4',
+        '122.6',
+        '122.8',
+        '123.0',
+        '123.2',
+        '123.4',
+        '123.6',
+        '123.8',
+        '124.0',
+        '124.2',
+        '124.4',
+        '124.6',
+        '124.8',
+        '125.0',
+        '125.2',
+        '125.4',
+        '125.6',
+        '125.8',
+        '126.0',
+        '126.2',
+        '126.4',
+        '126.6',
+        '126.8',
+        '127.0',
+        '127.2',
+        '127.4',
+        '127.6',
+        '127.8',
+    ),
+    'ground': (
+        '121.6',
+        '121.7',
+        '121.8',
+        '121.9',
+        '122.0',
+        '122.1',
+        '122.2',
+        '122.3',
+        '122.4',
+        '122.5',
+        '122.6',
+        '122.7',
+        '122.8',
+        '122.9',
+        '123.0',
+        '123.1',
+        '123.2',
+        '123.3',
+        '123.4',
+        '123.5',
+        '123.6',
+        '123.7',
+        '123.8',
+        '123.9',
+        '124.0',
+        '124.1',
+        '124.2',
+        '124.3',
+        '124.4',
+        '124.5',
+        '124.6',
+        '124.7',
+        '124.8',
+        '124.9',
+        '125.0',
+        '125.1',
+        '125.2',
+        '125.3',
+        '125.4',
+        '125.5',
+        '125.6',
+        '125.7',
+        '125.8',
+        '125.9',
+        '126.0',
+        '126.1',
+        '126.2',
+        '126.3',
+        '126.4',
+        '126.5',
+    ),
+})
+
+STREET_NAMES = (
+    'Abbey Road',
+    'Abc Street',
+    'Avenida 9 de Julio',
+    'Avenida Paulista',
+    'Avinguda Diagonal',
+    'Baker Street',
+    'Beale Street',
+    'Bleecker Street',
+    'Bourbon Street',
+    'Bowery',
+    'Broadway',
+    'Calle Florida',
+    'Canal Street',
+    'Carnaby Street',
+    'Champs-Élysées',
+    'Christopher Street',
+    'Clerkenwell Road',
+    'Collins Avenue',
+    'Copacabana',
+    'Damrak',
+    'Dlouha',
+    'Dotonbori',
+    'E Street',
+    'Elm Street',
+    'Fifth Avenue',
+    'Fleet Street',
+    'Ginza',
+    'Graben',
+    'Gran Vía',
+    'Haight-Ashbury',
+    'Hohe Strasse',
+    'Hollywood Boulevard',
+    'Istedgade',
+    'Jalan Alor',
+    'József körút',
+    'Kalakaua Avenue',
+    'Karl Johans gate',
+    'Kauppatori',
+    'Khao San Road',
+    'Kloof Street',
+    'Koningstraat',
+    'Kurdamm',
+    'Königsallee',
+    'La Rambla',
+    'Las Vegas Boulevard',
+    'Laugavegur',
+    'Lijnbaan',
+    'Lombard Street',
+    'Luigi Einaudi',
+    'Madero Street',
+    'Main Street',
+    'Mariahilfer Strasse',
+    'Marienplatz',
+    'Market Street',
+    'Melrose Avenue',
+    'Michigan Avenue',
+    'Nassau Street',
+    'Nathan Road',
+    'Nevsky Prospekt',
+    'New Bond Street',
+    'Nishi-Azabu',
+    'North Terrace',
+    'Nuevos Ministerios',
+    "O'Connell Street",
+    'Ocean Drive',
+    'Old Compton Street',
+    'Orchard Road',
+    'Oxford Street',
+    'Paseo de la Reforma',
+    'Passeig de Gràcia',
+    'Penny Lane',
+    'Piazza del Campo',
+    'Pico Boulevard',
+    'Ponte Vecchio',
+    'Portobello Road',
+    'Potsdamer Platz',
+    'Princes Street',
+    'Pulteney Bridge',
+    'Quay Street',
+    'Queen Street',
+    'Red Square',
+    'Regent Street',
+    'Ringstrasse',
+    'Rodeo Drive',
+    'Royal Mile',
+    'Rue Mouffetard',
+    'Rue Saint-Denis',
+    'Rue Saint-Honoré',
+    'Rue Saint-Paul',
+    'Rue de Rivoli',
+    'Rue du Faubourg Saint-Honoré',
+    'Rundle Mall',
+    'Santa Fe Avenue',
+    'Santa Monica Boulevard',
+    'Sauchiehall Street',
+    'Savile Row',
+    'Scheveningen',
+    'Shibuya Crossing',
+    'Shinsaibashi',
+    'Sixth Street',
+    'SoHo',
+    'South Bank',
+    'South Street Seaport',
+    'Spaccanapoli',
+    'Spui',
+    'St. Charles Avenue',
+    "St. George's Mall",
+    'St. Laurent Boulevard',
+    'St. Louis Cemetery',
+    'Storgata',
+    'Stroget',
+    'Strøget',
+    'Sunset Boulevard',
+    'Södermalm',
+    'Takeshita Street',
+    'Temple Bar',
+    'The Embarcadero',
+    'The Gorbals',
+    'The Magnificent Mile',
+    'The Marais',
+    'The Mission',
+    'The Rocks',
+    'The Strand',
+    'Times Square',
+    'Tkalciceva Street',
+    'Tverskaya Street',
+    'Union Square',
+    'Utrechtsestraat',
+    'Venice Beach Boardwalk',
+    'Via Appia',
+    'Via Dolorosa',
+    'Via Montenapoleone',
+    'Victoria Street',
+    'Vieux Port',
+    'Vine Street',
+    'Váci utca',
+    'Wacker Drive',
+    'Wall Street',
+    'Wenceslas Square',
+    'West End',
+    'Whitechapel',
+    'Yonge Street',
+    'Yorkville',
+    'Yuyuan Gardens',
+    'Zeil',
+    "Zürich's Bahnhofstrasse",
+)
+
+TOKYO_METRO = (
+    (
+        'Ginza',
+        '銀座線',
+        (
+            ('Asakusa', '浅草'),
+            ('Tawaramachi', '田原町'),
+            ('Inaricho', '稲荷町'),
+            ('Ueno', '上野'),
+            ('Ueno-hirokoji', '上野広小路'),
+            ('Suehirocho', '末広町'),
+            ('Kanda', '神田'),
+            ('Mitsukoshimae', '三越前'),
+            ('Nihombashi', '日本橋'),
+            ('Kyoboshi', '京橋'),
+            ('Ginza', '銀座'),
+            ('Shimbashi', '新橋'),
+            ('Toranomon', '虎ノ門'),
+            ('Tameike-sanno', '溜池山王'),
+            ('Akasaka-mitsuke', '赤坂見附'),
+            ('Aoyama-itchome', '青山一丁目'),
+            ('Gaiemmae', '外苑前'),
+            ('Omotesando', '表参道'),
+            ('Shibuya', '渋谷'),
+        ),
+    ),
+    (
+        'Marunouchi',
+        '丸ノ内線',
+        (
+            ('Ogikubo', '荻窪'),
+            ('Minami-asagaya', '南阿佐ヶ谷'),
+            ('Shin-koenji', '新高円寺'),
+            ('Higashi-koenji', '東高円寺'),
+            ('Shin-nakano', '新中野'),
+            ('Nakano-sakaue', '中野坂上'),
+            ('Nishi-shinjuku', '西新宿'),
+            ('Shinjuku', '新宿'),
+            ('Shinjuku-sanchome', '新宿三丁目'),
+            ('Shinjuku-gyoemmae', '新宿御苑前'),
+            ('Yotsuya-sanchome', '四ツ谷三丁目'),
+            ('Yotsuya', '四ツ谷'),
+            ('Akasaka-mitsuke', '赤坂見附'),
+            ('Kokkai-gijidomae', '国会議事堂前'),
+            ('Kasumigaseki', '霞ヶ関'),
+            ('Ginza', '銀座'),
+            ('Tokyo', '東京'),
+            ('Otemachi', '大手町'),
+            ('Awajicho', '淡路町'),
+            ('Ochanomizu', 'お茶の水'),
+            ('Hongosanchome', '本郷三丁目'),
+            ('Korakuen', '後楽園'),
+            ('Myogadani', '茗荷谷'),
+            ('Shin-otsuka', '新大塚'),
+            ('Ikebukuro', '池袋'),
+            ('Honancho', '方南町'),
+            ('Nakano-shimbashi', '中野新橋'),
+        ),
+    ),
+    (
+        'Hibiya',
+        '日比谷線',
+        (
+            ('Naka-meguro', '中目黒'),
+            ('Ebisu', '恵比寿'),
+            ('Hiroo', '広尾'),
+            ('Roppongi', '六本木'),
+            ('Kamiyacho', '神谷町'),
+            ('Kasumigaseki', '霞ヶ関'),
+            ('Hibiya', '日比谷'),
+            ('Ginza', '銀座'),
+            ('Higashi-ginza', '東銀座'),
+            ('Tsukiji', '築地'),
+            ('Hatchobori', '八丁堀'),
+            ('Kayabacho', '茅場町'),
+            ('Ningyocho', '人形町'),
+            ('Kodemmacho', '小伝馬町'),
+            ('Akihabara', '秋葉原'),
+            ('Naka-okachimachi', '仲御徒町'),
+            ('Ueno', '上野'),
+            ('Iriya', '入谷'),
+            ('Minowa', '三ノ輪'),
+            ('Minami-senju', '南千住'),
+            ('Kita-senju', '北千住'),
+        ),
+    ),
+    (
+        'Tozai',
+        '東西線',
+        (
+            ('Nakano', '中野'),
+            ('Ochiai', '落合'),
+            ('Takadanobaba', '高田馬場'),
+            ('Waseda', '早稲田'),
+            ('Kagurazaka', '神楽坂'),
+            ('Iidabashi', '飯田橋'),
+            ('Kudanshita', '九段下'),
+            ('Takebashi', '竹橋'),
+            ('Otemachi', '大手町'),
+            ('Nihombashi', '日本橋'),
+            ('Kayabacho', '茅場町'),
+            ('Monzen-nakacho', '門前仲町'),
+            ('Kiba', '木場'),
+            ('Toyosu', '豊洲'),
+            ('Minami-sunamachi', '南砂町'),
+            ('Nishi-kasai', '西葛西'),
+            ('Kasai', '葛西'),
+            ('Minami-gyotoku', '南行徳'),
+            ('Gyotoku', '行徳'),
+            ('Myoden', '妙典'),
+            ('Baraki-nakayama', '原木中山'),
+            ('Nishi-funabashi', '西船橋'),
+        ),
+    ),
+    (
+        'Chiyoda',
+        '千代田線',
+        (
+            ('Ayase', '綾瀬'),
+            ('Kita-ayase', '北綾瀬'),
+            ('Machiya', '町屋'),
+            ('Kita-senju', '北千住'),
+            ('Sendagi', '千駄木'),
+            ('Nippori', '日暮里'),
+            ('Nishi-nippori', '西日暮里'),
+            ('Todaimae', '東大前'),
+            ('Yushima', '湯島'),
+            ('Shin-ochanomizu', '新御茶ノ水'),
+            ('Otemachi', '大手町'),
+            ('Nijubashimae', '二重橋前'),
+            ('Hibiya', '日比谷'),
+            ('Akasaka', '赤坂'),
+            ('Kokkai-gijidomae', '国会議事堂前'),
+            ('Omotesando', '表参道'),
+            ('Meiji-jingumae', '明治神宮前'),
+        ),
+    ),
+    (
+        'Yurakucho',
+        '有楽町線',
+        (
+            ('Wakoshi', '和光市'),
+            ('Chikatetsu-narimasu', '地下鉄成増'),
+            ('Chikatetsu-akatsuka', '地下鉄赤塚'),
+            ('Heiwadai', '平和台'),
+            ('Hikawadai', '氷川台'),
+            ('Kotake-mukaihara', '小竹向原'),
+            ('Senkawa', '千川'),
+            ('Kanamecho', '要町'),
+            ('Ikebukuro', '池袋'),
+            ('Higashi-ikebukuro', '東池袋'),
+            ('Gokokuji', '護国寺'),
+            ('Edogawabashi', '江戸川橋'),
+            ('Iidabashi', '飯田橋'),
+            ('Ichigaya', '市ヶ谷'),
+            ('Kojimachi', '麹町'),
+            ('Nagatacho', '永田町'),
+            ('Sakuradamon', '桜田門'),
+            ('Yurakucho', '有楽町'),
+            ('Ginza-itchome', '銀座一丁目'),
+            ('Shimbashi', '新橋'),
+            ('Toyosu', '豊洲'),
+            ('Tsukishima', '月島'),
+            ('Shintomicho', '新富町'),
+            ('Tatsumi', '辰巳'),
+        ),
+    ),
+    (
+        'Hanzomon',
+        '半蔵門線',
+        (
+            ('Shibuya', '渋谷'),
+            ('Omotesando', '表参道'),
+            ('Aoyama-itchome', '青山一丁目'),
+            ('Nagatacho', '永田町'),
+            ('Hanzomon', '半蔵門'),
+            ('Kudanshita', '九段下'),
+            ('Jimbocho', '神保町'),
+            ('Otemachi', '大手町'),
+            ('Mitsukoshimae', '三越前'),
+            ('Suitengumae', '水天宮前'),
+            ('Kiyosumi-shirakawa', '清澄白河'),
+            ('Sumiyoshi', '住吉'),
+            ('Kinshicho', '錦糸町'),
+            ('Oshiage', '押上'),
+        ),
+    ),
+    (
+        'Namboku',
+        '南北線',
+        (
+            ('Akabane-iwabuchi', '赤羽岩淵'),
+            ('Shimo', '志茂'),
+            ('Komagome', '駒込'),
+            ('Nishigahara', '西ヶ原'),
+            ('Oji', '王子'),
+            ('Oji-kamiya', '王子神谷'),
+            ('Todaimae', '東大前'),
+            ('Hon-komagome', '本駒込'),
+            ('Korakuen', '後楽園'),
+            ('Kasuga', '春日'),
+            ('Iidabashi', '飯田橋'),
+            ('Ichigaya', '市ヶ谷'),
+            ('Yotsuya', '四ツ谷'),
+            ('Nagatacho', '永田町'),
+            ('Tameike-sanno', '溜池山王'),
+            ('Roppongi-itchome', '六本木一丁目'),
+            ('Azabu-juban', '麻布十番'),
+            ('Shirokanedai', '白金台'),
+            ('Shirokane-takanawa', '白金高輪'),
+            ('Meguro', '目黒'),
+        ),
+    ),
+    (
+        'Fukutoshin',
+        '副都心線',
+        (
+            ('Wakoshi', '和光市'),
+            ('Chikatetsu-narimasu', '地下鉄成増'),
+            ('Chikatetsu-akatsuka', '地下鉄赤塚'),
+            ('Heiwadai', '平和台'),
+            ('Hikawadai', '氷川台'),
+            ('Kotake-mukaihara', '小竹向原'),
+            ('Ikebukuro', '池袋'),
+            ('Zoshigaya', '雑司ヶ谷'),
+            ('Nishi-waseda', '西早稲田'),
+            ('Higashi-shinjuku', '東新宿'),
+            ('Shinjuku-sanchome', '新宿三丁目'),
+            ('Kitasando', '北参道'),
+            ('Meiji-jingumae', '明治神宮前'),
+            ('Shibuya', '渋谷'),
+        ),
+    ),
+)
+
+CHEMICAL_FORMULAS = (
+    ('H2O', 'Water', ('H', 'O')),
+    ('CO2', 'Carbon Dioxide', ('C', 'O')),
+    ('NaCl', 'Sodium Chloride', ('Cl', 'Na')),
+    ('H2SO4', 'Sulfuric Acid', ('H', 'O', 'S')),
+    ('NaOH', 'Sodium Hydroxide', ('H', 'Na', 'O')),
+    ('HCl', 'Hydrochloric Acid', ('Cl', 'H')),
+    ('NH3', 'Ammonia', ('H', 'N')),
+    ('CH4', 'Methane', ('C', 'H')),
+    ('C6H12O6', 'Glucose', ('C', 'H', 'O')),
+    ('CaCO3', 'Calcium Carbonate', ('C', 'Ca', 'O')),
+    ('Fe2O3', 'Iron Oxide', ('Fe', 'O')),
+    ('Al2O3', 'Aluminum Oxide', ('Al', 'O')),
+    ('HNO3', 'Nitric Acid', ('H', 'N', 'O')),
+    ('H3PO4', 'Phosphoric Acid', ('H', 'O', 'P')),
+    ('KOH', 'Potassium Hydroxide', ('H', 'K', 'O')),
+    ('MgO', 'Magnesium Oxide', ('Mg', 'O')),
+    ('CuSO4', 'Copper Sulfate', ('Cu', 'O', 'S')),
+    ('AgNO3', 'Silver Nitrate', ('Ag', 'N', 'O')),
+    ('ZnCl2', 'Zinc Chloride', ('Cl', 'Zn')),
+    ('Pb(NO3)2', 'Lead Nitrate', ('N', 'O', 'Pb')),
+    ('FeCl3', 'Iron Chloride', ('Cl', 'Fe')),
+    ('CaCl2', 'Calcium Chloride', ('Ca', 'Cl')),
+    ('Na2CO3', 'Sodium Carbonate', ('C', 'Na', 'O')),
+    ('K2CO3', 'Potassium Carbonate', ('C', 'K', 'O')),
+    ('LiOH', 'Lithium Hydroxide', ('H', 'Li', 'O')),
+    ('BaSO4', 'Barium Sulfate', ('Ba', 'O', 'S')),
+    ('SrCl2', 'Strontium Chloride', ('Cl', 'Sr')),
+    ('CsF', 'Cesium Fluoride', ('Cs', 'F')),
+    ('RbBr', 'Rubidium Bromide', ('Br', 'Rb')),
+)
+
+METAR_AIRPORTS = (
+    'KJFK',
+    'KLAX',
+    'KORD',
+    'KATL',
+    'KDEN',
+    'KDFW',
+    'KSEA',
+    'KLAS',
+    'KMIA',
+    'KBOS',
+    'KPHX',
+    'KSFO',
+    'KIAD',
+    'KMSP',
+    'KDTW',
+    'KPHL',
+    'EGLL',
+    'LFPG',
+    'EDDF',
+    'EHAM',
+    'LIRF',
+    'LEMD',
+    'LOWW',
+    'ESSA',
+    'RJTT',
+    'VHHH',
+    'WSSS',
+    'YSSY',
+    'NZAA',
+    'OMDB',
+    'OTHH',
+    'RKSI',
+    'CYYZ',
+    'CYVR',
+    'SBGR',
+    'SAEZ',
+    'FACT',
+    'HECA',
+    'VIDP',
+    'UUEE',
+)
+
+RUNWAYS = (
+    '09L',
+    '09R',
+    '27L',
+    '27R',
+    '04L',
+    '04R',
+    '22L',
+    '22R',
+    '01L',
+    '01R',
+    '19L',
+    '19R',
+    '16L',
+    '16R',
+    '34L',
+    '34R',
+    '08L',
+    '26R',
+    '06R',
+    '24L',
+    '12L',
+    '30R',
+    '15L',
+    '33R',
+    '03L',
+    '21R',
+    '05L',
+    '23R',
+    '07L',
+    '25R',
+    '10L',
+    '28R',
+    '13L',
+    '31R',
+)
+
+APPOINTMENT_TYPES = (
+    'Doctor',
+    'Dentist',
+    'Plumber',
+    'Car repair',
+    'Electrician',
+    'Hair',
+    'Vet',
+    'Lawyer',
+    'Accountant',
+    'Mechanic',
+    'Eye exam',
+    'PT',
+    'Massage',
+    'Interview',
+    'Bank',
+    'Grocery',
+    'Insurance',
+    'Tax',
+    'Computer',
+    'Inspection',
+    'Cleaning',
+    'Piano',
+    'Tutoring',
+    'Chiropractor',
+    'Orthodontist',
+)
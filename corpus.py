@@ -0,0 +1,280 @@
+"""Golden corpus of real (solution, response) pairs for checking the scorers.
+
+    python corpus.py build                    # old/records.txt + session history
+    python corpus.py check                    # speed and stability vs. the golden scores
+    python corpus.py check --accept           # after an intended scoring change
+
+The corpus is built from the answers actually typed: old/records.txt from
+the first trainer and the sessions file. It keeps one row per distinct
+(problem, response) pair, as a JSON list of FIELDS per line, optionally
+gzipped. The last field is the score when the corpus was built or last
+accepted.
+
+check rescores every row with the current scorer of its problem type and
+reports pairs/sec per scorer and every score that moved. It also serves as
+the gate for edit-distance implementations: on every pair, the distance
+functions must agree with their reference DP. check exits with status 1 if
+any score changed or any distance disagrees.
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from batch_scoring import evaluate_many, levenshtein_many
+from classes import Problem
+from normalize import normalize
+from rescore import _lines, _rebuild
+from scoring import problem_class
+from sessions import _SESSIONS_FILE
+from utils import _levenshtein_dp, _osa_dp, distance_at_most, levenshtein_distance, osa_distance
+
+FIELDS = ('name', 'memorize', 'prompt', 'solution', 'response', 'score')
+
+_DIR = Path(__file__).resolve().parent
+RECORDS_FILE = _DIR / 'old' / 'records.txt'
+CORPUS_FILE = _DIR / 'test' / 'scoring_corpus.jsonl'
+
+# Problem types of the first trainer and the classes that replaced them.
+_OLD_TYPES = {
+    'calculus': 'NumberCalculate',
+    'long number': 'NumberLong',
+    'number list': 'NumberList',
+    'random word': 'RandomLetters',
+    'short number': 'Number',
+    'word list': 'WordList',
+    'word pairs': 'WordPairs',
+    'word reverse': 'WordBackward',
+    'word scramble': 'WordForward',
+}
+# The first trainer wrote records back to back, with no separator.
+_OLD_RECORD = re.compile(
+    r'type=(?P<type>.*?), memorize=(?P<memorize>.*?) prompt=(?P<prompt>.*?) solution=(?P<solution>.*?) '
+    r'exposure_ms=\d+ response=(?P<response>.*?), response_ms=\d+, correct=(?:True|False)'
+)
+
+
+def _problem(name, memorize, prompt, solution):
+    """Problem of the current class for name, or None if the fields do not make a valid one."""
+    cls = problem_class(name) or Problem
+    try:
+        return cls(name, memorize, prompt, solution, 1000)
+    except (TypeError, ValueError):
+        return None
+
+
+def pairs_from_records(path=RECORDS_FILE):
+    """(name, memorize, prompt, solution, response) for each answer in old/records.txt."""
+    text = Path(path).read_text(encoding='utf-8')
+    for match in _OLD_RECORD.finditer(text):
+        cls = problem_class(_OLD_TYPES.get(match['type'], ''))
+        name = cls.display_name() if cls is not None else match['type']
+        yield name, match['memorize'], match['prompt'], match['solution'], match['response']
+
+
+def pairs_from_sessions(path=_SESSIONS_FILE):
+    """(name, memorize, prompt, solution, response) for each record of a sessions file."""
+    with open(path, 'rb') as file:
+        for line in _lines(file):
+            for record in json.loads(line).get('records', []):
+                problem = _rebuild(record.get('problem') or {})
+                if problem is not None and isinstance(record.get('response'), str):
+                    yield problem.name, problem.memorize, problem.prompt, problem.solution, record['response']
+
+
+def build_rows(pairs) -> list[list]:
+    """Distinct pairs with their current score; pairs that do not make a valid problem are dropped."""
+    seen = set()
+    problems, rows = [], []
+    for pair in pairs:
+        pair = tuple(pair)
+        if pair in seen:
+            continue
+        seen.add(pair)
+        problem = _problem(*pair[:4])
+        if problem is not None:
+            problems.append(problem)
+            rows.append(list(pair))
+    for row, score in zip(rows, evaluate_many(problems, [row[4] for row in rows])):
+        row.append(score)
+    return rows
+
+
+def write_corpus(rows, path=CORPUS_FILE) -> None:
+    """One JSON list per line; gzipped when path ends in .gz or .gzip."""
+    path = Path(path)
+    text = ''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix in ('.gz', '.gzip'):
+        path.write_bytes(gzip.compress(text.encode('utf-8'), compresslevel=9))
+    else:
+        path.write_text(text, encoding='utf-8')
+
+
+def read_corpus(path=CORPUS_FILE) -> list[list]:
+    with open(path, 'rb') as file:
+        return [json.loads(line) for line in _lines(file)]
+
+
+def _time(fn, items, repeat: int) -> float:
+    """Best seconds of `repeat` passes of fn over items."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for item in items:
+            fn(*item)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+def check_scores(rows, repeat: int = 3) -> dict:
+    """Rescore rows: pairs/sec per scorer and the rows whose score moved."""
+    problems = [_problem(*row[:4]) for row in rows]
+    groups: dict[str, list] = {}
+    changes = []
+    for row, problem in zip(rows, problems):
+        if problem is None:
+            changes.append({'row': row, 'score': None})
+            continue
+        groups.setdefault(repr(problem.scorer), []).append((problem, row[4]))
+        score = problem.evaluate_solution(row[4])
+        if score != row[5]:
+            changes.append({'row': row, 'score': score})
+    scorers = []
+    for name, items in sorted(groups.items()):
+        seconds = _time(lambda problem, response: problem.scorer.score(problem, response), items, repeat)
+        scorers.append({'scorer': name, 'pairs': len(items), 'pairs_per_sec': _rate(len(items), seconds)})
+    valid = [(problem, row[4]) for row, problem in zip(rows, problems) if problem is not None]
+    t0 = time.perf_counter()
+    evaluate_many([problem for problem, _ in valid], [response for _, response in valid])
+    batch_seconds = time.perf_counter() - t0
+    return {
+        'pairs': len(rows),
+        'scorers': scorers,
+        'batch_pairs_per_sec': _rate(len(valid), batch_seconds),
+        'changes': changes,
+    }
+
+
+def check_distances(rows, repeat: int = 3) -> dict:
+    """Every distance implementation against its reference DP on the normalized pairs."""
+    pairs = [(normalize(row[4]), normalize(row[3])) for row in rows]
+    expected = [_levenshtein_dp(a, b) for a, b in pairs]
+    mismatches = []
+    for (a, b), d in zip(pairs, expected):
+        if levenshtein_distance(a, b) != d:
+            mismatches.append({'function': 'levenshtein_distance', 'pair': [a, b], 'expected': d})
+        if distance_at_most(a, b, d) != d or (d > 0 and distance_at_most(a, b, d - 1) is not None):
+            mismatches.append({'function': 'distance_at_most', 'pair': [a, b], 'expected': d})
+    for (a, b), d, found in zip(pairs, expected, levenshtein_many(pairs)):
+        if found != d:
+            mismatches.append({'function': 'levenshtein_many', 'pair': [a, b], 'expected': d})
+    expected_osa = [_osa_dp(a, b) for a, b in pairs]
+    for (a, b), d, found in zip(pairs, expected_osa, levenshtein_many(pairs, transpositions=True)):
+        if osa_distance(a, b) != d:
+            mismatches.append({'function': 'osa_distance', 'pair': [a, b], 'expected': d})
+        if found != d:
+            mismatches.append({'function': 'levenshtein_many(transpositions=True)', 'pair': [a, b], 'expected': d})
+    bounded = [(a, b, int(0.3 * max(len(a), len(b)))) for a, b in pairs]
+    t0 = time.perf_counter()
+    levenshtein_many(pairs)
+    many_seconds = time.perf_counter() - t0
+    return {
+        'pairs': len(pairs),
+        'pairs_per_sec': {
+            'dp': _rate(len(pairs), _time(_levenshtein_dp, pairs, repeat)),
+            'levenshtein_distance': _rate(len(pairs), _time(levenshtein_distance, pairs, repeat)),
+            'distance_at_most': _rate(len(pairs), _time(distance_at_most, bounded, repeat)),
+            'levenshtein_many': _rate(len(pairs), many_seconds),
+            'osa_distance': _rate(len(pairs), _time(osa_distance, pairs, repeat)),
+        },
+        'mismatches': mismatches,
+    }
+
+
+def format_check(scores: dict, distances: dict) -> str:
+    lines = [f"{scores['pairs']} pairs"]
+    width = max([len(s['scorer']) for s in scores['scorers']] + [len('Scorer')])
+    lines.append(f"{'Scorer':<{width}}  {'pairs':>6} {'pairs/s':>10}")
+    for s in scores['scorers']:
+        lines.append(f"{s['scorer']:<{width}}  {s['pairs']:>6d} {s['pairs_per_sec']:>10.0f}")
+    lines.append(f"{'evaluate_many':<{width}}  {scores['pairs']:>6d} {scores['batch_pairs_per_sec']:>10.0f}")
+    lines.append("")
+    for name, rate in distances['pairs_per_sec'].items():
+        lines.append(f"{name:<{width}}  {distances['pairs']:>6d} {rate:>10.0f}")
+    lines.append("")
+    if not scores['changes']:
+        lines.append("Scores: all match the corpus.")
+    for change in scores['changes']:
+        name, _, _, solution, response, golden = change['row']
+        lines.append(f"  CHANGED {name}: {solution!r} <- {response!r}: {golden!r} -> {change['score']!r}")
+    if not distances['mismatches']:
+        lines.append("Distances: all agree with their reference DP.")
+    for m in distances['mismatches']:
+        lines.append(f"  MISMATCH {m['function']}{tuple(m['pair'])!r}: expected {m['expected']}")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Golden corpus of real answers for the scorers")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Extract pairs from answer history into a corpus")
+    build.add_argument("-o", "--output", default=str(CORPUS_FILE), help="Corpus to write (.gz/.gzip to compress)")
+    build.add_argument("--records", default=str(RECORDS_FILE), help="records.txt of the first trainer")
+    build.add_argument("--sessions", default=str(_SESSIONS_FILE), help="Sessions file")
+    check = sub.add_parser("check", help="Rescore the corpus: speed and stability")
+    check.add_argument("corpus", nargs="?", default=str(CORPUS_FILE), help="Corpus to check")
+    check.add_argument("--repeat", type=int, default=3, help="Timing passes, best kept (default: 3)")
+    check.add_argument("--accept", action="store_true", help="Store the current scores as the golden ones")
+    check.add_argument("--json", metavar="PATH", help="Write machine-readable results to PATH")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.command == "build":
+        sources = [pairs_from_records(path) for path in [args.records] if Path(path).exists()]
+        sources += [pairs_from_sessions(path) for path in [args.sessions] if Path(path).exists()]
+        if not sources:
+            print("Error: neither records file nor sessions file found", file=sys.stderr)
+            return 1
+        rows = build_rows(pair for source in sources for pair in source)
+        write_corpus(rows, args.output)
+        print(f"Wrote {len(rows)} pairs to {args.output}")
+        return 0
+    if args.repeat <= 0:
+        print("Error: --repeat must be positive", file=sys.stderr)
+        return 2
+    if not Path(args.corpus).exists():
+        print(f"Error: no corpus at {args.corpus}", file=sys.stderr)
+        return 1
+    rows = read_corpus(args.corpus)
+    scores = check_scores(rows, args.repeat)
+    distances = check_distances(rows, args.repeat)
+    print(format_check(scores, distances))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'scores': scores, 'distances': distances}, f, indent=2, ensure_ascii=False)
+    if args.accept:
+        current = {id(change['row']): change['score'] for change in scores['changes']}
+        kept = []
+        for row in rows:
+            score = current.get(id(row), row[5])
+            if score is not None:  # rows that no longer make a valid problem are dropped
+                kept.append(row[:5] + [score])
+        write_corpus(kept, args.corpus)
+        print(f"Accepted: {len(scores['changes'])} scores updated in {args.corpus}")
+        return 0
+    return 1 if scores['changes'] or distances['mismatches'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
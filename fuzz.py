@@ -0,0 +1,155 @@
+"""Seed-sharded stress harness for the problem generators.
+
+Every (class, seed) pair is reproducible: random.seed(seed) followed by
+cls.create() recreates the exact problem, so a failure report is enough to
+debug it. Network-backed content (GNews headlines) is disabled while fuzzing.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from problems import create_problems_dict
+
+_FIELDS = ('name', 'memorize', 'prompt', 'solution')
+
+
+def check_problem(pb) -> str | None:
+    """Return a description of the first violated invariant, or None if pb is sound."""
+    for field in _FIELDS:
+        value = getattr(pb, field, None)
+        if not isinstance(value, str) or not value.strip():
+            return f"{field} is empty"
+    if not isinstance(pb.exposure_ms, int) or pb.exposure_ms <= 0:
+        return "exposure_ms is not a positive integer"
+    score = pb.evaluate_solution(pb.solution)
+    if score != 1.0:
+        return f"solution scores {score!r}, expected 1.0"
+    return None
+
+
+def _classes_by_name(names=None) -> list:
+    classes = sorted(create_problems_dict(), key=lambda c: c.__name__)
+    if names:
+        wanted = set(names)
+        classes = [c for c in classes if c.__name__ in wanted]
+    return classes
+
+
+@contextmanager
+def _offline():
+    """Hide the GNews key so generators never touch the network."""
+    saved = os.environ.pop("GNEWS_KEY", None)
+    try:
+        yield
+    finally:
+        if saved is not None:
+            os.environ["GNEWS_KEY"] = saved
+
+
+def fuzz_shard(start: int, stop: int, class_names=None, max_failures: int = 100) -> tuple[int, list[dict]]:
+    """Create and check every class for seeds in [start, stop).
+
+    Returns (number of problems checked, failures). Each failure is a dict
+    with 'class', 'seed' and 'error'.
+    """
+    classes = _classes_by_name(class_names)
+    checked = 0
+    failures = []
+    with _offline():
+        for seed in range(start, stop):
+            for cls in classes:
+                random.seed(seed)
+                try:
+                    error = check_problem(cls.create())
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                checked += 1
+                if error is not None:
+                    failures.append({'class': cls.__name__, 'seed': seed, 'error': error})
+                    if len(failures) >= max_failures:
+                        return checked, failures
+    return checked, failures
+
+
+def _shards(start: int, count: int, shard_size: int):
+    for lo in range(start, start + count, shard_size):
+        yield lo, min(lo + shard_size, start + count)
+
+
+def run_fuzz(seeds: int = 1000, start: int = 0, workers: int | None = None, class_names=None,
+             shard_size: int = 500, max_failures: int = 100) -> dict:
+    """Fuzz `seeds` seeds per class, sharded over a process pool (workers=1 runs inline)."""
+    if seeds <= 0:
+        raise ValueError("seeds must be positive")
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+    t0 = time.perf_counter()
+    checked = 0
+    failures: list[dict] = []
+    shards = list(_shards(start, seeds, shard_size))
+    if workers == 1:
+        for lo, hi in shards:
+            n, f = fuzz_shard(lo, hi, class_names, max_failures - len(failures))
+            checked += n
+            failures.extend(f)
+            if len(failures) >= max_failures:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(fuzz_shard, lo, hi, class_names, max_failures) for lo, hi in shards]
+            for future in as_completed(futures):
+                n, f = future.result()
+                checked += n
+                failures.extend(f)
+                if len(failures) >= max_failures:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    elapsed = time.perf_counter() - t0
+    failures.sort(key=lambda f: (f['class'], f['seed']))
+    return {
+        'checked': checked,
+        'seconds': round(elapsed, 3),
+        'per_minute': int(checked / elapsed * 60) if elapsed > 0 else 0,
+        'failures': failures[:max_failures],
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"Checked {report['checked']} problems in {report['seconds']:.1f}s "
+             f"({report['per_minute']:,} per minute)"]
+    if not report['failures']:
+        lines.append("No failures.")
+    for f in report['failures']:
+        lines.append(f"  FAIL {f['class']} seed={f['seed']}: {f['error']}")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Stress-test problem generators across many seeds")
+    parser.add_argument("-s", "--seeds", type=int, default=1000, help="Seeds per class (default: 1000)")
+    parser.add_argument("--start", type=int, default=0, help="First seed (default: 0)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--shard-size", type=int, default=500, help="Seeds per work unit (default: 500)")
+    parser.add_argument("--only", nargs="+", metavar="CLASS", help="Only fuzz these problem classes")
+    parser.add_argument("--max-failures", type=int, default=100, help="Stop after this many failures")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.seeds <= 0 or args.shard_size <= 0:
+        print("Error: --seeds and --shard-size must be positive", file=sys.stderr)
+        return 2
+    report = run_fuzz(args.seeds, args.start, args.workers, args.only, args.shard_size, args.max_failures)
+    print(format_report(report))
+    return 1 if report['failures'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
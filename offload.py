@@ -0,0 +1,118 @@
+"""Run expensive problem generators off the interactive loop.
+
+Problem classes declare `heavy = 'cpu'` or `heavy = 'io'`. ProblemExecutor
+sends 'cpu' generators to a worker process and 'io' generators to a worker
+thread; everything else is created inline because it is cheaper than the
+hand-off. prefetched() keeps a few problems in flight ahead of the consumer,
+so by the time the trainer asks for the next question it is usually ready.
+"""
+
+import random
+import sys
+import sysconfig
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator
+
+from classes import Problem
+from problems import create_seeded
+
+
+def _reseed() -> None:
+    """Give each worker process its own random state instead of the forked parent's."""
+    random.seed()
+
+
+def _create(cls, kwargs: dict, seeded: bool = False) -> Problem:
+    if seeded:
+        return create_seeded(cls, **kwargs)
+    return cls.create(**kwargs)
+
+
+def create_many(cls, count: int, **kwargs) -> int:
+    """Create `count` problems of class cls and return how many were made (a pool work unit)."""
+    for _ in range(count):
+        cls.create(**kwargs)
+    return count
+
+
+def is_free_threaded() -> bool:
+    """True on a free-threaded CPython build (3.13t+) running with the GIL disabled."""
+    if not sysconfig.get_config_var('Py_GIL_DISABLED'):
+        return False
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def generation_pool(max_workers: int | None = None) -> Executor:
+    """Pool for bulk generation: threads on free-threaded builds, processes otherwise.
+
+    With the GIL enabled, threads only interleave pure-Python generators, so
+    scaling across cores needs worker processes.
+    """
+    if is_free_threaded():
+        return ThreadPoolExecutor(max_workers, thread_name_prefix='problem-gen')
+    return ProcessPoolExecutor(max_workers, initializer=_reseed)
+
+
+class ProblemExecutor:
+    """Dispatch cls.create() to a process pool, a thread pool or the caller's thread."""
+
+    def __init__(self, process_workers: int = 1, thread_workers: int = 2, seeded: bool = False):
+        if process_workers <= 0 or thread_workers <= 0:
+            raise ValueError("worker counts must be positive")
+        self._seeded = seeded
+        self._process_workers = process_workers
+        self._thread_workers = thread_workers
+        self._processes: ProcessPoolExecutor | None = None
+        self._threads: ThreadPoolExecutor | None = None
+
+    def _pool_for(self, cls):
+        kind = getattr(cls, 'heavy', None)
+        if kind == 'cpu':
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(self._process_workers, initializer=_reseed)
+            return self._processes
+        if kind == 'io':
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(self._thread_workers, thread_name_prefix='problem-io')
+            return self._threads
+        return None
+
+    def submit(self, cls, **kwargs) -> Future:
+        """Start creating a problem of class cls; returns a Future resolving to the Problem."""
+        pool = self._pool_for(cls)
+        if pool is not None:
+            return pool.submit(_create, cls, kwargs, self._seeded)
+        future = Future()
+        try:
+            future.set_result(_create(cls, kwargs, self._seeded))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in (self._processes, self._threads):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        self._processes = None
+        self._threads = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+def prefetched(classes: Iterable[type], executor: ProblemExecutor, lookahead: int = 2, **create_kwargs) -> Iterator[Problem]:
+    """Yield problems for `classes` in order, keeping `lookahead` extra creations in flight."""
+    if lookahead < 0:
+        raise ValueError("lookahead must be non-negative")
+    pending: deque[Future] = deque()
+    for cls in classes:
+        pending.append(executor.submit(cls, **create_kwargs))
+        if len(pending) > lookahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -1,113 +1,146 @@
 import random
 import re
+import threading
 
+import bitboard
+import content
 from classes import Problem
-from utils import rnd_number, load_frequencies, _dict_path, load_dicts, _pick_word_list, words, fetch_gnews_headlines
-from unidecode import unidecode
+from normalize import fold, normalize
+from pseudowords import LANGUAGES, pseudoword
+from scoring import CellSet, EditDistance, Numeric, Scorer, TokenAligned, YesNo, edit_distance_score
+from similarity import sample_distinct
+from utils import rnd_number, load_dicts, _pick_word_list, words, fetch_gnews_headlines
 
 
 class WordList(Problem):
+  scorer = TokenAligned()
+  classify_misses = True
+
   @classmethod
-  def create(cls, num_words=4, **kwargs):
-    wlist = _pick_word_list(num_words)
-    sample = random.sample(wlist, num_words)
+  def create(cls, num_words=4, rng=None, **kwargs):
+    rng = rng or random
+    wlist = _pick_word_list(num_words, rng)
+    sample = rng.sample(wlist, num_words)
     memorize = ' '.join(sample)
-    prompt = random.choice(['>', '<'])
+    prompt = rng.choice(['>', '<'])
     solution = ' '.join(sample[::1 if prompt == '>' else -1])
-    return Problem(cls.display_name(), memorize, prompt, solution, 4000, 'single line')
+    return WordList(cls.display_name(), memorize, prompt, solution, 4000, 'single line')
 
 
 class WordPairs(Problem):
+  classify_misses = True
+
   @classmethod
-  def create(cls, num_pairs=3, **kwargs):
-    wlist = _pick_word_list(2 * num_pairs)
-    sample = random.sample(wlist, 2 * num_pairs)
+  def create(cls, num_pairs=3, rng=None, **kwargs):
+    rng = rng or random
+    wlist = _pick_word_list(2 * num_pairs, rng)
+    sample = sample_distinct(wlist, 2 * num_pairs, rng=rng)
     pairs = [(sample[2*i], sample[1 + 2 * i]) for i in range(num_pairs)]
     memorize = ' '.join(f'{p[0]}:{p[1]}' for p in pairs)
-    chosen = random.randint(0, num_pairs - 1)
+    chosen = rng.randint(0, num_pairs - 1)
     prompt = f'? {pairs[chosen][0]}'
     solution = pairs[chosen][1]
-    return Problem(cls.display_name(), memorize, prompt, solution, 4000, 'matrix')
+    return WordPairs(cls.display_name(), memorize, prompt, solution, 4000, 'matrix')
 
 
 class WordNumberPairs(Problem):
   @classmethod
-  def create(cls, num_pairs=3, number_length=4, **kwargs):
-    wlist = _pick_word_list(num_pairs)
-    sample = random.sample(wlist, num_pairs)
-    pairs = [(sample[i], rnd_number(number_length)) for i in range(num_pairs)]
+  def create(cls, num_pairs=3, number_length=4, rng=None, **kwargs):
+    rng = rng or random
+    wlist = _pick_word_list(num_pairs, rng)
+    sample = sample_distinct(wlist, num_pairs, rng=rng)
+    pairs = [(sample[i], rnd_number(number_length, rng)) for i in range(num_pairs)]
     memorize = ' '.join(f'{p[0]}:{p[1]}' for p in pairs)
-    chosen = random.randint(0, num_pairs - 1)
+    chosen = rng.randint(0, num_pairs - 1)
     prompt = f'? {pairs[chosen][0]}'
     solution = pairs[chosen][1]
     return Problem(cls.display_name(), memorize, prompt, solution, 4000, 'matrix')
 
 
 class Number(Problem):
+  scorer = EditDistance(transpositions=True)
+
   @classmethod
-  def create(cls, number_length=6, **kwargs):
-    memorize = rnd_number(number_length)
-    prompt = random.choice(['>', '<'])
+  def create(cls, number_length=6, rng=None, **kwargs):
+    rng = rng or random
+    memorize = rnd_number(number_length, rng)
+    prompt = rng.choice(['>', '<'])
     solution = ''.join(memorize[::1 if prompt == '>' else -1])
-    return Problem(cls.display_name(), memorize, prompt, solution, 3000, 'single line')
+    return Number(cls.display_name(), memorize, prompt, solution, 3000, 'single line')
 
 
 class NumberLong(Problem):
+  scorer = EditDistance(transpositions=True)
+
   @classmethod
-  def create(cls, number_length=8, **kwargs):
+  def create(cls, number_length=8, rng=None, **kwargs):
+    rng = rng or random
     prompt = '>'
-    memorize = rnd_number(number_length)
+    memorize = rnd_number(number_length, rng)
     solution = memorize
-    return Problem(cls.display_name(), memorize, prompt, solution, 4000, 'single line')
+    return NumberLong(cls.display_name(), memorize, prompt, solution, 4000, 'single line')
 
 
 class NumberList(Problem):
+  scorer = TokenAligned()
+
   @classmethod
-  def create(cls, number_length=2, num_numbers=4, **kwargs):
-    sample = [rnd_number(number_length) for _ in range(num_numbers)]
+  def create(cls, number_length=2, num_numbers=4, rng=None, **kwargs):
+    rng = rng or random
+    sample = [rnd_number(number_length, rng) for _ in range(num_numbers)]
     memorize = ' '.join(sample)
-    prompt = random.choice(['>', '<'])
+    prompt = rng.choice(['>', '<'])
     solution = ' '.join(sample[::1 if prompt == '>' else -1])
-    return Problem(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
+    return NumberList(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
 
 
 class NumberCalculate(Problem):
+  scorer = Numeric()
+
   @classmethod
-  def create(cls, **kwargs):
-    a, b = random.randint(1, 20), random.randint(1, 20)
+  def create(cls, rng=None, **kwargs):
+    rng = rng or random
+    a, b = rng.randint(1, 20), rng.randint(1, 20)
     memorize = f'{a} {b}'
-    prompt = random.choice(['+', '-', '*'])
+    prompt = rng.choice(['+', '-', '*'])
     ops = {'+': a + b, '-': a - b, '*': a * b}
     solution = str(ops[prompt])
-    return Problem(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
+    return NumberCalculate(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
 
 
 class RandomLetters(Problem):
+  scorer = EditDistance(transpositions=True)
+
   @classmethod
-  def create(cls, num_letters=8, **kwargs):
+  def create(cls, num_letters=8, rng=None, **kwargs):
+    rng = rng or random
     alphabet = 'abcdefghijklmnopqrstuvwxyz'
-    memorize = ''.join([random.choice(alphabet) for _ in range(num_letters)])
+    memorize = ''.join([rng.choice(alphabet) for _ in range(num_letters)])
     prompt = '>'
     solution = memorize
-    return Problem(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
+    return RandomLetters(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
 
 
 class RandomLettersAndNumbers(Problem):
+  scorer = EditDistance(transpositions=True)
+
   @classmethod
-  def create(cls, size=8, **kwargs):
+  def create(cls, size=8, rng=None, **kwargs):
+    rng = rng or random
     alphabet = 'abcdefghijklmnopqrstuvwxyz'
     numbers = '0123456789'
-    memorize = ''.join([random.choice(alphabet + numbers) for _ in range(size)])
+    memorize = ''.join([rng.choice(alphabet + numbers) for _ in range(size)])
     prompt = '='
     solution = memorize
-    return Problem(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
+    return RandomLettersAndNumbers(cls.display_name(), memorize, prompt, solution, 2000, 'single line')
 
 
 class WordBackward(Problem):
   @classmethod
-  def create(cls, **kwargs):
-    wlist = _pick_word_list(1)
-    memorize = random.choice(wlist)
+  def create(cls, rng=None, **kwargs):
+    rng = rng or random
+    wlist = _pick_word_list(1, rng)
+    memorize = rng.choice(wlist)
     prompt = '<'
     solution = ''.join(memorize[::-1])
     return Problem(cls.display_name(), memorize + ' >>', prompt, solution, 1000, 'single line')
@@ -115,9 +148,10 @@ class WordBackward(Problem):
 
 class WordForward(Problem):
   @classmethod
-  def create(cls, **kwargs):
-    wlist = _pick_word_list(1)
-    memorize = random.choice(wlist)[::-1]
+  def create(cls, rng=None, **kwargs):
+    rng = rng or random
+    wlist = _pick_word_list(1, rng)
+    memorize = rng.choice(wlist)[::-1]
     prompt = '>'
     solution = ''.join(memorize[::-1])
     return Problem(cls.display_name(), memorize + ' <<', prompt, solution, 1000, 'single line')
@@ -125,7 +159,8 @@ class WordForward(Problem):
 
 class ArrowDirection(Problem):
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
+    rng = rng or random
     # Unicode arrows from range U+2190 to U+21FF
     arrows = {
       'left': '←',    # U+2190
@@ -137,14 +172,14 @@ class ArrowDirection(Problem):
     directions = ['left', 'up', 'right', 'down']
     
     # Create a single line of 4-6 arrows
-    num_arrows = random.randint(4, 6)
+    num_arrows = rng.randint(4, 6)
     
     # Generate random arrows for the line
     arrow_line = []
     arrow_directions = []
     
     for i in range(num_arrows):
-      direction = random.choice(directions)
+      direction = rng.choice(directions)
       arrow_line.append(arrows[direction])
       arrow_directions.append(direction)
     
@@ -152,7 +187,7 @@ class ArrowDirection(Problem):
     memorize = ' '.join(arrow_line)
     
     # Choose a random position to ask about (1-indexed for user)
-    ask_position = random.randint(1, num_arrows)
+    ask_position = rng.randint(1, num_arrows)
     
     prompt = f"{ask_position}"
     solution = arrow_directions[ask_position - 1]  # Convert back to 0-indexed
@@ -162,7 +197,8 @@ class ArrowDirection(Problem):
 
 class GeometricForms(Problem):
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
+    rng = rng or random
     # Unicode geometric shapes from range U+25A0 to U+25FF
     shapes = {
       'square': ['■', '□', '▪', '▫'],     # U+25A0, U+25A1, U+25AA, U+25AB
@@ -173,15 +209,15 @@ class GeometricForms(Problem):
     form_names = ['square', 'triangle', 'circle']
     
     # Create a line of 4-6 shapes
-    num_shapes = random.randint(4, 6)
+    num_shapes = rng.randint(4, 6)
     
     # Generate random shapes for the line
     shape_line = []
     shape_forms = []
     
     for i in range(num_shapes):
-      form_name = random.choice(form_names)
-      shape_char = random.choice(shapes[form_name])
+      form_name = rng.choice(form_names)
+      shape_char = rng.choice(shapes[form_name])
       shape_line.append(shape_char)
       shape_forms.append(form_name)
     
@@ -189,7 +225,7 @@ class GeometricForms(Problem):
     memorize = ' '.join(shape_line)
     
     # Choose a random position to ask about (1-indexed for user)
-    ask_position = random.randint(1, num_shapes)
+    ask_position = rng.randint(1, num_shapes)
     
     prompt = f"{ask_position}"
     solution = shape_forms[ask_position - 1]  # Convert back to 0-indexed
@@ -198,28 +234,13 @@ class GeometricForms(Problem):
 
 
 class FlightInfo(Problem):
+  heavy = 'io'
+
   @classmethod
-  def create(cls, num_flights=1, **kwargs):
-
-    airlines = []
-    airlines_path = _dict_path('airlines.txt')
-    if airlines_path.exists():
-        with open(airlines_path) as f:
-            for line in f:
-                line = line.strip()
-                if ',' in line:
-                    code, name = line.split(',', 1)
-                    airlines.append((code.strip(), name.strip()))
-    if not airlines:
-        airlines = [('XX', 'Unknown')]
-
-    destinations = []
-    cities_path = _dict_path('cities.txt')
-    if cities_path.exists():
-        with open(cities_path) as f:
-            destinations = [line.strip() for line in f if line.strip()]
-    if not destinations:
-        destinations = ['Unknown']
+  def create(cls, num_flights=1, rng=None, **kwargs):
+    rng = rng or random
+    airlines = content.AIRLINES
+    destinations = content.CITIES
 
     flights = []
     used_airlines = []
@@ -228,21 +249,21 @@ class FlightInfo(Problem):
 
     def generate_random_gate():
       gate_letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-      letter = random.choice(gate_letters)
-      number = random.randint(1, 99)
+      letter = rng.choice(gate_letters)
+      number = rng.randint(1, 99)
       return f"{letter}{number}"
 
     for i in range(num_flights):
       available_airlines = [a for a in airlines if a[0] not in used_airlines]
       if not available_airlines:
         available_airlines = airlines
-      airline_code, airline_name = random.choice(available_airlines)
+      airline_code, airline_name = rng.choice(available_airlines)
       used_airlines.append(airline_code)
 
       available_destinations = [d for d in destinations if d not in used_destinations]
       if not available_destinations:
         available_destinations = destinations
-      destination = random.choice(available_destinations)
+      destination = rng.choice(available_destinations)
       used_destinations.append(destination)
       
       gate = generate_random_gate()
@@ -250,10 +271,10 @@ class FlightInfo(Problem):
         gate = generate_random_gate()
       used_gates.append(gate)
       
-      flight_num = random.randint(100, 9999)
+      flight_num = rng.randint(100, 9999)
       
-      hour = random.randint(6, 23)
-      minute = random.choice([0, 15, 30, 45])
+      hour = rng.randint(6, 23)
+      minute = rng.choice([0, 15, 30, 45])
       time_str = f"{hour:02d}:{minute:02d}"
       
       flight_info = f"{airline_code} {flight_num} {destination} {gate} {time_str}"
@@ -265,7 +286,7 @@ class FlightInfo(Problem):
         memorize += "\n"
       memorize += f"{i}. {flight}"
     
-    ask_flight = random.randint(1, num_flights)
+    ask_flight = rng.randint(1, num_flights)
     prompt = f"{ask_flight}"
     solution = flights[ask_flight - 1]  # Convert to 0-indexed
     
@@ -274,72 +295,24 @@ class FlightInfo(Problem):
 
 class TokyoMetro(Problem):
   @classmethod
-  def create(cls, num_stations=3, **kwargs):
-    # Load Tokyo Metro lines and stations from file
-    metro_lines = {}
-    current_line_english = None
-    current_line_kanji = None
-    
-    with open(_dict_path('tokyo_metro.txt')) as f:
-      for line in f:
-        line = line.strip()
-        if not line:
-          continue
-        
-        # Check if this is a line name (format "English:Kanji")
-        if ',' not in line and ':' in line:
-          english_line, kanji_line = line.split(':', 1)
-          current_line_english = english_line.strip()
-          current_line_kanji = kanji_line.strip()
-          metro_lines[current_line_english] = {
-            'english': [],
-            'kanji': [],
-            'line_kanji': current_line_kanji
-          }
-        elif current_line_english and ',' in line:
-          # This is a station list for the current line in format "English:Kanji"
-          station_pairs = [station.strip() for station in line.split(',')]
-          for pair in station_pairs:
-            if ':' in pair:
-              english, kanji = pair.split(':', 1)
-              metro_lines[current_line_english]['english'].append(english.strip())
-              metro_lines[current_line_english]['kanji'].append(kanji.strip())
-            else:
-              # Fallback for stations without kanji
-              metro_lines[current_line_english]['english'].append(pair.strip())
-              metro_lines[current_line_english]['kanji'].append(pair.strip())
-    
-    # Only use lines that have at least one station (avoid randint(0, -1))
-    lines_with_stations = {
-        k: v for k, v in metro_lines.items()
-        if len(v['english']) > 0
-    }
-    if not lines_with_stations:
-        raise ValueError("tokyo_metro.txt has no lines with stations")
-
+  def create(cls, num_stations=3, rng=None, **kwargs):
+    rng = rng or random
     itinerary = []
     used_combinations = set()
 
-    start_hour = random.randint(7, 21)
-    start_minute = random.choice([0, 15, 30, 45])
+    start_hour = rng.randint(7, 21)
+    start_minute = rng.choice([0, 15, 30, 45])
     current_minutes = start_hour * 60 + start_minute
 
     for i in range(num_stations):
-      line_names = list(lines_with_stations.keys())
-      line_name = random.choice(line_names)
-      line_data = lines_with_stations[line_name]
-      station_index = random.randint(0, len(line_data['english']) - 1)
-      english_station = line_data['english'][station_index]
-      kanji_station = line_data['kanji'][station_index]
+      line_name, _, stations = rng.choice(content.TOKYO_METRO)
+      english_station, kanji_station = stations[rng.randint(0, len(stations) - 1)]
 
       combo = (line_name, english_station)
       attempts = 0
       while combo in used_combinations and attempts < 50:
-        line_name = random.choice(line_names)
-        line_data = lines_with_stations[line_name]
-        station_index = random.randint(0, len(line_data['english']) - 1)
-        english_station = line_data['english'][station_index]
-        kanji_station = line_data['kanji'][station_index]
+        line_name, _, stations = rng.choice(content.TOKYO_METRO)
+        english_station, kanji_station = stations[rng.randint(0, len(stations) - 1)]
         combo = (line_name, english_station)
         attempts += 1
       
@@ -353,7 +326,7 @@ class TokyoMetro(Problem):
       itinerary.append((english_station, kanji_station, time_str))
       
       # Add 5-15 minutes for next station
-      current_minutes += random.randint(5, 15)
+      current_minutes += rng.randint(5, 15)
     
     # Create memorize string (using kanji for display)
     memorize_parts = []
@@ -364,7 +337,7 @@ class TokyoMetro(Problem):
     memorize = " → ".join(memorize_parts)
     
     # Choose which station to ask about (1-indexed)
-    ask_position = random.randint(1, num_stations)
+    ask_position = rng.randint(1, num_stations)
     prompt = f"{ask_position}"
     # Solution uses English (what they need to type)
     solution = f"{itinerary[ask_position - 1][0]} {itinerary[ask_position - 1][2]}"
@@ -374,16 +347,9 @@ class TokyoMetro(Problem):
 
 class Appointments(Problem):
   @classmethod
-  def create(cls, num_appointments=3, **kwargs):
-    # List of possible appointment types
-    appointment_types = [
-      'Doctor', 'Dentist', 'Plumber', 'Car repair', 'Electrician',
-      'Hair', 'Vet', 'Lawyer', 'Accountant', 'Mechanic',
-      'Eye exam', 'PT', 'Massage', 'Interview',
-      'Bank', 'Grocery', 'Insurance', 'Tax',
-      'Computer', 'Inspection', 'Cleaning',
-      'Piano', 'Tutoring', 'Chiropractor', 'Orthodontist'
-    ]
+  def create(cls, num_appointments=3, rng=None, **kwargs):
+    rng = rng or random
+    appointment_types = content.APPOINTMENT_TYPES
     
     # Generate appointment times and types
     appointments = []
@@ -395,8 +361,8 @@ class Appointments(Problem):
       # Generate a unique time
       attempts = 0
       while attempts < 100:  # Prevent infinite loops
-        hour = random.randint(8, 17)
-        minute = random.choice([0, 15, 30, 45])  # Quarter-hour intervals
+        hour = rng.randint(8, 17)
+        minute = rng.choice([0, 15, 30, 45])  # Quarter-hour intervals
         time_str = f"{hour:02d}:{minute:02d}"
         
         if time_str not in used_times:
@@ -408,7 +374,7 @@ class Appointments(Problem):
             used_types.clear()
             available_types = appointment_types
           
-          appointment_type = random.choice(available_types)
+          appointment_type = rng.choice(available_types)
           used_types.add(appointment_type)
           
           appointments.append((time_str, appointment_type))
@@ -417,10 +383,10 @@ class Appointments(Problem):
       
       # If we couldn't find a unique time, just use a random one
       if attempts >= 100:
-        hour = random.randint(8, 17)
-        minute = random.choice([0, 15, 30, 45])
+        hour = rng.randint(8, 17)
+        minute = rng.choice([0, 15, 30, 45])
         time_str = f"{hour:02d}:{minute:02d}"
-        appointment_type = random.choice(appointment_types)
+        appointment_type = rng.choice(appointment_types)
         appointments.append((time_str, appointment_type))
     
     # Sort appointments by time for realistic scheduling
@@ -434,16 +400,57 @@ class Appointments(Problem):
     memorize = "  ".join(memorize_parts)
     
     # Choose which appointment to ask about (1-indexed)
-    ask_appointment = random.randint(1, num_appointments)
+    ask_appointment = rng.randint(1, num_appointments)
     prompt = f"{ask_appointment}"
     solution = f"{appointments[ask_appointment - 1][0]} {appointments[ask_appointment - 1][1]}"
     
     return Problem(cls.display_name(), memorize, prompt, solution, 3500, 'single line')
 
 
+class _AnagramScorer(Scorer):
+  """Accepts the solution or any other dictionary word made of its letters; otherwise edit distance."""
+
+  def prepare(self, problem):
+    return sorted(problem._normalized_solution)
+
+  def score(self, problem, user_input):
+    if user_input is None:
+      return 0.0
+
+    user_normalized = normalize(user_input)
+    
+    # First check exact match
+    if user_normalized == problem._normalized_solution:
+      return 1.0
+    
+    # Check if it's a valid anagram and in the dictionary
+    if problem._is_valid_anagram(user_normalized):
+      return 1.0
+    
+    # Fall back to standard evaluation (Levenshtein distance)
+    return edit_distance_score(problem._normalized_solution, user_input)
+
+
+_ANAGRAM_LANGUAGES = {'English': 1, 'French': 2}  # language -> words index
+
+
 class Anagram(Problem):
+  heavy = 'cpu'
+  scorer = _AnagramScorer()
+  classify_misses = True
+
+  def __post_init__(self):
+    super().__post_init__()
+    # A problem rebuilt from a record (rescore, corpus) only has the stored
+    # fields; the dictionary is named at the end of memorize: "rcae (English)".
+    language = self.memorize.rpartition('(')[2].rstrip(')')
+    if language in _ANAGRAM_LANGUAGES:
+      self._dict_index = _ANAGRAM_LANGUAGES[language]
+      self._language = language
+
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
+    rng = rng or random
     # Use existing word lists from dictionaries (length 4-6)
     if not words:
       load_dicts(4, 6)  # Load words of length 4-6
@@ -464,24 +471,24 @@ class Anagram(Problem):
     
     if not available_dicts:
       try:
-        wlist = _pick_word_list(1)
-        original_word = random.choice(wlist)
+        wlist = _pick_word_list(1, rng)
+        original_word = rng.choice(wlist)
         dict_index = 0
         language = 'English'
       except ValueError:
         return Problem(cls.display_name(), 'No words available', '>', 'error', 2000, 'single line')
     else:
-      dict_index = random.choice(available_dicts)
+      dict_index = rng.choice(available_dicts)
       language = dict_languages[dict_index]
-      original_word = random.choice(words[dict_index])
+      original_word = rng.choice(words[dict_index])
     
     # Create anagram by shuffling letters
-    anagram_word = create_anagram(original_word)
+    anagram_word = create_anagram(original_word, rng)
     
     # Make sure anagram is different from original
     attempts = 0
     while anagram_word.lower() == original_word.lower() and attempts < 20:
-      anagram_word = create_anagram(original_word)
+      anagram_word = create_anagram(original_word, rng)
       attempts += 1
     
     # Combine anagram and language in prompt
@@ -494,31 +501,11 @@ class Anagram(Problem):
     problem._language = language
     return problem
 
-  def evaluate_solution(self, user_input):
-    """Custom evaluation that accepts valid anagrams from the dictionary"""
-    if user_input is None:
-      return 0.0
-
-    # Normalize with unidecode to remove accents
-    user_normalized = unidecode(str(user_input).lower().strip())
-    solution_normalized = unidecode(self.solution.lower())
-    
-    # First check exact match
-    if user_normalized == solution_normalized:
-      return 1.0
-    
-    # Check if it's a valid anagram and in the dictionary
-    if self._is_valid_anagram(user_normalized, solution_normalized):
-      return 1.0
-    
-    # Fall back to standard evaluation (Levenshtein distance)
-    return super().evaluate_solution(user_input)
-  
-  def _is_valid_anagram(self, user_word, original_word):
-    """Check if user_word is a valid anagram of original_word and exists in dictionary"""
+  def _is_valid_anagram(self, user_word):
+    """Check if user_word (normalized) is an anagram of the solution that exists in the dictionary"""
     
-    # Check if letters match (anagram test) - both should already be normalized
-    if sorted(user_word) != sorted(original_word):
+    # Check if letters match (anagram test)
+    if sorted(user_word) != self._prepared:
       return False
     
     # Check if the anagram exists in the appropriate dictionary
@@ -530,26 +517,39 @@ class Anagram(Problem):
       load_dicts(4, 6)
     
     # Check if user's word exists in the same dictionary that was used
-    # Normalize dictionary words with unidecode for comparison
     dict_index = getattr(self, '_dict_index', 1)
     if dict_index < len(words) and len(words[dict_index]) > 0:
-      normalized_dict_words = [unidecode(w.lower()) for w in words[dict_index]]
-      return user_word in normalized_dict_words
+      return user_word in _normalized_dict_words(dict_index)
     
     return False
 
 
-def create_anagram(word):
+_normalized_dicts: dict[int, frozenset] = {}
+
+
+def _normalized_dict_words(dict_index):
+  """Lowercased, accent-folded words of words[dict_index], built once per process."""
+  normalized = _normalized_dicts.get(dict_index)
+  if normalized is None:
+    normalized = frozenset(fold(w.lower()) for w in words[dict_index])
+    _normalized_dicts[dict_index] = normalized
+  return normalized
+
+
+def create_anagram(word, rng=None):
   """Create an anagram by shuffling the letters of a word"""
   letters = list(word.lower())
-  random.shuffle(letters)
+  (rng or random).shuffle(letters)
   return ''.join(letters)
 
 
 class SequenceRecognition(Problem):
+  scorer = Numeric()
+
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
     """Generate a sequence recognition problem with the first 5 elements"""
+    rng = rng or random
     # Dictionary of sequence generators - easy to add new ones!
     sequence_generators = {
       'arithmetic': SequenceRecognition._generate_arithmetic,
@@ -570,11 +570,11 @@ class SequenceRecognition(Problem):
     }
     
     # Randomly select a sequence type
-    sequence_type = random.choice(list(sequence_generators.keys()))
+    sequence_type = rng.choice(list(sequence_generators.keys()))
     generator = sequence_generators[sequence_type]
     
     # Generate the sequence (first 6 elements)
-    sequence = generator()
+    sequence = generator(rng)
     
     # Show first 5, ask for 6th
     shown_sequence = sequence[:5]
@@ -585,47 +585,47 @@ class SequenceRecognition(Problem):
     prompt = '>'
     solution = str(next_element)
     
-    return Problem(cls.display_name(), memorize, prompt, solution, 3000, 'single line')
+    return SequenceRecognition(cls.display_name(), memorize, prompt, solution, 3000, 'single line')
   
   @staticmethod
-  def _generate_arithmetic():
+  def _generate_arithmetic(rng):
     """Arithmetic sequence: a, a+d, a+d*2, ..."""
-    start = random.randint(1, 20)
-    diff = random.randint(2, 10)
+    start = rng.randint(1, 20)
+    diff = rng.randint(2, 10)
     return [start + i * diff for i in range(6)]
   
   @staticmethod
-  def _generate_geometric():
+  def _generate_geometric(rng):
     """Geometric sequence: a, a*r, a*r^2, ..."""
-    start = random.randint(1, 5)
-    ratio = random.choice([2, 3])  # Keep numbers manageable
+    start = rng.randint(1, 5)
+    ratio = rng.choice([2, 3])  # Keep numbers manageable
     return [start * (ratio ** i) for i in range(6)]
   
   @staticmethod
-  def _generate_fibonacci():
+  def _generate_fibonacci(rng):
     """Fibonacci-like sequence: a, b, a+b, a+2b, 2a+3b, ..."""
-    a, b = random.randint(1, 5), random.randint(1, 5)
+    a, b = rng.randint(1, 5), rng.randint(1, 5)
     sequence = [a, b]
     for i in range(4):  # Generate 4 more elements
       sequence.append(sequence[-1] + sequence[-2])
     return sequence
   
   @staticmethod
-  def _generate_squares():
+  def _generate_squares(rng):
     """Perfect squares: 1^2, 2^2, 3^2, ..."""
-    start = random.randint(1, 8)
+    start = rng.randint(1, 8)
     return [(start + i) ** 2 for i in range(6)]
   
   @staticmethod
-  def _generate_powers_of_2():
+  def _generate_powers_of_2(rng):
     """Powers of 2: 2^1, 2^2, 2^3, ..."""
-    start_power = random.randint(0, 4)
+    start_power = rng.randint(0, 4)
     return [2 ** (start_power + i) for i in range(6)]
   
   @staticmethod
-  def _generate_triangular():
+  def _generate_triangular(rng):
     """Triangular numbers: 1, 3, 6, 10, 15, ..."""
-    start = random.randint(1, 5)
+    start = rng.randint(1, 5)
     sequence = []
     for i in range(6):
       n = start + i
@@ -634,22 +634,22 @@ class SequenceRecognition(Problem):
     return sequence
   
   @staticmethod
-  def _generate_cubes():
+  def _generate_cubes(rng):
     """Perfect cubes: 1^3, 2^3, 3^3, ..."""
-    start = random.randint(1, 6)
+    start = rng.randint(1, 6)
     return [(start + i) ** 3 for i in range(6)]
 
   @staticmethod
-  def _generate_primes():
+  def _generate_primes(rng):
     """Prime numbers sequence"""
     primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
-    start_idx = random.randint(0, len(primes) - 6)
+    start_idx = rng.randint(0, len(primes) - 6)
     return primes[start_idx:start_idx + 6]
 
   @staticmethod
-  def _generate_factorial():
+  def _generate_factorial(rng):
     """Factorial sequence: 1!, 2!, 3!, ..."""
-    start = random.randint(1, 4)
+    start = rng.randint(1, 4)
     sequence = []
     for i in range(6):
       n = start + i
@@ -660,10 +660,10 @@ class SequenceRecognition(Problem):
     return sequence
 
   @staticmethod
-  def _generate_alternating():
+  def _generate_alternating(rng):
     """Alternating arithmetic sequence: a, a+d, a+2d, a+3d, a+4d, a+5d with alternating signs"""
-    start = random.randint(1, 10)
-    diff = random.randint(2, 8)
+    start = rng.randint(1, 10)
+    diff = rng.randint(2, 8)
     sequence = []
     for i in range(6):
       if i % 2 == 0:
@@ -673,24 +673,24 @@ class SequenceRecognition(Problem):
     return sequence
 
   @staticmethod
-  def _generate_recursive():
+  def _generate_recursive(rng):
     """Recursive sequence: a(n) = a(n-1) + a(n-2) + c"""
-    a, b = random.randint(1, 5), random.randint(1, 5)
-    c = random.randint(1, 3)
+    a, b = rng.randint(1, 5), rng.randint(1, 5)
+    c = rng.randint(1, 3)
     sequence = [a, b]
     for i in range(4):
       sequence.append(sequence[-1] + sequence[-2] + c)
     return sequence
 
   @staticmethod
-  def _generate_exponential():
+  def _generate_exponential(rng):
     """Exponential sequence: a * b^n"""
-    a = random.randint(1, 3)
-    b = random.choice([2, 3, 4])
+    a = rng.randint(1, 3)
+    b = rng.choice([2, 3, 4])
     return [a * (b ** i) for i in range(6)]
 
   @staticmethod
-  def _generate_lucas():
+  def _generate_lucas(rng):
     """Lucas sequence: L(n) = L(n-1) + L(n-2) with L(0)=2, L(1)=1"""
     sequence = [2, 1]
     for i in range(4):
@@ -698,7 +698,7 @@ class SequenceRecognition(Problem):
     return sequence
 
   @staticmethod
-  def _generate_padovan():
+  def _generate_padovan(rng):
     """Padovan sequence: P(n) = P(n-2) + P(n-3) with P(0)=1, P(1)=1, P(2)=1"""
     sequence = [1, 1, 1]
     for i in range(3):
@@ -706,42 +706,39 @@ class SequenceRecognition(Problem):
     return sequence
 
   @staticmethod
-  def _generate_catalan():
+  def _generate_catalan(rng):
     """Catalan numbers: C(n) = (2n)!/(n!(n+1)!)"""
     def catalan(n):
       if n <= 1:
         return 1
       return catalan(n-1) * (4*n - 2) // (n + 1)
     
-    start = random.randint(0, 3)
+    start = rng.randint(0, 3)
     return [catalan(start + i) for i in range(6)]
 
 
 class Metar(Problem):
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
     """Generate a METAR/TAF aviation weather report memorization problem"""
+    rng = rng or random
     
     # Airport codes (mix of major international airports)
-    airports = ['KJFK', 'KLAX', 'KORD', 'KATL', 'KDEN', 'KDFW', 'KSEA', 'KLAS', 
-                'KMIA', 'KBOS', 'KPHX', 'KSFO', 'KIAD', 'KMSP', 'KDTW', 'KPHL',
-                'EGLL', 'LFPG', 'EDDF', 'EHAM', 'LIRF', 'LEMD', 'LOWW', 'ESSA',
-                'RJTT', 'VHHH', 'WSSS', 'YSSY', 'NZAA', 'OMDB', 'OTHH', 'RKSI',
-                'CYYZ', 'CYVR', 'SBGR', 'SAEZ', 'FACT', 'HECA', 'VIDP', 'UUEE']
+    airports = content.METAR_AIRPORTS
     
     # Generate METAR components
-    airport = random.choice(airports)
+    airport = rng.choice(airports)
     
     # Date/time (DDHHMMZ format)
-    day = random.randint(1, 31)
-    hour = random.randint(0, 23)
-    minute = random.choice([0, 30])  # Usually on the hour or half-hour
+    day = rng.randint(1, 31)
+    hour = rng.randint(0, 23)
+    minute = rng.choice([0, 30])  # Usually on the hour or half-hour
     datetime_str = f"{day:02d}{hour:02d}{minute:02d}Z"
     
     # Wind (direction/speed)
-    wind_dir = random.randint(1, 36) * 10  # Wind direction in 10-degree increments
-    wind_speed = random.randint(5, 25)
-    is_variable = random.random() < 0.1  # 10% chance of variable winds
+    wind_dir = rng.randint(1, 36) * 10  # Wind direction in 10-degree increments
+    wind_speed = rng.randint(5, 25)
+    is_variable = rng.random() < 0.1  # 10% chance of variable winds
     if is_variable:
       wind = "VRB"
     else:
@@ -749,32 +746,32 @@ class Metar(Problem):
     wind += f"{wind_speed:02d}KT"
     
     # Visibility
-    visibility = random.choice(['10SM', '7SM', '5SM', '3SM', '1SM', '1/2SM'])
+    visibility = rng.choice(['10SM', '7SM', '5SM', '3SM', '1SM', '1/2SM'])
     
     # Weather phenomena (optional)
     weather_phenomena = ['', '-RA', 'RA', '+RA', '-SN', 'SN', 'FG', 'BR', 'HZ']
-    weather = random.choice(weather_phenomena)
+    weather = rng.choice(weather_phenomena)
     
     # Cloud layers
     cloud_types = ['FEW', 'SCT', 'BKN', 'OVC']
     cloud_altitudes = ['008', '015', '025', '035', '050', '080', '120']
     
-    if random.random() < 0.2:  # 20% chance of clear skies
+    if rng.random() < 0.2:  # 20% chance of clear skies
       clouds = 'CLR'
     else:
-      cloud_type = random.choice(cloud_types)
-      cloud_alt = random.choice(cloud_altitudes)
+      cloud_type = rng.choice(cloud_types)
+      cloud_alt = rng.choice(cloud_altitudes)
       clouds = f"{cloud_type}{cloud_alt}"
     
     # Temperature/Dewpoint
-    temp = random.randint(-10, 35)
-    dewpoint = temp - random.randint(0, 15)  # Dewpoint is always <= temperature
+    temp = rng.randint(-10, 35)
+    dewpoint = temp - rng.randint(0, 15)  # Dewpoint is always <= temperature
     temp_str = f"{temp:02d}" if temp >= 0 else f"M{abs(temp):02d}"
     dewpoint_str = f"{dewpoint:02d}" if dewpoint >= 0 else f"M{abs(dewpoint):02d}"
     temp_dewpoint = f"{temp_str}/{dewpoint_str}"
     
     # Altimeter setting
-    altimeter = f"A{random.randint(2800, 3100)}"
+    altimeter = f"A{rng.randint(2800, 3100)}"
     
     # Build complete METAR
     metar_parts = [airport, datetime_str, wind, visibility]
@@ -795,68 +792,39 @@ class Metar(Problem):
       ('altimeter', altimeter, 'Altimeter setting?')
     ]
     
-    question_type, answer, prompt = random.choice(question_types)
+    question_type, answer, prompt = rng.choice(question_types)
     
     return Problem(cls.display_name(), full_metar, prompt, answer, 6000, 'single line')
 
 
 class Atc(Problem):
-  _airlines = None
-  _frequencies = None
-
-  @classmethod
-  def _load_airlines(cls):
-      if cls._airlines is None:
-          path = _dict_path('airlines.txt')
-          cls._airlines = []
-          if path.exists():
-              with open(path) as f:
-                  for line in f:
-                      if ',' in line:
-                          cls._airlines.append(line.strip().split(',', 1)[0].strip())
-          if not cls._airlines:
-              cls._airlines = ['XX']
-
-  @classmethod
-  def _load_frequencies(cls):
-      if cls._frequencies is None:
-          cls._frequencies = load_frequencies()
-
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
     """Generate ATC IFR departure/landing instructions"""
-    Atc._load_airlines()
-    Atc._load_frequencies()
-    
+    rng = rng or random
     # Aircraft callsigns (mix of airlines and general aviation)
-    flight_numbers = [f"{random.choice(Atc._airlines)}{random.randint(100, 9999)}" for _ in range(5)]
-    ga_callsigns = [f"N{random.randint(100, 999)}{random.choice(['AB', 'CD', 'EF', 'GH'])}" for _ in range(3)]
+    flight_numbers = [f"{rng.choice(content.AIRLINE_CODES)}{rng.randint(100, 9999)}" for _ in range(5)]
+    ga_callsigns = [f"N{rng.randint(100, 999)}{rng.choice(['AB', 'CD', 'EF', 'GH'])}" for _ in range(3)]
     callsigns = flight_numbers + ga_callsigns
     
     # Runways (common runway numbers)
-    runways = ['09L', '09R', '27L', '27R', '04L', '04R', '22L', '22R', 
-               '01L', '01R', '19L', '19R', '16L', '16R', '34L', '34R',
-               '08L', '26R', '06R', '24L', '12L', '30R', '15L', '33R',
-               '03L', '21R', '05L', '23R', '07L', '25R', '10L', '28R', 
-               '13L', '31R']
+    runways = content.RUNWAYS
     
     # Instruction type (departure, arrival, or vector)
-    instruction_type = random.choice(['departure', 'arrival', 'vector'])
+    instruction_type = rng.choice(['departure', 'arrival', 'vector'])
     
-    callsign = random.choice(callsigns)
-    runway = random.choice(runways)
+    callsign = rng.choice(callsigns)
+    runway = rng.choice(runways)
     
     if instruction_type == 'departure':
       # Generate departure instruction
-      squawk = ''.join([str(random.randint(0, 7)) for _ in range(4)])
+      squawk = ''.join([str(rng.randint(0, 7)) for _ in range(4)])
       if squawk[0] == '0':  # Ensure first digit is 1-7
-        squawk = str(random.randint(1, 7)) + squawk[1:]
-      departure_heading = random.randint(1, 36) * 10
-      initial_altitude = random.choice([3000, 4000, 5000, 6000, 8000, 10000])
+        squawk = str(rng.randint(1, 7)) + squawk[1:]
+      departure_heading = rng.randint(1, 36) * 10
+      initial_altitude = rng.choice([3000, 4000, 5000, 6000, 8000, 10000])
       
-      # Departure frequencies (fallback if dict missing or empty)
-      approach_list = Atc._frequencies.get('approach') or []
-      departure_freq = random.choice(approach_list) if approach_list else '121.00'
+      departure_freq = rng.choice(content.FREQUENCIES['approach'])
       
       instruction = f"{callsign}, runway {runway}, cleared for takeoff, fly heading {departure_heading:03d}, climb and maintain {initial_altitude}, squawk {squawk}, contact departure {departure_freq}"
       
@@ -872,13 +840,11 @@ class Atc(Problem):
       
     elif instruction_type == 'arrival':
       # Generate arrival instruction
-      approach_type = random.choice(['ILS', 'RNAV', 'VOR', 'GPS'])
-      final_altitude = random.choice([2000, 2500, 3000, 3500, 4000])
-      speed_restriction = random.choice([180, 200, 210, 220, 250])
+      approach_type = rng.choice(['ILS', 'RNAV', 'VOR', 'GPS'])
+      final_altitude = rng.choice([2000, 2500, 3000, 3500, 4000])
+      speed_restriction = rng.choice([180, 200, 210, 220, 250])
       
-      # Tower frequencies (fallback if dict missing or empty)
-      tower_list = Atc._frequencies.get('tower') or []
-      approach_freq = random.choice(tower_list) if tower_list else '118.00'
+      approach_freq = rng.choice(content.FREQUENCIES['tower'])
       
       instruction = f"{callsign}, descend and maintain {final_altitude}, reduce speed {speed_restriction} knots, cleared {approach_type} approach runway {runway}, contact tower {approach_freq}"
       
@@ -902,8 +868,8 @@ class Atc(Problem):
         'weather_deviation'
       ]
       
-      vector_type = random.choice(vector_types)
-      vector_heading = random.randint(1, 36) * 10
+      vector_type = rng.choice(vector_types)
+      vector_heading = rng.randint(1, 36) * 10
       
       if vector_type == 'traffic':
         instruction = f"{callsign}, turn left heading {vector_heading:03d}, vector for traffic"
@@ -916,7 +882,7 @@ class Atc(Problem):
         reason = "final approach"
       elif vector_type == 'navigation':
         waypoints = ['STAR1', 'FIXME', 'ABCDE', 'POINT', 'NAVPT', 'INTER']
-        waypoint = random.choice(waypoints)
+        waypoint = rng.choice(waypoints)
         instruction = f"{callsign}, turn right heading {vector_heading:03d}, vector direct {waypoint}"
         reason = waypoint
       else:  # weather_deviation
@@ -934,42 +900,19 @@ class Atc(Problem):
       if vector_type == 'final_approach':
         questions.append(('runway', runway, 'Runway?'))
     
-    question_type, answer, prompt = random.choice(questions)
+    question_type, answer, prompt = rng.choice(questions)
     
     return Problem(cls.display_name(), instruction, prompt, answer, 5000, 'single line')
 
 
 class FlightPlan(Problem):
-  _vors = None
-  _frequencies = None
-
   @classmethod
-  def _load_vors(cls):
-    if cls._vors is None:
-      path = _dict_path('vors.txt')
-      cls._vors = []
-      if path.exists():
-        with open(path) as f:
-          cls._vors = [line.strip() for line in f if line.strip()]
-      if not cls._vors:
-        cls._vors = ['VOR1']
-
-  @classmethod
-  def _load_frequencies(cls):
-    if cls._frequencies is None:
-      cls._frequencies = load_frequencies()
-
-  @classmethod
-  def create(cls, num_waypoints=5, **kwargs):
-    FlightPlan._load_vors()
-    FlightPlan._load_frequencies()
-    
-    vor_list = FlightPlan._vors
-    freqs = FlightPlan._frequencies
-    approach_freqs = freqs.get('approach') or []
-    tower_freqs = freqs.get('tower') or []
-    ground_freqs = freqs.get('ground') or []
-    _fallback_freq = '121.00'
+  def create(cls, num_waypoints=5, rng=None, **kwargs):
+    rng = rng or random
+    vor_list = content.VORS
+    approach_freqs = content.FREQUENCIES['approach']
+    tower_freqs = content.FREQUENCIES['tower']
+    ground_freqs = content.FREQUENCIES['ground']
 
     waypoints = []
     used_vors = set()
@@ -977,20 +920,20 @@ class FlightPlan(Problem):
       available_vors = [v for v in vor_list if v not in used_vors]
       if not available_vors:
         available_vors = vor_list
-      vor = random.choice(available_vors)
+      vor = rng.choice(available_vors)
       used_vors.add(vor)
-      heading = random.randint(0, 359)
-      altitude = random.choice([3000, 5000, 7000, 9000, 11000, 13000, 15000, 17000, 19000, 21000, 23000, 25000, 27000, 29000, 31000, 33000, 35000, 37000, 39000, 41000])
-      freq_type = random.choice(['approach', 'tower', 'ground'])
+      heading = rng.randint(0, 359)
+      altitude = rng.choice([3000, 5000, 7000, 9000, 11000, 13000, 15000, 17000, 19000, 21000, 23000, 25000, 27000, 29000, 31000, 33000, 35000, 37000, 39000, 41000])
+      freq_type = rng.choice(['approach', 'tower', 'ground'])
 
       if freq_type == 'approach':
-        freq = random.choice(approach_freqs) if approach_freqs else _fallback_freq
+        freq = rng.choice(approach_freqs)
         contact = 'Approach'
       elif freq_type == 'tower':
-        freq = random.choice(tower_freqs) if tower_freqs else _fallback_freq
+        freq = rng.choice(tower_freqs)
         contact = 'Tower'
       else:
-        freq = random.choice(ground_freqs) if ground_freqs else _fallback_freq
+        freq = rng.choice(ground_freqs)
         contact = 'Ground'
       
       waypoint = f"{vor} {heading:03d}° {altitude:,}ft {freq}MHz {contact}"
@@ -999,11 +942,11 @@ class FlightPlan(Problem):
     memorize = '\n'.join(waypoints)
     
     # Choose a random waypoint to ask about
-    chosen_idx = random.randint(0, num_waypoints - 1)
+    chosen_idx = rng.randint(0, num_waypoints - 1)
     chosen_waypoint = waypoints[chosen_idx]
     
     # Ask about different aspects randomly
-    aspect = random.choice(['vor', 'heading', 'altitude', 'frequency', 'contact'])
+    aspect = rng.choice(['vor', 'heading', 'altitude', 'frequency', 'contact'])
     
     if aspect == 'vor':
       prompt = f"VOR at waypoint {chosen_idx + 1}?"
@@ -1025,36 +968,29 @@ class FlightPlan(Problem):
 
 
 class Road(Problem):
-  _street_names = None
+  heavy = 'cpu'
 
   @classmethod
-  def _load_street_names(cls):
-      if cls._street_names is None:
-          with open(_dict_path('street_names.txt')) as f:
-              cls._street_names = [line.strip() for line in f]
-
-  @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
     """Generate a road itinerary with highway numbers, exits, and distances"""
-    Road._load_street_names()
-    
+    rng = rng or random
     # Highway types and numbers
     interstate_highways = ['I-5', 'I-10', 'I-95', 'I-75', 'I-40', 'I-80', 'I-90', 'I-35', 'I-15', 'I-25']
     us_highways = ['US-101', 'US-1', 'US-50', 'US-66', 'US-Route 9', 'US-202', 'US-395', 'US-87']
     state_routes = ['SR-1', 'SR-99', 'SR-85', 'CA-1', 'Route 128', 'SR-237', 'Route 2', 'SR-92']
     
-    # Street/road names from file
-    street_names = Road._street_names
+    # Street/road names
+    street_names = content.STREET_NAMES
     
     # Generate itinerary steps
-    num_steps = random.randint(3, 5)
+    num_steps = rng.randint(3, 5)
     itinerary = []
     
     for i in range(num_steps):
       if i == 0:  # First step - start on highway
-        highway = random.choice(interstate_highways + us_highways + state_routes)
-        direction = random.choice(['North', 'South', 'East', 'West'])
-        distance = round(random.uniform(5.2, 45.8), 1)
+        highway = rng.choice(interstate_highways + us_highways + state_routes)
+        direction = rng.choice(['North', 'South', 'East', 'West'])
+        distance = round(rng.uniform(5.2, 45.8), 1)
         step = f"Take {highway} {direction} for {distance} km"
         itinerary.append({
           'type': 'highway',
@@ -1065,9 +1001,9 @@ class Road(Problem):
         })
         
       elif i == num_steps - 1:  # Last step - destination
-        street = random.choice(street_names)
-        distance = round(random.uniform(0.3, 2.1), 1)
-        turn_direction = random.choice(['left', 'right'])
+        street = rng.choice(street_names)
+        distance = round(rng.uniform(0.3, 2.1), 1)
+        turn_direction = rng.choice(['left', 'right'])
         step = f"Turn {turn_direction} on {street}, destination in {distance} km"
         itinerary.append({
           'type': 'destination',
@@ -1078,10 +1014,10 @@ class Road(Problem):
         })
         
       else:  # Middle steps - exits and turns
-        if random.random() < 0.6:  # Highway exit
-          exit_num = random.randint(1, 99)
-          street = random.choice(street_names)
-          distance = round(random.uniform(1.2, 8.7), 1)
+        if rng.random() < 0.6:  # Highway exit
+          exit_num = rng.randint(1, 99)
+          street = rng.choice(street_names)
+          distance = round(rng.uniform(1.2, 8.7), 1)
           step = f"Take Exit {exit_num} for {street}, continue {distance} km"
           itinerary.append({
             'type': 'exit',
@@ -1091,9 +1027,9 @@ class Road(Problem):
             'text': step
           })
         else:  # Street turn
-          street = random.choice(street_names)
-          turn_direction = random.choice(['left', 'right', 'straight'])
-          distance = round(random.uniform(0.8, 6.3), 1)
+          street = rng.choice(street_names)
+          turn_direction = rng.choice(['left', 'right', 'straight'])
+          distance = round(rng.uniform(0.8, 6.3), 1)
           if turn_direction == 'straight':
             step = f"Continue straight on {street} for {distance} km"
           else:
@@ -1110,7 +1046,7 @@ class Road(Problem):
     full_itinerary = '\n'.join([step['text'] for step in itinerary])
     
     # Choose what to ask for
-    step_to_ask = random.choice(itinerary)
+    step_to_ask = rng.choice(itinerary)
     step_index = itinerary.index(step_to_ask) + 1
     
     if step_to_ask['type'] == 'highway':
@@ -1138,31 +1074,32 @@ class Road(Problem):
         ('distance', str(step_to_ask['distance']), 'Distance to destination (km)?')
       ]
     
-    question_type, answer, prompt = random.choice(questions)
+    question_type, answer, prompt = rng.choice(questions)
     
     return Problem(cls.display_name(), full_itinerary, prompt, answer, 6000, 'multiline')
 
 
 class TimeDuration(Problem):
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
     """Generate time duration calculation problems"""
+    rng = rng or random
     
     # Generate random times
-    start_hour = random.randint(0, 23)
-    start_minute = random.randint(0, 59)
-    end_hour = random.randint(0, 23)
-    end_minute = random.randint(0, 59)
+    start_hour = rng.randint(0, 23)
+    start_minute = rng.randint(0, 59)
+    end_hour = rng.randint(0, 23)
+    end_minute = rng.randint(0, 59)
     
     # Ensure end time is after start time (within same day)
     if end_hour < start_hour or (end_hour == start_hour and end_minute <= start_minute):
-      end_hour = start_hour + random.randint(1, 8)  # Add 1-8 hours
+      end_hour = start_hour + rng.randint(1, 8)  # Add 1-8 hours
       if end_hour >= 24:
         end_hour = 23
         if start_minute >= 59:
           end_minute = 59
         else:
-          end_minute = random.randint(start_minute + 1, 59)
+          end_minute = rng.randint(start_minute + 1, 59)
     
     # Format times
     start_time = f"{start_hour:02d}:{start_minute:02d}"
@@ -1176,7 +1113,7 @@ class TimeDuration(Problem):
     duration_mins = duration_minutes % 60
     
     # Choose what to ask for
-    question_type = random.choice(['duration', 'start_time', 'end_time'])
+    question_type = rng.choice(['duration', 'start_time', 'end_time'])
     
     if question_type == 'duration':
       memorize = f"Start: {start_time} | End: {end_time}"
@@ -1196,47 +1133,15 @@ class TimeDuration(Problem):
 
 class ChemicalFormula(Problem):
   @classmethod
-  def create(cls, **kwargs):
+  def create(cls, rng=None, **kwargs):
     """Generate chemical formula memorization problems"""
-    
-    # Common chemical formulas with names
-    formulas = {
-      'H2O': 'Water',
-      'CO2': 'Carbon Dioxide',
-      'NaCl': 'Sodium Chloride',
-      'H2SO4': 'Sulfuric Acid',
-      'NaOH': 'Sodium Hydroxide',
-      'HCl': 'Hydrochloric Acid',
-      'NH3': 'Ammonia',
-      'CH4': 'Methane',
-      'C6H12O6': 'Glucose',
-      'CaCO3': 'Calcium Carbonate',
-      'Fe2O3': 'Iron Oxide',
-      'Al2O3': 'Aluminum Oxide',
-      'HNO3': 'Nitric Acid',
-      'H3PO4': 'Phosphoric Acid',
-      'KOH': 'Potassium Hydroxide',
-      'MgO': 'Magnesium Oxide',
-      'CuSO4': 'Copper Sulfate',
-      'AgNO3': 'Silver Nitrate',
-      'ZnCl2': 'Zinc Chloride',
-      'Pb(NO3)2': 'Lead Nitrate',
-      'FeCl3': 'Iron Chloride',
-      'CaCl2': 'Calcium Chloride',
-      'Na2CO3': 'Sodium Carbonate',
-      'K2CO3': 'Potassium Carbonate',
-      'LiOH': 'Lithium Hydroxide',
-      'BaSO4': 'Barium Sulfate',
-      'SrCl2': 'Strontium Chloride',
-      'CsF': 'Cesium Fluoride',
-      'RbBr': 'Rubidium Bromide'
-    }
+    rng = rng or random
     
     # Choose a formula
-    formula, name = random.choice(list(formulas.items()))
+    formula, name, elements = rng.choice(content.CHEMICAL_FORMULAS)
     
     # Choose what to ask for
-    question_type = random.choice(['formula', 'name', 'elements'])
+    question_type = rng.choice(['formula', 'name', 'elements'])
     
     if question_type == 'formula':
       memorize = f"Chemical: {name}"
@@ -1247,24 +1152,6 @@ class ChemicalFormula(Problem):
       prompt = "Chemical name?"
       solution = name
     else:  # elements
-      # Extract elements from formula (simplified)
-      elements = []
-      current = ""
-      for char in formula:
-        if char.isupper():
-          if current:
-            elements.append(current)
-          current = char
-        elif char.islower():
-          current += char
-        elif char.isdigit() or char in '()':
-          continue  # Skip numbers and parentheses for element count
-      if current:
-        elements.append(current)
-      
-      # Remove duplicates and sort
-      elements = sorted(list(set(elements)))
-      
       memorize = f"Formula: {formula}"
       prompt = "Elements (space separated)?"
       solution = " ".join(elements)
@@ -1275,14 +1162,17 @@ class ChemicalFormula(Problem):
 class NBack(Problem):
     """N-back: was the item at position P the same as P-N?"""
 
+    scorer = YesNo()
+
     @classmethod
-    def create(cls, n_back=1, seq_length=8, **kwargs):
+    def create(cls, n_back=1, seq_length=8, rng=None, **kwargs):
+        rng = rng or random
         alphabet = 'ABCDEFGHJKLMNPQRSTUVWXYZ'
-        seq = [random.choice(alphabet) for _ in range(seq_length)]
+        seq = [rng.choice(alphabet) for _ in range(seq_length)]
         
         # Balance matches to ~50%
-        is_match = random.random() < 0.5
-        ask_pos = random.randint(n_back + 1, seq_length)
+        is_match = rng.random() < 0.5
+        ask_pos = rng.randint(n_back + 1, seq_length)
         match_pos = ask_pos - n_back
         
         if is_match:
@@ -1290,36 +1180,29 @@ class NBack(Problem):
         else:
             # Ensure it's NOT a match
             while seq[ask_pos - 1] == seq[match_pos - 1]:
-                seq[ask_pos - 1] = random.choice(alphabet)
+                seq[ask_pos - 1] = rng.choice(alphabet)
         
         solution = 'yes' if is_match else 'no'
         memorize = ' '.join(f'{i+1}:{s}' for i, s in enumerate(seq))
         prompt = f"Position {ask_pos} matches position {match_pos} ({n_back}-back)? (yes/no)"
         return NBack(cls.display_name(), memorize, prompt, solution, 4000, 'single line')
 
-    def evaluate_solution(self, user_input: str) -> float:
-        if user_input is None:
-            return 0.0
-        normalized = str(user_input).strip().lower()
-        if normalized in ('yes', 'y'):
-            return 1.0 if self.solution.lower() == 'yes' else 0.0
-        if normalized in ('no', 'n'):
-            return 1.0 if self.solution.lower() == 'no' else 0.0
-        return super().evaluate_solution(user_input)
-
 
 class Sternberg(Problem):
     """Sternberg: was this item in the set?"""
 
+    scorer = YesNo()
+
     @classmethod
-    def create(cls, set_size=5, **kwargs):
+    def create(cls, set_size=5, rng=None, **kwargs):
+        rng = rng or random
         alphabet = 'ABCDEFGHJKLMNPQRSTUVWXYZ'
         pool = list(alphabet)
         set_size = min(set_size, len(pool) - 1)
-        random.shuffle(pool)
+        rng.shuffle(pool)
         memory_set = pool[:set_size]
         non_members = pool[set_size:]
-        probe = random.choice(memory_set) if random.random() < 0.5 else random.choice(non_members)
+        probe = rng.choice(memory_set) if rng.random() < 0.5 else rng.choice(non_members)
         in_set = probe in memory_set
         solution = 'yes' if in_set else 'no'
 
@@ -1327,66 +1210,40 @@ class Sternberg(Problem):
         prompt = f"Was '{probe}' in the set? (yes/no)"
         return Sternberg(cls.display_name(), memorize, prompt, solution, 3500, 'single line')
 
-    def evaluate_solution(self, user_input: str) -> float:
-        if user_input is None:
-            return 0.0
-        normalized = str(user_input).strip().lower()
-        if normalized in ('yes', 'y'):
-            return 1.0 if self.solution.lower() == 'yes' else 0.0
-        if normalized in ('no', 'n'):
-            return 1.0 if self.solution.lower() == 'no' else 0.0
-        return super().evaluate_solution(user_input)
-
 
 class MatrixMemory(Problem):
-    """Spatial grid: which cell was marked?"""
+    """Spatial grid: which cells were marked?"""
+
+    scorer = CellSet()
 
     @classmethod
-    def create(cls, grid_size=3, num_marked=1, **kwargs):
-        cells = [(r, c) for r in range(grid_size) for c in range(grid_size)]
-        # Mark only 1 cell to avoid ambiguity in "recall which cell was marked"
-        marked_cell = random.choice(cells)
-
-        rows = []
-        for r in range(grid_size):
-            row = []
-            for c in range(grid_size):
-                row.append('X' if (r, c) == marked_cell else '.')
-            rows.append(' '.join(row))
-        memorize = '\n'.join(rows)
-
-        col_letter = chr(ord('A') + marked_cell[1])
-        row_num = marked_cell[0] + 1
-        prompt = "Which cell was marked? (e.g. A1)"
-        solution = f"{col_letter}{row_num}"
-        return MatrixMemory(cls.display_name(), memorize, prompt, solution, 3000, 'matrix')
-
-    def evaluate_solution(self, user_input: str) -> float:
-        if user_input is None:
-            return 0.0
-        normalized = unidecode(str(user_input).strip().upper().replace(' ', ''))
-        sol = self.solution.upper()
-        if normalized == sol:
-            return 1.0
-        if len(normalized) >= 2 and len(sol) >= 2:
-            if normalized == sol or normalized == sol[1] + sol[0]:
-                return 1.0
-        return super().evaluate_solution(user_input)
+    def create(cls, grid_size=3, num_marked=1, rng=None, **kwargs):
+        rng = rng or random
+        board = bitboard.random_board(grid_size, num_marked, rng)
+        memorize = bitboard.render(board, grid_size)
+        if num_marked == 1:
+            prompt = "Which cell was marked? (e.g. A1)"
+        else:
+            prompt = f"Which {num_marked} cells were marked? (e.g. A1 C3)"
+        solution = ' '.join(bitboard.cell_names(board, grid_size))
+        exposure_ms = 3000 + 500 * (num_marked - 1)
+        return MatrixMemory(cls.display_name(), memorize, prompt, solution, exposure_ms, 'matrix')
 
 
 class ShoppingList(Problem):
     """Shopping list with quantities."""
 
     @classmethod
-    def create(cls, num_items=4, **kwargs):
-        wlist = _pick_word_list(num_items)
-        sample = random.sample(wlist, num_items)
+    def create(cls, num_items=4, rng=None, **kwargs):
+        rng = rng or random
+        wlist = _pick_word_list(num_items, rng)
+        sample = rng.sample(wlist, num_items)
         # Ensure unique quantities to avoid ambiguity in reverse lookup
-        quantities = random.sample(range(1, 10), num_items)
+        quantities = rng.sample(range(1, 10), num_items)
         pairs = list(zip(quantities, sample))
         memorize = '  '.join(f'{q} {w}' for q, w in pairs)
-        chosen = random.randint(0, num_items - 1)
-        if random.random() < 0.5:
+        chosen = rng.randint(0, num_items - 1)
+        if rng.random() < 0.5:
             prompt = f"Quantity of {pairs[chosen][1]}?"
             solution = str(pairs[chosen][0])
         else:
@@ -1396,15 +1253,21 @@ class ShoppingList(Problem):
 
 
 class ColorSequence(Problem):
-    """Remember a sequence of colors (R=red, G=green, B=blue, Y=yellow)."""
+    """Remember a sequence of colors (R=red, G=green, B=blue, Y=yellow).
+
+    Colors may be answered by name, and a full sequence without spaces ("rgby").
+    """
+
+    scorer = TokenAligned(aliases={'red': 'r', 'green': 'g', 'blue': 'b', 'yellow': 'y'}, run_alphabet='rgby')
 
     @classmethod
-    def create(cls, seq_length=5, **kwargs):
+    def create(cls, seq_length=5, rng=None, **kwargs):
+        rng = rng or random
         colors = ['R', 'G', 'B', 'Y']
-        seq = [random.choice(colors) for _ in range(seq_length)]
+        seq = [rng.choice(colors) for _ in range(seq_length)]
         memorize = ' '.join(seq)
-        if random.random() < 0.5:
-            ask_pos = random.randint(1, seq_length)
+        if rng.random() < 0.5:
+            ask_pos = rng.randint(1, seq_length)
             prompt = f"Color at position {ask_pos}?"
             solution = seq[ask_pos - 1]
         else:
@@ -1412,25 +1275,16 @@ class ColorSequence(Problem):
             solution = ' '.join(seq)
         return ColorSequence(cls.display_name(), memorize, prompt, solution, 3000, 'single line')
 
-    def evaluate_solution(self, user_input: str) -> float:
-        if user_input is None:
-            return 0.0
-        normalized = str(user_input).strip().lower()
-        color_map = {'red': 'r', 'green': 'g', 'blue': 'b', 'yellow': 'y'}
-        
-        # If solution is a single color (like 'R'), allow full name
-        if len(self.solution) == 1:
-            sol_normalized = self.solution.lower()
-            if normalized == sol_normalized or color_map.get(normalized) == sol_normalized:
-                return 1.0
-        
-        return super().evaluate_solution(user_input)
-
 
 class SentenceCompletion(Problem):
     """Memorize a headline, recall the missing word."""
 
-    _used_sentences: set[str] = set()
+    heavy = 'io'
+    reproducible = False
+
+    # Replaced (never mutated) under _used_lock, so readers always see a complete frozenset.
+    _used_sentences: frozenset[str] = frozenset()
+    _used_lock = threading.Lock()
 
     _fallback_templates = [
         ("The cat sat on the ___", "mat"),
@@ -1443,38 +1297,50 @@ class SentenceCompletion(Problem):
     ]
 
     @classmethod
-    def create(cls, **kwargs):
+    def create(cls, rng=None, **kwargs):
+        rng = rng or random
         headlines = fetch_gnews_headlines(topic="general", max_items=10)
         if headlines:
-            unused = [h for h in headlines if h not in cls._used_sentences]
-            if unused:
-                sentence = random.choice(unused)
-                cls._used_sentences.add(sentence)
+            sentence = cls._claim_unused(headlines, rng)
+            if sentence is not None:
                 words_list = [w for w in sentence.split() if len(w) >= 2 and sum(c.isalpha() for c in w) >= 2]
                 if len(words_list) >= 3:
-                    use_two_words = len(words_list) >= 4 and random.random() < 0.3
+                    use_two_words = len(words_list) >= 4 and rng.random() < 0.3
                     if use_two_words:
-                        i = random.randint(0, len(words_list) - 2)
+                        i = rng.randint(0, len(words_list) - 2)
                         w1, w2 = words_list[i], words_list[i + 1]
                         solution = f"{w1} {w2}"
                         pattern = re.escape(w1) + r"\s+" + re.escape(w2)
                         prompt = re.sub(pattern, "___", sentence, count=1)
                     else:
-                        solution = random.choice(words_list)
+                        solution = rng.choice(words_list)
                         prompt = sentence.replace(solution, "___", 1)
                     if "___" in prompt and solution:
                         return Problem(cls.display_name(), sentence, prompt, solution, 4000, 'single line')
-        sentence_tpl, word = random.choice(SentenceCompletion._fallback_templates)
+        sentence_tpl, word = rng.choice(SentenceCompletion._fallback_templates)
         memorize = sentence_tpl.replace("___", word)
         return Problem(cls.display_name(), memorize, sentence_tpl, word, 4000, 'single line')
 
+    @classmethod
+    def _claim_unused(cls, headlines: list[str], rng=None) -> str | None:
+        """Pick a headline not used before and mark it used; None if all were used."""
+        with SentenceCompletion._used_lock:
+            used = SentenceCompletion._used_sentences
+            unused = [h for h in headlines if h not in used]
+            if not unused:
+                return None
+            sentence = (rng or random).choice(unused)
+            SentenceCompletion._used_sentences = used | {sentence}
+            return sentence
+
 
 class NumberBackward(Problem):
     """Digit span backward: recall digits in reverse order."""
 
     @classmethod
-    def create(cls, number_length=6, **kwargs):
-        memorize = rnd_number(number_length)
+    def create(cls, number_length=6, rng=None, **kwargs):
+        rng = rng or random
+        memorize = rnd_number(number_length, rng)
         solution = memorize[::-1]
         return Problem(cls.display_name(), memorize, '<', solution, 3500, 'single line')
 
@@ -1483,19 +1349,32 @@ class NameAttributePairs(Problem):
     """Name:City or Name:Profession pairs."""
 
     @classmethod
-    def create(cls, num_pairs=3, **kwargs):
-        wlist = _pick_word_list(2 * num_pairs)
-        words_pool = random.sample(wlist, 2 * num_pairs)
+    def create(cls, num_pairs=3, rng=None, **kwargs):
+        rng = rng or random
+        wlist = _pick_word_list(2 * num_pairs, rng)
+        words_pool = sample_distinct(wlist, 2 * num_pairs, rng=rng)
         names = words_pool[:num_pairs]
         attrs = words_pool[num_pairs:]
         pairs = list(zip(names, attrs))
         memorize = '  '.join(f'{n}:{a}' for n, a in pairs)
-        chosen = random.randint(0, num_pairs - 1)
+        chosen = rng.randint(0, num_pairs - 1)
         prompt = f"? {pairs[chosen][0]}"
         solution = pairs[chosen][1]
         return Problem(cls.display_name(), memorize, prompt, solution, 4000, 'matrix')
 
 
+class Pseudoword(Problem):
+    """Pronounceable non-word drawn from a language's character n-grams."""
+
+    @classmethod
+    def create(cls, length=None, language=None, rng=None, **kwargs):
+        rng = rng or random
+        length = length or rng.randint(5, 8)
+        language = language or rng.choice(sorted(LANGUAGES))
+        memorize = pseudoword(length, language, rng)
+        return Problem(cls.display_name(), memorize, '>', memorize, 2000, 'single line')
+
+
 def create_problems_dict():
   """Automatically discover all Problem subclasses and assign equal probability"""
   import inspect
@@ -1516,4 +1395,28 @@ def create_problems_dict():
     equal_prob = 1.0 / len(problem_classes)
     return {cls: equal_prob for cls in problem_classes}
   else:
-    return {}
\ No newline at end of file
+    return {}
+
+
+def create_seeded(cls, seed=None, **params):
+  """Create a problem from a dedicated seed so it can be rebuilt from (class, params, seed).
+
+  The generator draws only from its own random.Random(seed), passed as
+  create(rng=...), so other threads using the random module cannot change
+  what the seed produces. The origin is kept on the problem as `_origin` for
+  compact record storage.
+  """
+  if seed is None:
+    seed = random.getrandbits(32)
+  problem = cls.create(rng=random.Random(seed), **params)
+  problem._origin = {'generator': cls.__name__, 'params': dict(params), 'seed': seed}
+  return problem
+
+
+def regenerate(generator, params, seed):
+  """Rebuild a problem created by create_seeded(); None if the generator no longer exists."""
+  classes = {cls.__name__: cls for cls in create_problems_dict()}
+  cls = classes.get(generator)
+  if cls is None:
+    return None
+  return create_seeded(cls, seed, **(params or {}))
@@ -0,0 +1,154 @@
+"""Pronounceable pseudowords from character n-gram models of the dictionaries.
+
+Each language model is trained once, on first use, from its word list in
+dicts/. For every context of up to ORDER - 1 preceding characters it keeps
+the observed next characters as a string plus an array of cumulative counts,
+so drawing a character is one random number and a bisect over at most the
+alphabet. Unseen contexts back off to shorter ones when the model is built.
+The last character is drawn from a separate table of word-final transitions,
+so pseudowords of any length end the way words of the language do.
+"""
+
+import random
+import threading
+from array import array
+from bisect import bisect_right
+from collections import Counter, defaultdict
+
+from normalize import SHARP_S_TABLE
+from utils import _dict_path
+
+ORDER = 3
+_START = '^'
+
+LANGUAGES = {
+    'english': 'common_english_words.txt',
+    'french': 'common_french_words.txt',
+    'german': 'german_words.txt',
+}
+
+
+def _read_words(language: str) -> list[str]:
+    """Training words for language, normalized like utils.load_dicts (without the length filter)."""
+    with open(_dict_path(LANGUAGES[language]), encoding='utf-8') as f:
+        words = [w.strip().lower() for w in f if w.strip().isalpha()]
+    if language == 'german':
+        words = [w.translate(SHARP_S_TABLE) for w in words]
+    return words
+
+
+def _compile(counts: dict[str, Counter]) -> dict[str, tuple[str, array]]:
+    tables = {}
+    for context, counter in counts.items():
+        symbols = ''.join(sorted(counter))
+        cumulative = array('I')
+        total = 0
+        for symbol in symbols:
+            total += counter[symbol]
+            cumulative.append(total)
+        tables[context] = (symbols, cumulative)
+    return tables
+
+
+class NgramModel:
+    """Character n-gram model with separate tables for inner and word-final characters.
+
+    Contexts are compiled into numbered states. Each state's inner entry holds
+    the candidate characters, their cumulative counts and the state reached
+    after each character, so generation never builds or hashes context strings.
+    """
+
+    def __init__(self, words, order: int = ORDER):
+        if order < 1:
+            raise ValueError("order must be at least 1")
+        self.order = order
+        self.vocabulary = frozenset(words)
+        if not self.vocabulary:
+            raise ValueError("no training words")
+        inner: dict[str, Counter] = defaultdict(Counter)
+        final: dict[str, Counter] = defaultdict(Counter)
+        pad = _START * (order - 1)
+        for word in self.vocabulary:
+            padded = pad + word
+            last = len(word) - 1
+            for i, char in enumerate(word):
+                context = padded[i:i + order - 1]
+                counts = final if i == last else inner
+                for k in range(len(context) + 1):
+                    counts[context[k:]][char] += 1
+        self._compile_states(_compile(inner), _compile(final))
+
+    def _compile_states(self, inner: dict, final: dict) -> None:
+        def resolve(tables, context):
+            for k in range(len(context) + 1):
+                table = tables.get(context[k:])
+                if table is not None:
+                    return table
+            return final['']  # every word has a final character; inner may be empty
+
+        width = self.order - 1
+        ids = {_START * width: 0}
+        contexts = [_START * width]
+        self._inner_states: list[tuple[str, array, int, list[int]]] = []
+        self._final_states: list[tuple[str, array, int]] = []
+        for context in contexts:  # grows while new contexts are reached
+            symbols, cumulative = resolve(inner, context)
+            next_ids = []
+            for char in symbols:
+                following = (context + char)[len(context) + 1 - width:] if width else ''
+                if following not in ids:
+                    ids[following] = len(contexts)
+                    contexts.append(following)
+                next_ids.append(ids[following])
+            self._inner_states.append((symbols, cumulative, cumulative[-1], next_ids))
+            symbols, cumulative = resolve(final, context)
+            self._final_states.append((symbols, cumulative, cumulative[-1]))
+
+    def generate(self, length: int, rng=None) -> str:
+        """One string of exactly `length` characters drawn from the model."""
+        if length <= 0:
+            raise ValueError("length must be positive")
+        rand = (rng or random).random
+        inner = self._inner_states
+        state = 0
+        chars = []
+        for _ in range(length - 1):
+            symbols, cumulative, total, next_ids = inner[state]
+            j = bisect_right(cumulative, rand() * total)
+            chars.append(symbols[j])
+            state = next_ids[j]
+        symbols, cumulative, total = self._final_states[state]
+        chars.append(symbols[bisect_right(cumulative, rand() * total)])
+        return ''.join(chars)
+
+    def pseudoword(self, length: int, rng=None, max_tries: int = 20) -> str:
+        """Like generate(), but redrawn while the result is a real word of the training set."""
+        word = self.generate(length, rng)
+        for _ in range(max_tries):
+            if word not in self.vocabulary:
+                break
+            word = self.generate(length, rng)
+        return word
+
+
+_models: dict[str, NgramModel] = {}
+_models_lock = threading.Lock()
+
+
+def model_for(language: str) -> NgramModel:
+    """The trained model for language, built on first use and kept for the process."""
+    if language not in LANGUAGES:
+        raise ValueError(f"unknown language {language!r}; expected one of {sorted(LANGUAGES)}")
+    model = _models.get(language)
+    if model is None:
+        with _models_lock:
+            model = _models.get(language)
+            if model is None:
+                model = NgramModel(_read_words(language))
+                _models[language] = model
+    return model
+
+
+def pseudoword(length: int, language: str = 'english', rng=None) -> str:
+    """A pronounceable non-word of `length` characters in the style of language."""
+    return model_for(language).pseudoword(length, rng)
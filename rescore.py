@@ -0,0 +1,200 @@
+"""Recompute stored scores with the current scorers, one session at a time.
+
+    python rescore.py                      # rewrite the default sessions file
+    python rescore.py old.json.gzip -o new.json.gzip -j 4
+
+Every record is scored again by the scorer its problem type declares today
+(scoring.problem_class), and its 'score' and 'correct' fields are updated;
+session totals follow. Everything else, including compact problems, is
+written back unchanged and in the same key order.
+
+The input is read line by line and the output goes through a streaming gzip
+writer, so memory stays constant whatever the history size. Sessions are
+rescored by a process pool with a bounded number in flight, and written in
+their original order. Without --output the input file is replaced only once
+the new one is complete.
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from batch_scoring import evaluate_many
+from classes import Problem
+from scoring import problem_class
+from sessions import _GZIP_MAGIC, _SESSIONS_FILE, expand_problem
+
+# Sessions submitted per worker before the oldest result is waited for.
+IN_FLIGHT_PER_WORKER = 8
+_STATS = ('sessions', 'records', 'changed', 'flipped', 'skipped')
+
+
+def _rebuild(problem_data: dict):
+    """The stored problem as an instance of its current class, or None if it cannot be rebuilt."""
+    full = expand_problem(problem_data)
+    if full.get('stale'):
+        return None
+    fields = {k: v for k, v in full.items() if k in Problem.__dataclass_fields__}
+    cls = problem_class(fields.get('name', ''))
+    # Stream records (streaming N-back) are scored by signal detection, not by a Scorer.
+    if cls is None or fields.get('problem_type') == 'stream':
+        return None
+    try:
+        return cls(**fields)
+    except (TypeError, ValueError):
+        return None
+
+
+def rescore_session(session: dict) -> dict:
+    """Rescore session's records in place; returns counts for the report.
+
+    Records whose problem cannot be rebuilt (stale compact entries, missing
+    fields, types with no problem class, stream records) keep their stored
+    score and are counted as skipped.
+    """
+    stats = dict.fromkeys(_STATS, 0)
+    stats['sessions'] = 1
+    records = session.get('records', [])
+    todo = []
+    for record in records:
+        stats['records'] += 1
+        problem = _rebuild(record.get('problem') or {})
+        if problem is None or not isinstance(record.get('response'), str):
+            stats['skipped'] += 1
+        else:
+            todo.append((record, problem))
+    scores = evaluate_many([problem for _, problem in todo], [record['response'] for record, _ in todo])
+    for (record, _), score in zip(todo, scores):
+        correct = score >= 1.0
+        if record.get('score') != score:
+            stats['changed'] += 1
+        if record.get('correct') != correct:
+            stats['flipped'] += 1
+        record['score'] = score
+        record['correct'] = correct
+        if correct:
+            record.pop('miss', None)  # only wrong answers are classified
+    if records and session.get('total_questions') == len(records):
+        correct_answers = sum(1 for record in records if record.get('correct'))
+        session['correct_answers'] = correct_answers
+        session['score_percentage'] = round(correct_answers / len(records) * 100, 1)
+    return stats
+
+
+def rescore_line(line: str) -> tuple[str, dict]:
+    """rescore_session() over one stored JSON line; returns the new line and its counts."""
+    session = json.loads(line)
+    stats = rescore_session(session)
+    return json.dumps(session, ensure_ascii=False), stats
+
+
+def _lines(raw):
+    """Non-empty lines of an open binary sessions file, gzip or plain."""
+    text = gzip.GzipFile(fileobj=raw) if raw.peek(2)[:2] == _GZIP_MAGIC else raw
+    reader = io.TextIOWrapper(text, encoding='utf-8')
+    try:
+        for line in reader:
+            line = line.strip()
+            if line:
+                yield line
+    finally:
+        reader.detach()  # raw stays open: the caller still reads its position
+
+
+def _rescored(lines, workers: int | None):
+    """(new line, counts) for each line, in order; at most a few sessions per worker in flight."""
+    if workers == 1:
+        yield from map(rescore_line, lines)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        limit = IN_FLIGHT_PER_WORKER * (workers or os.cpu_count() or 1)
+        pending = deque()
+        for line in lines:
+            pending.append(pool.submit(rescore_line, line))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def rescore_file(source, output=None, workers: int | None = None, progress=None, dry_run: bool = False) -> dict:
+    """Rescore every session of source into output (default: replace source).
+
+    progress, if given, is called after each session with the running counts
+    and the fraction of the input read so far. With dry_run nothing is written.
+    """
+    source = Path(source)
+    target = Path(output) if output is not None else source
+    totals = dict.fromkeys(_STATS, 0)
+    t0 = time.perf_counter()
+    size = source.stat().st_size or 1
+    tmp = target.with_name(target.name + '.tmp')
+    with open(source, 'rb') as file:
+        writer = None if dry_run else gzip.open(tmp, 'wt', encoding='utf-8', compresslevel=9)
+        try:
+            for line, stats in _rescored(_lines(file), workers):
+                if writer is not None:
+                    writer.write(line + '\n')
+                for key in _STATS:
+                    totals[key] += stats[key]
+                if progress is not None:
+                    progress(totals, min(1.0, file.tell() / size))
+        except BaseException:
+            if writer is not None:
+                writer.close()
+                tmp.unlink(missing_ok=True)
+            raise
+    if writer is not None:
+        writer.close()
+        os.replace(tmp, target)
+    totals['seconds'] = round(time.perf_counter() - t0, 3)
+    return totals
+
+
+def format_report(totals: dict) -> str:
+    return (f"Rescored {totals['records']} records in {totals['sessions']} sessions "
+            f"in {totals['seconds']:.1f}s: {totals['changed']} scores changed, "
+            f"{totals['flipped']} correct flags flipped, {totals['skipped']} skipped")
+
+
+def _print_progress(totals: dict, fraction: float) -> None:
+    print(f"\r{fraction:6.1%}  {totals['sessions']} sessions, {totals['records']} records, "
+          f"{totals['changed']} changed", end='', file=sys.stderr, flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Recompute stored scores with the current scorers")
+    parser.add_argument("sessions", nargs="?", default=str(_SESSIONS_FILE),
+                        help="Sessions file to rescore (default: the trainer's history)")
+    parser.add_argument("-o", "--output", help="Write here instead of replacing the input")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    parser.add_argument("-q", "--quiet", action="store_true", help="No progress line")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.workers is not None and args.workers <= 0:
+        print("Error: --workers must be positive", file=sys.stderr)
+        return 2
+    if not Path(args.sessions).exists():
+        print(f"Error: no sessions file at {args.sessions}", file=sys.stderr)
+        return 1
+    totals = rescore_file(args.sessions, args.output, args.workers,
+                          progress=None if args.quiet else _print_progress, dry_run=args.dry_run)
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(format_report(totals))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
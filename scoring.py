@@ -0,0 +1,192 @@
+"""Scorers: how an answer is compared with a problem's solution.
+
+Every problem class declares one scorer instance as a class attribute
+(`scorer = YesNo()`); Problem.evaluate_solution delegates to it. A scorer
+splits the work in two:
+
+- prepare(problem) compiles the solution side once, when the problem is
+  constructed (stored as problem._prepared);
+- score(problem, user_input) does only the user side, per answer.
+
+score_many() scores a batch of problems sharing the scorer; EditDistance
+overrides it with the vectorized batch_scoring path. problem_class(name)
+and scorer_for(name) find the class and scorer of a saved problem type;
+scorers read the prepared solution, so stored records are rebuilt as
+problems of that class before they are re-scored (rescore.py).
+"""
+
+import threading
+
+import bitboard
+from alignment import ItemMatcher, token_score, tokenize
+from normalize import fold, normalize
+from utils import levenshtein_distance, osa_distance
+
+
+class Scorer:
+    """Base scorer; subclasses implement score() and, if useful, prepare()."""
+
+    def prepare(self, problem):
+        """Solution-side state for score(), computed once per problem."""
+        return None
+
+    def score(self, problem, user_input) -> float:
+        raise NotImplementedError
+
+    def score_many(self, problems, responses) -> list[float]:
+        return [self.score(problem, response) for problem, response in zip(problems, responses)]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+def edit_distance_score(normalized_solution: str, user_input, distance=levenshtein_distance) -> float:
+    """1 - distance / longer length, after normalizing user_input (Levenshtein by default)."""
+    if user_input is None:
+        return 0.0
+    normalized_user = normalize(user_input)
+    if normalized_user == normalized_solution:
+        return 1.0
+    max_length = max(len(normalized_user), len(normalized_solution))
+    if max_length == 0:
+        return 1.0
+    return max(0.0, 1.0 - (distance(normalized_user, normalized_solution) / max_length))
+
+
+class EditDistance(Scorer):
+    """Character-level closeness of the whole answer (the default).
+
+    With transpositions, two swapped adjacent characters cost one edit
+    (utils.osa_distance), for answers recalled character by character.
+    """
+
+    def __init__(self, transpositions: bool = False):
+        self.transpositions = transpositions
+        self._distance = osa_distance if transpositions else levenshtein_distance
+
+    def score(self, problem, user_input) -> float:
+        return edit_distance_score(problem._normalized_solution, user_input, self._distance)
+
+    def score_many(self, problems, responses) -> list[float]:
+        from batch_scoring import score_many
+        return score_many([(problem.solution, response) for problem, response in zip(problems, responses)],
+                          self.transpositions)
+
+    def __repr__(self) -> str:
+        return "EditDistance(transpositions=True)" if self.transpositions else "EditDistance()"
+
+
+class YesNo(Scorer):
+    """yes/y and no/n against a 'yes' or 'no' solution; other text falls back to edit distance."""
+
+    _ANSWERS = {'yes': 'yes', 'y': 'yes', 'no': 'no', 'n': 'no'}
+
+    def score(self, problem, user_input) -> float:
+        if user_input is None:
+            return 0.0
+        answer = self._ANSWERS.get(str(user_input).strip().lower())
+        if answer is not None:
+            return 1.0 if problem._normalized_solution == answer else 0.0
+        return edit_distance_score(problem._normalized_solution, user_input)
+
+
+class Numeric(Scorer):
+    """Equal values score 1.0 however they are written ('12', '12.0', '+12'); else edit distance."""
+
+    @staticmethod
+    def _value(text: str):
+        try:
+            return float(text.replace(' ', '').replace(',', '.'))
+        except ValueError:
+            return None
+
+    def prepare(self, problem):
+        return self._value(problem._normalized_solution)
+
+    def score(self, problem, user_input) -> float:
+        if user_input is None:
+            return 0.0
+        if problem._prepared is not None and self._value(normalize(user_input)) == problem._prepared:
+            return 1.0
+        return edit_distance_score(problem._normalized_solution, user_input)
+
+
+class CellSet(Scorer):
+    """Grid cells named in the answer vs. the solution's cells, as a Jaccard index (bitboard)."""
+
+    def prepare(self, problem):
+        size = len(problem.memorize.splitlines())
+        board, _ = bitboard.parse_cells(problem.solution, size)
+        return size, board
+
+    def score(self, problem, user_input) -> float:
+        if user_input is None:
+            return 0.0
+        size, board = problem._prepared
+        answer, off_grid = bitboard.parse_cells(fold(str(user_input)), size)
+        if not answer and not off_grid:
+            return edit_distance_score(problem._normalized_solution, user_input)
+        return bitboard.jaccard(board, answer, off_grid)
+
+
+class TokenAligned(Scorer):
+    """Item-by-item alignment of list answers (alignment.token_score).
+
+    aliases maps alternative spellings to items ('red' -> 'r'); with
+    run_alphabet, a single answer token made only of those characters is read
+    as one item per character ('rgby'). Otherwise an answer typed as one run
+    for a multi-item solution keeps the edit-distance score.
+    """
+
+    def __init__(self, aliases: dict | None = None, run_alphabet: str = ''):
+        self.aliases = dict(aliases or {})
+        self.run_alphabet = frozenset(run_alphabet)
+
+    def prepare(self, problem):
+        return ItemMatcher(tokenize(problem._normalized_solution))
+
+    def score(self, problem, user_input) -> float:
+        if user_input is None:
+            return 0.0
+        items = problem._prepared
+        answer = [self.aliases.get(token, token) for token in tokenize(normalize(user_input))]
+        if len(answer) == 1 < len(items) and self.run_alphabet and set(answer[0]) <= self.run_alphabet:
+            answer = list(answer[0])
+        if len(answer) <= 1 < len(items):
+            return edit_distance_score(problem._normalized_solution, user_input)
+        return token_score(answer, items.items, items)
+
+    def __repr__(self) -> str:
+        return f"TokenAligned(aliases={self.aliases!r}, run_alphabet={''.join(sorted(self.run_alphabet))!r})"
+
+
+DEFAULT = EditDistance()
+
+_by_name: dict[str, type] | None = None
+_by_name_lock = threading.Lock()
+
+
+def problem_class(name: str) -> type | None:
+    """Problem class saved under name (display or class name), or None if it no longer exists."""
+    global _by_name
+    if _by_name is None:
+        from problems import create_problems_dict
+        with _by_name_lock:
+            if _by_name is None:
+                # Filled locally and published in one assignment, so callers
+                # outside the lock never see a half-filled mapping.
+                by_name = {}
+                for cls in create_problems_dict():
+                    by_name[cls.__name__] = cls
+                    by_name[cls.display_name()] = cls
+                _by_name = by_name
+    return _by_name.get(name)
+
+
+def scorer_for(name: str) -> Scorer:
+    """Scorer of the problem type saved under name (display or class name).
+
+    Names of types that no longer exist get the default EditDistance.
+    """
+    cls = problem_class(name)
+    return DEFAULT if cls is None else cls.scorer
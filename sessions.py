@@ -1,12 +1,17 @@
 import gzip
 import json
+import re
 import statistics
 import sys
 import time
 import zlib
 from collections import defaultdict
+from collections.abc import Mapping
 from pathlib import Path
 
+from classes import Problem, Record
+from scoring import problem_class
+
 _GZIP_MAGIC = b'\x1f\x8b'
 
 
@@ -82,8 +87,142 @@ def format_score(total_questions, total_perfect, records, total_score=None, fina
   return "\n".join(lines)
 
 
+# Lines written by save_session_data() start each record with its problem name
+# and end it with response_ms, score and correct, so the fields statistics need
+# can be cut out of the raw text. An unescaped '"' never occurs inside a JSON
+# string, so these patterns cannot match inside stored answers, and each record
+# has exactly one "problem" and one "response_ms" key. The matches are used only
+# when every record gave one of each; anything else (another key order or
+# separators, a score that is not a number) is decoded with json.loads.
+_RECORDS_KEY = ', "records": ['
+_RECORD_NAME = re.compile(r'\{"problem": \{"name": "([^"\\]*(?:\\.[^"\\]*)*)"')
+_RECORD_TAIL = re.compile(
+    r'"response_ms": (-?\d+), "score": (-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?), "correct": (true|false)\}')
+
+
+class RecordView:
+    """The fields statistics read from one stored record; materialize() decodes the rest."""
+
+    __slots__ = ('name', 'score', 'correct', 'response_ms', '_session', '_index')
+
+    def __init__(self, name, score, correct, response_ms, session, index):
+        self.name = name
+        self.score = score  # None for records written before scores existed
+        self.correct = correct
+        self.response_ms = response_ms
+        self._session = session
+        self._index = index
+
+    @classmethod
+    def from_dict(cls, record: dict, session, index: int) -> 'RecordView':
+        problem_data = record.get('problem', {}) or {}
+        return cls(problem_data.get('name', 'unknown'), record.get('score'), record.get('correct', False),
+                   record.get('response_ms', 0), session, index)
+
+    def to_dict(self) -> dict:
+        """The stored record as decoded JSON."""
+        return self._session['records'][self._index]
+
+    def materialize(self) -> Record | None:
+        """Full Record with its Problem, or None if the problem cannot be rebuilt.
+
+        Compact problems are regenerated; stale ones (generator changed and no
+        payload copy to fall back to) give None. The problem is an instance of its current
+        class (scoring.problem_class), so it scores with that class's scorer.
+        """
+        data = self.to_dict()
+        problem_data = expand_problem(data.get('problem') or {})
+        if problem_data.get('stale'):
+            return None
+        fields = {k: v for k, v in problem_data.items() if k in Problem.__dataclass_fields__}
+        cls = problem_class(fields.get('name', '')) or Problem
+        try:
+            problem = cls(**fields)
+        except (TypeError, ValueError):
+            return None
+        score = data.get('score', 1.0 if data.get('correct') else 0.0)
+        return Record(problem, data.get('response', ''), data.get('response_ms', 0), score, data.get('miss'))
+
+
+class SessionView(Mapping):
+    """Read-only session over its raw JSON line, decoded only as far as it is used.
+
+    Header fields (date, totals, score) are parsed from the short prefix before
+    the records; record_views() extracts just the statistics fields. Anything
+    else, or a line not in save_session_data() layout, falls back to json.loads.
+    """
+
+    __slots__ = ('_line', '_header', '_data')
+
+    def __init__(self, line: str):
+        self._line = line
+        self._header = None
+        self._data = None
+
+    def _decoded(self) -> dict:
+        if self._data is None:
+            self._data = json.loads(self._line)
+            self._header = self._data
+            self._line = None
+        return self._data
+
+    def _header_fields(self) -> dict | None:
+        if self._header is None and self._line is not None:
+            cut = self._line.find(_RECORDS_KEY)
+            if cut < 0 or not self._line.endswith(']}'):
+                return None
+            self._header = json.loads(self._line[:cut] + '}')
+        return self._header
+
+    def __getitem__(self, key):
+        if key != 'records':
+            header = self._header_fields()
+            if header is not None:
+                return header[key]
+        return self._decoded()[key]
+
+    def __iter__(self):
+        return iter(self._decoded())
+
+    def __len__(self) -> int:
+        return len(self._decoded())
+
+    def record_views(self) -> list[RecordView]:
+        if self._data is None and self._header_fields() is not None:
+            records = self._line[self._line.find(_RECORDS_KEY):]
+            names = _RECORD_NAME.findall(records)
+            tails = _RECORD_TAIL.findall(records)
+            count = records.count('"problem": ')
+            if (len(names) == len(tails) == count == records.count('"response_ms": ')
+                    and (names or records == _RECORDS_KEY + ']}')):
+                return [
+                    RecordView(name if '\\' not in name else json.loads(f'"{name}"'),
+                               float(score), correct == 'true', int(ms), self, i)
+                    for i, (name, (ms, score, correct)) in enumerate(zip(names, tails))
+                ]
+        return _record_views(self._decoded())
+
+    def to_dict(self) -> dict:
+        return self._decoded()
+
+
+def _record_views(session) -> list[RecordView]:
+    """RecordViews for a SessionView or an already decoded session dict."""
+    if isinstance(session, SessionView):
+        return session.record_views()
+    return [RecordView.from_dict(r, session, i) for i, r in enumerate(session.get('records', []))]
+
+
+def _as_dict(session) -> dict:
+    return session.to_dict() if isinstance(session, SessionView) else session
+
+
 def _read_sessions(path: Path) -> list:
-    """Read sessions from file: gzip-compressed JSONL (one JSON object per line)."""
+    """Read sessions from file: gzip-compressed JSONL (one JSON object per line).
+
+    Returns a SessionView per line; nothing beyond the line split is decoded
+    until a field is accessed.
+    """
     if not path.exists():
         return []
     content = _read_file_content(path)
@@ -94,22 +233,94 @@ def _read_sessions(path: Path) -> list:
         line = line.strip()
         if not line:
             continue
-        sessions.append(json.loads(line))
+        sessions.append(SessionView(line))
     return sessions
 
 
-def save_session_data(test_date, start_time, total_questions, correct_answers, records):
-    """Append one session as a JSON line; file is stored gzip(JSONL)."""
+def _problem_checksum(problem_dict: dict) -> str:
+    """Stable short checksum of a problem's full content."""
+    payload = json.dumps(problem_dict, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return f"{zlib.crc32(payload):08x}"
+
+
+def _compact_problem(problem) -> dict:
+    """Seed form of a problem, or its full to_dict() if it cannot be rebuilt from the seed.
+
+    Only problems made by problems.create_seeded() carry an origin. The compact
+    form is verified by regenerating it before it is trusted. It also keeps the
+    other fields as 'payload', the fallback once the generator changes and
+    the seed no longer rebuilds the same problem. The payload is a plain
+    object so the file's gzip compresses it along with everything else.
+    """
+    full = problem.to_dict()
+    origin = getattr(problem, '_origin', None)
+    if origin is None or not getattr(problem, 'reproducible', True):
+        return full
+    from problems import regenerate  # imported lazily: problems loads the dictionaries
+    compact = {
+        'name': full['name'],
+        'generator': origin['generator'],
+        'params': origin['params'],
+        'seed': origin['seed'],
+        'checksum': _problem_checksum(full),
+        'payload': {k: v for k, v in full.items() if k != 'name'},
+    }
+    try:
+        rebuilt = regenerate(compact['generator'], compact['params'], compact['seed'])
+    except Exception:
+        return full
+    if rebuilt is None or _problem_checksum(rebuilt.to_dict()) != compact['checksum']:
+        return full
+    return compact
+
+
+def expand_problem(problem_dict: dict) -> dict:
+    """Full problem dict for a stored record, regenerating seed-form entries.
+
+    If a generator changed since the record was written (checksum mismatch or
+    generator gone), the stored payload is used instead. Entries written
+    without one, or whose payload does not match the checksum, are returned
+    with 'stale': True; their 'name' is still valid for statistics.
+    """
+    if 'seed' not in problem_dict or 'generator' not in problem_dict:
+        return problem_dict
+    from problems import regenerate
+    try:
+        rebuilt = regenerate(problem_dict['generator'], problem_dict.get('params'), problem_dict['seed'])
+    except Exception:
+        rebuilt = None
+    if rebuilt is not None:
+        full = rebuilt.to_dict()
+        if _problem_checksum(full) == problem_dict.get('checksum'):
+            return full
+    payload = problem_dict.get('payload')
+    if isinstance(payload, dict):
+        full = {'name': problem_dict.get('name'), **payload}
+        if _problem_checksum(full) == problem_dict.get('checksum'):
+            return full
+    return dict(problem_dict, stale=True)
+
+
+def save_session_data(test_date, start_time, total_questions, correct_answers, records, compact=False, extra=None):
+    """Append one session as a JSON line; file is stored gzip(JSONL).
+
+    With compact=True, seeded problems are stored as (generator, params, seed,
+    checksum, payload) and rebuilt on read by expand_problem(). `extra` adds session-level
+    fields (e.g. streaming N-back details); they are written before the records.
+    """
     session_data = {
         'date': test_date.strftime('%Y-%m-%d %H:%M:%S'),
         'duration_seconds': int(time.time() - start_time),
         'total_questions': total_questions,
         'correct_answers': correct_answers,
         'score_percentage': round(correct_answers/total_questions*100, 1) if total_questions > 0 else 0,
+        **(extra or {}),
         'records': [
             {
-                'problem': r.problem.to_dict(),
+                'problem': _compact_problem(r.problem) if compact else r.problem.to_dict(),
                 'response': r.response,
+                # Before response_ms: statistics read the fixed tail of each record.
+                **({'miss': r.miss} if r.miss is not None else {}),
                 'response_ms': r.response_ms,
                 'score': r.score,
                 'correct': r.score >= 1.0,
@@ -159,12 +370,15 @@ def load_session_statistics(sessions_file=None):
 
     try:
         sessions = _read_sessions(path)
+        if not sessions:
+            return empty_stats  # Return empty stats if no sessions
+        return _aggregate_sessions(sessions)
     except (json.JSONDecodeError, FileNotFoundError):
         return empty_stats  # Return empty stats if file is corrupted
-    
-    if not sessions:
-        return empty_stats  # Return empty stats if no sessions
-    
+
+
+def _aggregate_sessions(sessions: list) -> dict:
+    """Statistics for load_session_statistics() over a non-empty list of sessions."""
     # Overall statistics
     total_sessions = len(sessions)
     total_questions = sum(session.get('total_questions', 0) for session in sessions)
@@ -192,25 +406,24 @@ def load_session_statistics(sessions_file=None):
     })
     
     for session in sessions:
-        for record in session.get('records', []):
-            problem_data = record.get('problem', {}) or {}
-            problem_name = problem_data.get('name', 'unknown')
+        for record in _record_views(session):
+            problem_name = record.name
             
             problem_name_stats[problem_name]['total'] += 1
             
             # Track individual accuracy (1.0 for correct, 0.0 for incorrect)
-            is_correct = record.get('correct', False)
+            is_correct = record.correct
             problem_name_stats[problem_name]['individual_accuracies'].append(1.0 if is_correct else 0.0)
             
             if is_correct:
                 problem_name_stats[problem_name]['correct'] += 1
             
             # Store individual scores if available
-            if 'score' in record:
-                problem_name_stats[problem_name]['scores'].append(record['score'])
+            if record.score is not None:
+                problem_name_stats[problem_name]['scores'].append(record.score)
             
             # Store response times (convert to seconds if in milliseconds)
-            response_time = record.get('response_ms', 0)
+            response_time = record.response_ms
             if response_time > 0:
                 # Convert milliseconds to seconds for more readable output
                 problem_name_stats[problem_name]['response_times'].append(response_time / 1000.0)
@@ -246,11 +459,11 @@ def load_session_statistics(sessions_file=None):
             stats['avg_response_time'] = 0.0
             stats['response_time_std_dev'] = 0.0
     
-    # Recent sessions (last 5)
-    recent_sessions = sessions[-5:] if len(sessions) >= 5 else sessions
+    # Recent sessions (last 5), decoded in full since they are returned to the caller
+    recent_sessions = [_as_dict(s) for s in sessions[-5:]]
     
     # Best session (highest score percentage)
-    best_session = max(sessions, key=lambda s: s.get('score_percentage', 0)) if sessions else None
+    best_session = _as_dict(max(sessions, key=lambda s: s.get('score_percentage', 0))) if sessions else None
     
     # Session dates for trend analysis
     session_dates = []
@@ -0,0 +1,212 @@
+"""Edit-distance neighbourhoods over a word list.
+
+DeletionIndex maps every string obtainable by deleting up to `max_distance`
+characters from a corpus word to the words it came from. Two words within
+edit distance d always share such a deletion variant, so the neighbours of
+a word are found by looking up its own variants and verifying the few
+candidates. Cost grows with word length, not with corpus size.
+
+Generators use it to avoid confusable words (sample_distinct); the trainer
+uses one index per language to tell what kind of wrong word an answer is
+(classify_miss).
+"""
+
+import itertools
+import random
+import threading
+
+from normalize import fold
+from utils import APP_LANGUAGES, app_dict_words, distance_at_most
+
+
+def deletion_variants(word: str, max_distance: int) -> set[str]:
+    """word plus every string made by deleting 1..max_distance characters from it."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+class DeletionIndex:
+    """Symmetric-deletion index answering "which corpus words are within distance d?"."""
+
+    def __init__(self, corpus, max_distance: int = 1):
+        if max_distance < 0:
+            raise ValueError("max_distance must be non-negative")
+        self.max_distance = max_distance
+        self.words = tuple(dict.fromkeys(corpus))
+        self._ids = {word: i for i, word in enumerate(self.words)}
+        self._variants: dict[str, list[int]] = {}
+        for i, word in enumerate(self.words):
+            for variant in deletion_variants(word, max_distance):
+                self._variants.setdefault(variant, []).append(i)
+        self._neighbours: dict[str, frozenset] = {}
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word) -> bool:
+        return word in self._ids
+
+    def candidates(self, word: str) -> set[str]:
+        """Corpus words sharing a deletion variant with word (a superset of the neighbours)."""
+        ids = itertools.chain.from_iterable(
+            self._variants.get(variant, ()) for variant in deletion_variants(word, self.max_distance))
+        return {self.words[i] for i in set(ids)}
+
+    def neighbours(self, word: str) -> frozenset:
+        """Corpus words other than word within max_distance edits of it (cached)."""
+        found = self._neighbours.get(word)
+        if found is None:
+            d = self.max_distance
+            found = frozenset(
+                other for other in self.candidates(word)
+                if other != word and distance_at_most(word, other, d) is not None
+            )
+            self._neighbours[word] = found
+        return found
+
+    def nearest(self, word: str, k: int | None = None) -> list[tuple[str, int]]:
+        """(corpus word, distance) for every corpus word within k edits of word, closest first.
+
+        k defaults to, and may not exceed, the index's max_distance. word
+        itself is included, at distance 0, if it is in the corpus.
+        """
+        if k is None:
+            k = self.max_distance
+        if not 0 <= k <= self.max_distance:
+            raise ValueError("k must be between 0 and max_distance")
+        found = []
+        for other in self.candidates(word):
+            distance = distance_at_most(word, other, k)
+            if distance is not None:
+                found.append((other, distance))
+        found.sort(key=lambda pair: (pair[1], pair[0]))
+        return found
+
+
+_indexes: dict[tuple[int, int], tuple[list, DeletionIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def index_for(population: list, max_distance: int = 1) -> DeletionIndex:
+    """The DeletionIndex of a word list, built on first use and kept for the process.
+
+    Indexes are keyed by list identity, which suits the long-lived lists in
+    utils.words; the list itself is kept referenced so its id stays unique.
+    """
+    key = (id(population), max_distance)
+    entry = _indexes.get(key)
+    if entry is None:
+        with _indexes_lock:
+            entry = _indexes.get(key)
+            if entry is None:
+                entry = (population, DeletionIndex(population, max_distance))
+                _indexes[key] = entry
+    return entry[1]
+
+
+def sample_distinct(population: list, k: int, max_distance: int = 1, rng=None, max_tries: int = 100) -> list:
+    """Like random.sample, but no two chosen words are within max_distance edits.
+
+    Words are drawn one at a time and redrawn while they are confusable with
+    one already chosen. If `max_tries` draws in a row fail (a tiny or very
+    dense list), the constraint is relaxed to plain distinctness for that word.
+    """
+    rng = rng or random
+    if k < 0:
+        raise ValueError("sample size must be non-negative")
+    index = index_for(population, max_distance)
+    if k > len(index):
+        raise ValueError("sample larger than the number of distinct words")
+    chosen: list = []
+    blocked: set = set()
+    for _ in range(k):
+        for _ in range(max_tries):
+            word = rng.choice(population)
+            if word not in blocked:
+                break
+        else:
+            taken = set(chosen)
+            word = rng.choice([w for w in index.words if w not in taken])
+        chosen.append(word)
+        blocked.add(word)
+        blocked |= index.neighbours(word)
+    return chosen
+
+
+# classify_miss() labels, from most to least telling for interference.
+INTRUSION = 'intrusion'  # another real word
+NEAR_WORD = 'near word'  # a non-word closer to another real word than to the answer expected
+SLIP = 'slip'            # a non-word within a few edits of the answer expected
+OTHER = 'other'          # nothing nearby
+_MISS_ORDER = (INTRUSION, NEAR_WORD, SLIP, OTHER)
+
+# Edits within which a non-word answer counts as a misspelling of a word.
+MISS_DISTANCE = 1
+
+_language_indexes: dict[str, DeletionIndex] = {}
+_language_lock = threading.Lock()
+
+
+def language_index(language: str) -> DeletionIndex:
+    """DeletionIndex over the app's word list for language, accent-folded, built once per process.
+
+    Only the app's own lists (utils.APP_LANGUAGES) are indexed, never the
+    system word list, so each index builds in a fraction of a second. They are
+    read unfiltered: utils.words only keeps the 4-6 letter words problems are
+    drawn from, but an intruding word can have any length.
+    """
+    index = _language_indexes.get(language)
+    if index is None:
+        with _language_lock:
+            index = _language_indexes.get(language)
+            if index is None:
+                index = DeletionIndex((fold(w) for w in app_dict_words(language)), MISS_DISTANCE)
+                _language_indexes[language] = index
+    return index
+
+
+def miss_index(expected) -> DeletionIndex:
+    """The language index holding most of the expected words (the first language on a tie)."""
+    expected = list(expected)
+    return max((language_index(language) for language in APP_LANGUAGES),
+               key=lambda index: sum(word in index for word in expected))
+
+
+def preload_miss_indexes() -> threading.Thread:
+    """Build every language index on a daemon thread, so the first classify_miss does not wait."""
+    thread = threading.Thread(target=lambda: [language_index(language) for language in APP_LANGUAGES],
+                              name='miss-indexes', daemon=True)
+    thread.start()
+    return thread
+
+
+def classify_miss(answer: str, expected, index: DeletionIndex) -> str | None:
+    """How a wrong word answer went wrong, or None if it is one of the expected words.
+
+    answer and the expected words are normalized the same way as the index.
+    A word of the index is an INTRUSION. Otherwise the answer's nearest
+    words within index.max_distance decide: SLIP when an expected word is at
+    least as close as any other word, NEAR_WORD when only other words are,
+    OTHER when nothing is that close.
+    """
+    expected = set(expected)
+    if answer in expected:
+        return None
+    if answer in index:
+        return INTRUSION
+    k = index.max_distance
+    to_expected = [d for d in (distance_at_most(answer, w, k) for w in expected) if d is not None]
+    nearest = index.nearest(answer)
+    if to_expected and (not nearest or min(to_expected) <= nearest[0][1]):
+        return SLIP
+    return NEAR_WORD if nearest else OTHER
+
+
+def worst_miss(labels) -> str | None:
+    """The most telling of several classify_miss() labels (INTRUSION first), or None."""
+    labels = set(labels)
+    return next((label for label in _MISS_ORDER if label in labels), None)
@@ -0,0 +1,141 @@
+"""Lazy problem streams: an infinite weighted source plus composable stages.
+
+A stage is any callable taking an iterator of problems and returning a new
+iterator, so stages chain with `pipeline()`:
+
+    problems = pipeline(
+        problem_stream(create_problems_dict()),
+        dedupe,
+        partial(spaced, gap=2),
+        partial(take, n=10),
+    )
+"""
+
+import itertools
+import random
+from collections import deque
+from typing import Callable, Iterable, Iterator
+
+from classes import Problem
+from problems import create_seeded
+
+Stage = Callable[[Iterator], Iterator]
+
+
+def weighted_classes(problems: dict, rng=None, chunk: int = 64) -> Iterator[type]:
+    """Yield problem classes forever, drawn with the probabilities from `problems`."""
+    if not problems:
+        raise ValueError("problems must contain at least one class")
+    rng = rng or random
+    classes = list(problems.keys())
+    weights = list(problems.values())
+    cum_weights = list(itertools.accumulate(weights))
+    while True:
+        yield from rng.choices(classes, cum_weights=cum_weights, k=chunk)
+
+
+def problem_stream(problems: dict, rng=None, seeded: bool = False, **create_kwargs) -> Iterator[Problem]:
+    """Yield freshly created problems forever; nothing is generated until it is pulled.
+
+    With seeded=True each problem is made by create_seeded() so it can be
+    stored as a compact record.
+    """
+    rng = rng or random
+    for cls in weighted_classes(problems, rng):
+        if seeded:
+            yield create_seeded(cls, rng.getrandbits(32), **create_kwargs)
+        else:
+            yield cls.create(**create_kwargs)
+
+
+def _problem_key(pb: Problem) -> tuple:
+    return (pb.name, pb.memorize, pb.prompt)
+
+
+def dedupe(stream: Iterable[Problem], key=_problem_key, window: int = 100, patience: int = 50) -> Iterator[Problem]:
+    """Drop problems whose key was already yielded among the last `window` problems.
+
+    After `patience` consecutive duplicates the next problem is yielded anyway,
+    so a source with few distinct problems cannot stall the stream.
+    """
+    recent = deque()
+    seen: dict = {}
+    skipped = 0
+    for pb in stream:
+        k = key(pb)
+        if k in seen and skipped < patience:
+            skipped += 1
+            continue
+        skipped = 0
+        recent.append(k)
+        seen[k] = seen.get(k, 0) + 1
+        if len(recent) > window:
+            old = recent.popleft()
+            seen[old] -= 1
+            if not seen[old]:
+                del seen[old]
+        yield pb
+
+
+def where(stream: Iterable[Problem], predicate: Callable[[Problem], bool]) -> Iterator[Problem]:
+    """Keep only the problems for which predicate(problem) is true."""
+    return (pb for pb in stream if predicate(pb))
+
+
+def difficulty(stream: Iterable[Problem], min_exposure_ms: int | None = None,
+               max_exposure_ms: int | None = None) -> Iterator[Problem]:
+    """Filter by exposure time, the per-problem difficulty knob (shorter is harder)."""
+    def _in_range(pb: Problem) -> bool:
+        if min_exposure_ms is not None and pb.exposure_ms < min_exposure_ms:
+            return False
+        if max_exposure_ms is not None and pb.exposure_ms > max_exposure_ms:
+            return False
+        return True
+    return where(stream, _in_range)
+
+
+def spaced(stream: Iterable[Problem], gap: int = 1, max_pending: int = 32) -> Iterator[Problem]:
+    """Reorder so the same problem type does not reappear within `gap` problems.
+
+    Problems that would break the constraint are held back and released as soon
+    as they fit; if more than `max_pending` pile up, the oldest is released
+    regardless so a single-type source still flows.
+    """
+    last_names = deque(maxlen=gap)
+    pending: list[Problem] = []
+    for pb in stream:
+        pending.append(pb)
+        while pending:
+            for i, candidate in enumerate(pending):
+                if candidate.name not in last_names:
+                    break
+            else:
+                if len(pending) <= max_pending:
+                    break
+                i = 0
+            ready = pending.pop(i)
+            last_names.append(ready.name)
+            yield ready
+    yield from pending
+
+
+def take(stream: Iterable, n: int) -> Iterator:
+    """Yield at most n items."""
+    return itertools.islice(stream, n)
+
+
+def batch(stream: Iterable, size: int) -> Iterator[list]:
+    """Group items into lists of `size`; the last list may be shorter."""
+    if size <= 0:
+        raise ValueError("size must be positive")
+    it = iter(stream)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def pipeline(source: Iterable, *stages: Stage) -> Iterator:
+    """Apply stages left to right to source."""
+    stream = iter(source)
+    for stage in stages:
+        stream = stage(stream)
+    return stream
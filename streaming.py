@@ -0,0 +1,176 @@
+"""Streaming N-back: stimuli at a fixed cadence, one response window per stimulus.
+
+StimulusScheduler computes every deadline from the session start
+(start + i * period), so a late tick never delays the ones after it. Each
+wait sleeps in short slices, handing control to a poll callback so key presses
+are timestamped while waiting, and spins for the last couple of milliseconds
+so onsets land well inside one display frame.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+
+ALPHABET = 'ABCDEFGHJKLMNPQRSTUVWXYZ'
+
+
+class StimulusScheduler:
+    """Drift-free clock for events at start + index * period (+ offset)."""
+
+    def __init__(self, period_s: float, spin_s: float = 0.002, clock=time.perf_counter, sleep=time.sleep):
+        if period_s <= 0:
+            raise ValueError("period must be positive")
+        self.period_s = period_s
+        self.spin_s = spin_s
+        self.clock = clock
+        self.sleep = sleep
+        self.start = None
+        self.lateness: list[float] = []  # seconds each wait returned after its deadline
+
+    def begin(self, delay_s: float = 0.0) -> None:
+        """Fix the start so that stimulus 0 is due `delay_s` from now."""
+        self.start = self.clock() + delay_s
+        self.lateness = []
+
+    def deadline(self, index: int, offset_s: float = 0.0) -> float:
+        if self.start is None:
+            raise RuntimeError("begin() must be called first")
+        return self.start + index * self.period_s + offset_s
+
+    def wait_until(self, deadline: float, poll=None, poll_s: float = 0.005) -> float:
+        """Block until deadline and return the clock reading at release.
+
+        poll(timeout_s), if given, is called repeatedly until the spin phase
+        and should return within timeout_s (e.g. a curses getch with timeout).
+        """
+        clock = self.clock
+        while True:
+            remaining = deadline - clock() - self.spin_s
+            if remaining <= 0:
+                break
+            if poll is not None:
+                poll(min(remaining, poll_s))
+            else:
+                self.sleep(remaining)
+        now = clock()
+        while now < deadline:
+            now = clock()
+        self.lateness.append(now - deadline)
+        return now
+
+    def jitter_ms(self) -> dict:
+        """Mean and max lateness of the waits so far, in milliseconds."""
+        if not self.lateness:
+            return {'mean': 0.0, 'max': 0.0}
+        return {
+            'mean': round(sum(self.lateness) / len(self.lateness) * 1000, 3),
+            'max': round(max(self.lateness) * 1000, 3),
+        }
+
+
+def make_sequence(n_back: int, length: int, match_rate: float = 0.3, rng=None) -> list[str]:
+    """Letters where each position from n_back on is a target with probability match_rate.
+
+    Non-target positions are drawn to differ from the letter n_back earlier,
+    so the targets are exactly the positions the generator chose.
+    """
+    if n_back < 1 or length <= n_back:
+        raise ValueError("need n_back >= 1 and length > n_back")
+    rng = rng or random
+    seq = [rng.choice(ALPHABET) for _ in range(n_back)]
+    for i in range(n_back, length):
+        earlier = seq[i - n_back]
+        if rng.random() < match_rate:
+            seq.append(earlier)
+        else:
+            seq.append(rng.choice([c for c in ALPHABET if c != earlier]))
+    return seq
+
+
+def targets(seq: list[str], n_back: int) -> list[bool]:
+    return [i >= n_back and seq[i] == seq[i - n_back] for i in range(len(seq))]
+
+
+@dataclass
+class StreamResult:
+    """Signal-detection counts and reaction times of one streaming N-back run."""
+    n_back: int
+    sequence: list[str]
+    hits: int = 0
+    misses: int = 0
+    false_alarms: int = 0
+    correct_rejections: int = 0
+    hit_rts_ms: list[int] = field(default_factory=list)
+    stimuli: list[dict] = field(default_factory=list)
+
+    @property
+    def score(self) -> float:
+        """Share of stimuli answered correctly (hits and correct rejections)."""
+        total = len(self.stimuli)
+        return (self.hits + self.correct_rejections) / total if total else 0.0
+
+    @property
+    def mean_hit_rt_ms(self) -> int:
+        return round(sum(self.hit_rts_ms) / len(self.hit_rts_ms)) if self.hit_rts_ms else 0
+
+    def to_dict(self) -> dict:
+        return {
+            'n_back': self.n_back,
+            'hits': self.hits,
+            'misses': self.misses,
+            'false_alarms': self.false_alarms,
+            'correct_rejections': self.correct_rejections,
+            'mean_hit_rt_ms': self.mean_hit_rt_ms,
+            'stimuli': self.stimuli,
+        }
+
+
+def score_stream(seq: list[str], n_back: int, responses: dict[int, int]) -> StreamResult:
+    """Classify each stimulus; responses maps stimulus index to reaction time in ms (first press only)."""
+    result = StreamResult(n_back, list(seq))
+    for i, is_target in enumerate(targets(seq, n_back)):
+        rt = responses.get(i)
+        if is_target:
+            outcome = 'hit' if rt is not None else 'miss'
+        else:
+            outcome = 'false_alarm' if rt is not None else 'correct_rejection'
+        if outcome == 'hit':
+            result.hits += 1
+            result.hit_rts_ms.append(rt)
+        elif outcome == 'miss':
+            result.misses += 1
+        elif outcome == 'false_alarm':
+            result.false_alarms += 1
+        else:
+            result.correct_rejections += 1
+        result.stimuli.append({'index': i, 'item': seq[i], 'target': is_target, 'rt_ms': rt, 'outcome': outcome})
+    return result
+
+
+def run_stream(seq: list[str], scheduler: StimulusScheduler, show, hide, read_key,
+               on_fraction: float = 0.8, lead_in_s: float = 1.0) -> dict[int, int]:
+    """Present seq on the scheduler and collect the first key press per stimulus.
+
+    show(item) and hide() draw the stimulus; read_key(timeout_s) returns a key
+    or None. A press belongs to the stimulus whose window (its onset up to the
+    next onset) it falls in. Returns {stimulus index: reaction time ms}.
+    """
+    responses: dict[int, int] = {}
+    current = {'index': None, 'onset': 0.0}
+
+    def poll(timeout_s):
+        key = read_key(timeout_s)
+        if key is not None and current['index'] is not None and current['index'] not in responses:
+            responses[current['index']] = int((scheduler.clock() - current['onset']) * 1000)
+
+    scheduler.begin(lead_in_s)
+    on_s = scheduler.period_s * on_fraction
+    for i, item in enumerate(seq):
+        onset = scheduler.wait_until(scheduler.deadline(i), poll)
+        poll(0)  # a press during the final spin still belongs to the previous stimulus
+        show(item)
+        current['index'], current['onset'] = i, onset
+        scheduler.wait_until(scheduler.deadline(i, on_s), poll)
+        hide()
+    scheduler.wait_until(scheduler.deadline(len(seq)), poll)
+    return responses
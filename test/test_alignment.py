@@ -0,0 +1,67 @@
+"""Unit tests for alignment module: per-lane distances and item-level scores."""
+
+import random
+import unittest
+
+from alignment import ItemMatcher, token_distance, token_score, tokenize
+from utils import levenshtein_distance
+
+
+class TestItemMatcher(unittest.TestCase):
+    def test_distances_match_levenshtein(self):
+        rng = random.Random(3)
+        for _ in range(500):
+            items = ["".join(rng.choice("abc") for _ in range(rng.randint(0, 7))) for _ in range(rng.randint(0, 6))]
+            word = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 9)))
+            self.assertEqual(ItemMatcher(items).distances(word), [levenshtein_distance(word, i) for i in items])
+
+    def test_similarities(self):
+        matcher = ItemMatcher(["propre", "coin", ""])
+        exact, shared_o, empty = matcher.similarities("propre")
+        self.assertEqual((exact, empty), (1.0, 0.0))
+        self.assertAlmostEqual(shared_o, 1 / 6)
+        self.assertEqual(matcher.similarities("xyz"), [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(matcher.similarities("coing")[1], 0.8)
+        self.assertEqual(len(matcher), 3)
+
+
+class TestTokenScore(unittest.TestCase):
+    def setUp(self):
+        self.solution = tokenize("propre coin comete oubli")
+
+    def test_exact_and_separators(self):
+        self.assertEqual(token_score(tokenize("propre, coin; comete oubli"), self.solution), 1.0)
+
+    def test_typo_costs_part_of_an_item(self):
+        self.assertAlmostEqual(token_score(tokenize("propre coing comete oubli"), self.solution), 1 - 0.2 / 4)
+
+    def test_missing_item_costs_one_item(self):
+        self.assertEqual(token_score(tokenize("propre comete oubli"), self.solution), 0.75)
+
+    def test_order_matters(self):
+        swapped = token_score(tokenize("coin propre comete oubli"), self.solution)
+        self.assertLess(swapped, 1.0)
+        self.assertGreaterEqual(swapped, 0.5)
+
+    def test_empty(self):
+        self.assertEqual(token_score([], []), 1.0)
+        self.assertEqual(token_score([], self.solution), 0.0)
+
+    def test_matcher_reused_after_trimming(self):
+        matcher = ItemMatcher(self.solution)
+        answer = tokenize("propre coin comet oubli")
+        self.assertEqual(token_distance(answer, self.solution, matcher), token_distance(answer, self.solution))
+
+    def test_long_lists(self):
+        rng = random.Random(1)
+        solution = ["".join(rng.choice("abcdefgh") for _ in range(5)) for _ in range(25)]
+        answer = list(solution)
+        answer[3] = answer[3][:-1] + "z"
+        del answer[10]
+        score = token_score(answer, solution)
+        self.assertGreater(score, 0.9)
+        self.assertLess(score, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Unit tests for batch_scoring module: batched scores match the scalar path."""
+
+import random
+import unittest
+from unittest import mock
+
+import batch_scoring
+from batch_scoring import evaluate_many, levenshtein_many, score_many
+from classes import Problem
+from problems import Anagram, MatrixMemory, Number, WordList
+from utils import levenshtein_distance, osa_distance
+
+
+def _random_pairs(count, seed=5):
+    rng = random.Random(seed)
+    alphabet = "abcdé 12"
+    return [
+        ("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25))),
+         "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25))))
+        for _ in range(count)
+    ]
+
+
+class TestLevenshteinMany(unittest.TestCase):
+    def test_matches_scalar(self):
+        pairs = _random_pairs(600)
+        self.assertEqual(levenshtein_many(pairs), [levenshtein_distance(a, b) for a, b in pairs])
+
+    def test_small_groups(self):
+        pairs = _random_pairs(50, seed=9)
+        with mock.patch.object(batch_scoring, "GROUP_SIZE", 7):
+            self.assertEqual(levenshtein_many(pairs), [levenshtein_distance(a, b) for a, b in pairs])
+
+    def test_long_strings(self):
+        rng = random.Random(8)
+        pairs = [("".join(rng.choice("ab") for _ in range(n)), "".join(rng.choice("ab") for _ in range(n + 3)))
+                 for n in (60, 63, 64, 65, 130)]
+        self.assertEqual(levenshtein_many(pairs), [levenshtein_distance(a, b) for a, b in pairs])
+
+    def test_empty_and_identical(self):
+        self.assertEqual(levenshtein_many([]), [])
+        self.assertEqual(levenshtein_many([("", ""), ("", "abc"), ("abc", "abc")]), [0, 3, 0])
+
+    def test_transpositions_match_osa(self):
+        pairs = _random_pairs(400, seed=6) + [("ab", "ba"), ("stvgbxaf", "stgvbxaf"), ("x" * 70 + "ab", "x" * 70 + "ba")]
+        self.assertEqual(levenshtein_many(pairs, transpositions=True), [osa_distance(a, b) for a, b in pairs])
+
+    @unittest.skipIf(batch_scoring.np is None, "numpy not installed")
+    def test_scalar_fallback_agrees(self):
+        pairs = _random_pairs(200, seed=2)
+        vectorized = levenshtein_many(pairs)
+        with mock.patch.object(batch_scoring, "np", None):
+            self.assertEqual(levenshtein_many(pairs), vectorized)
+        vectorized = levenshtein_many(pairs, transpositions=True)
+        with mock.patch.object(batch_scoring, "np", None):
+            self.assertEqual(levenshtein_many(pairs, transpositions=True), vectorized)
+
+
+class TestScoreMany(unittest.TestCase):
+    def test_matches_evaluate_solution(self):
+        pairs = [(s if s.strip() else "x", r) for s, r in _random_pairs(300, seed=3)]
+        pairs += [("Café", "cafe"), ("abc", None), ("abc", "  ABC "), ("abc", 123)]
+        expected = [Problem("T", "m", "p", s, 1000).evaluate_solution(r) for s, r in pairs]
+        self.assertEqual(score_many(pairs), expected)
+
+
+class TestEvaluateMany(unittest.TestCase):
+    def test_mixed_problem_types(self):
+        random.seed(4)
+        problems = [Number.create(), WordList.create(), MatrixMemory.create(), Anagram.create(), Number.create()]
+        responses = [problems[0].solution, "wrong words", "A1", None, problems[4].solution[1::-1] + problems[4].solution[2:]]
+        self.assertEqual(evaluate_many(problems, responses),
+                         [pb.evaluate_solution(r) for pb, r in zip(problems, responses)])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            evaluate_many([Number.create()], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Unit tests for benchmark module: statistics, per-class runs and JSON output."""
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from benchmark import (
+    _percentile,
+    benchmark_class,
+    format_distance_report,
+    format_report,
+    format_scaling_report,
+    main,
+    run_benchmarks,
+    run_distance_benchmark,
+    run_scaling,
+)
+from problems import Number, NumberCalculate
+
+
+class TestPercentile(unittest.TestCase):
+    """_percentile: nearest-rank on sorted input."""
+
+    def test_empty(self):
+        self.assertEqual(_percentile([], 0.5), 0.0)
+
+    def test_median_and_p99(self):
+        values = list(range(1, 101))
+        self.assertEqual(_percentile(values, 0.50), 50)
+        self.assertEqual(_percentile(values, 0.99), 99)
+        self.assertEqual(_percentile(values, 1.0), 100)
+
+    def test_single_value(self):
+        self.assertEqual(_percentile([7], 0.99), 7)
+
+
+class TestBenchmarkClass(unittest.TestCase):
+    """benchmark_class: result layout and validation."""
+
+    def test_result_keys(self):
+        result = benchmark_class(Number, iterations=10, warmup=1)
+        self.assertEqual(result["name"], "Number")
+        self.assertEqual(result["iterations"], 10)
+        for phase in ("create", "evaluate"):
+            self.assertGreater(result[phase]["ops_per_sec"], 0)
+            self.assertLessEqual(result[phase]["p50_us"], result[phase]["p99_us"])
+        self.assertGreaterEqual(result["peak_bytes_per_call"], 0)
+
+    def test_non_positive_iterations_raises(self):
+        with self.assertRaises(ValueError):
+            benchmark_class(Number, iterations=0)
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    """run_benchmarks / main: class filtering, report and JSON output."""
+
+    def test_only_filters_classes(self):
+        report = run_benchmarks(iterations=3, only=["Number", "NumberCalculate"])
+        self.assertEqual([r["name"] for r in report["results"]], ["Number", "NumberCalculate"])
+        self.assertIn("Number", format_report(report))
+
+    def test_all_classes_covered(self):
+        from problems import create_problems_dict
+        report = run_benchmarks(iterations=1)
+        names = {r["name"] for r in report["results"]}
+        self.assertEqual(names, {cls.__name__ for cls in create_problems_dict()})
+
+    def test_main_writes_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "bench.json"
+            with redirect_stdout(io.StringIO()):
+                rc = main(["-n", "3", "--only", NumberCalculate.__name__, "--json", str(out)])
+            self.assertEqual(rc, 0)
+            data = json.loads(out.read_text())
+            self.assertEqual(data["iterations"], 3)
+            self.assertEqual(data["results"][0]["name"], "NumberCalculate")
+
+    def test_main_rejects_non_positive_iterations(self):
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["-n", "0"]), 1)
+
+
+class TestScaling(unittest.TestCase):
+    """run_scaling: per-class throughput for each pool size."""
+
+    def test_scaling_report(self):
+        report = run_scaling(worker_counts=(1, 2), per_worker=5, only=["Number"])
+        self.assertIn(report["mode"], ("threads", "processes"))
+        self.assertEqual(report["mode"] == "threads", report["free_threaded"])
+        rates = report["results"][0]["problems_per_sec"]
+        self.assertEqual(set(rates), {"1", "2"})
+        self.assertTrue(all(r > 0 for r in rates.values()))
+        self.assertIn("Number", format_scaling_report(report))
+
+    def test_main_rejects_bad_counts(self):
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["--scaling", "1,x"]), 1)
+            self.assertEqual(main(["--scaling", "0"]), 1)
+
+
+class TestDistanceBenchmark(unittest.TestCase):
+    """run_distance_benchmark: both implementations timed and in agreement."""
+
+    def test_distance_report(self):
+        report = run_distance_benchmark(iterations=5, only=["Number", "Road"])
+        self.assertEqual([r["name"] for r in report["results"]], ["Number", "Road"])
+        for r in report["results"]:
+            self.assertEqual(r["mismatches"], 0)
+            self.assertGreater(r["dp_us"], 0)
+            self.assertGreater(r["mean_length"], 0)
+        self.assertIn("Road", format_distance_report(report))
+
+    def test_main_distance(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(main(["--distance", "-n", "2", "--only", "Metar"]), 0)
+        self.assertIn("Metar", out.getvalue())
+
+    def test_unknown_only_rejected(self):
+        with self.assertRaises(ValueError):
+            run_distance_benchmark(iterations=2, only=["Metra"])
+        with redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit) as exit_:
+            main(["--distance", "-n", "2", "--only", "Metar", "Metra"])
+        self.assertEqual(exit_.exception.code, 2)
+        self.assertIn("Metra", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Unit tests for bitboard module: rendering, cell names, parsing and scoring."""
+
+import random
+import unittest
+
+from bitboard import cell_names, jaccard, parse_cells, random_board, render
+
+
+def _render_slow(board, size):
+    return "\n".join(" ".join("X" if board >> (r * size + c) & 1 else "." for c in range(size)) for r in range(size))
+
+
+class TestBitboard(unittest.TestCase):
+    """Bitboard helpers agree with straightforward cell-by-cell versions."""
+
+    def test_render_matches_cell_loop(self):
+        rng = random.Random(0)
+        for size in (1, 3, 8, 9, 16, 26):
+            for marks in (0, 1, size, size * size // 3):
+                board = random_board(size, marks, rng)
+                self.assertEqual(bin(board).count("1"), marks)
+                self.assertEqual(render(board, size), _render_slow(board, size))
+
+    def test_cell_names_and_parse_round_trip(self):
+        board = random_board(16, 40, random.Random(1))
+        names = cell_names(board, 16)
+        self.assertEqual(len(names), 40)
+        self.assertEqual(parse_cells(" ".join(names), 16), (board, 0))
+
+    def test_parse_formats(self):
+        a1_c3 = (1 << 0) | (1 << (2 * 3 + 2))
+        for text in ("A1 C3", "a1,c3", "1A 3C", "A 1  C 3", "A1C3"):
+            self.assertEqual(parse_cells(text, 3), (a1_c3, 0), text)
+        self.assertEqual(parse_cells("D1 A4 B2", 3), (1 << 4, 2))
+
+    def test_jaccard(self):
+        self.assertEqual(jaccard(0b0110, 0b0110), 1.0)
+        self.assertEqual(jaccard(0b0110, 0b0011), 1 / 3)
+        self.assertEqual(jaccard(0b1, 0b1, extra=1), 0.5)
+        self.assertEqual(jaccard(0, 0), 1.0)
+
+    def test_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            random_board(27, 1)
+        with self.assertRaises(ValueError):
+            random_board(3, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Unit tests for build_content module: validation and the generated content.py."""
+
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest.mock import patch
+
+import build_content
+from build_content import (
+    ContentError,
+    formula_elements,
+    load_content,
+    read_formulas,
+    read_frequencies,
+    read_tokyo_metro,
+    read_vors,
+    render,
+)
+
+
+class _TempFiles(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, text):
+        path = self.dir / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+
+class TestGeneratedModule(unittest.TestCase):
+    """content.py is committed and must match the dicts it was built from."""
+
+    def test_content_module_up_to_date(self):
+        self.assertEqual(build_content.OUTPUT.read_text(encoding="utf-8"), render(load_content()),
+                         "content.py is stale; run python build_content.py")
+
+    def test_content_is_immutable(self):
+        import content
+        self.assertIsInstance(content.AIRLINE_CODES, tuple)
+        self.assertIsInstance(content.VORS, tuple)
+        self.assertIsInstance(content.STREET_NAMES, tuple)
+        with self.assertRaises(TypeError):
+            content.FREQUENCIES["tower"] = ()
+        self.assertIsInstance(content.FREQUENCIES["approach"], tuple)
+
+    def test_formula_elements(self):
+        self.assertEqual(formula_elements("Pb(NO3)2"), ("N", "O", "Pb"))
+        self.assertEqual(formula_elements("C6H12O6"), ("C", "H", "O"))
+
+    def test_check_mode(self):
+        self.assertEqual(build_content.main(["--check"]), 0)
+
+
+class TestValidation(_TempFiles):
+    """Malformed content files are refused with file:line."""
+
+    def test_duplicate_entry(self):
+        path = self.write("vors.txt", "JFK\nLAX\nJFK\n")
+        with self.assertRaisesRegex(ContentError, r"vors.txt:3: duplicate entry 'JFK' \(first on line 1\)"):
+            read_vors(path)
+
+    def test_invalid_entry(self):
+        with self.assertRaisesRegex(ContentError, "vors.txt:2"):
+            read_vors(self.write("vors.txt", "JFK\nnot a vor\n"))
+
+    def test_missing_and_empty_files(self):
+        with self.assertRaisesRegex(ContentError, "file not found"):
+            read_vors(self.dir / "vors.txt")
+        with self.assertRaisesRegex(ContentError, "no entries"):
+            read_vors(self.write("vors.txt", "\n\n"))
+
+    def test_frequency_sections(self):
+        good = "# Approach frequencies\n118.1\n# Tower frequencies\n118.0\n# Ground frequencies\n121.6\n"
+        self.assertEqual(read_frequencies(self.write("frequencies.txt", good))["tower"], ("118.0",))
+        with self.assertRaisesRegex(ContentError, "'ground' is missing"):
+            read_frequencies(self.write("frequencies.txt", good.split("# Ground")[0]))
+        with self.assertRaisesRegex(ContentError, "frequencies.txt:2: not a valid frequency"):
+            read_frequencies(self.write("frequencies.txt", "# Approach frequencies\nabc\n"))
+
+    def test_tokyo_line_without_stations(self):
+        with self.assertRaisesRegex(ContentError, "tokyo_metro.txt:1: line 'Ginza' has no stations"):
+            read_tokyo_metro(self.write("tokyo_metro.txt", "Ginza:銀座線\nHibiya:日比谷線\nA:あ,B:び\n"))
+
+    def test_tokyo_station_without_kanji(self):
+        lines = read_tokyo_metro(self.write("tokyo_metro.txt", "Ginza:銀座線\nAsakusa:浅草,Ueno\n"))
+        self.assertEqual(lines, (("Ginza", "銀座線", (("Asakusa", "浅草"), ("Ueno", "Ueno"))),))
+
+    def test_unbalanced_formula(self):
+        with self.assertRaisesRegex(ContentError, "chemical_formulas.txt:2: unbalanced"):
+            read_formulas(self.write("chemical_formulas.txt", "H2O,Water\nPb(NO3,Broken\n"))
+
+    def test_main_refuses_bad_content(self):
+        shutil.copytree(build_content.DICTS_DIR, self.dir, dirs_exist_ok=True)
+        self.write("runways.txt", "09L\n99X\n")
+        with patch.object(build_content, "DICTS_DIR", self.dir), redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(build_content.main(["--check"]), 1)
+        self.assertIn("runways.txt:2", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -68,6 +68,15 @@ class TestProblemMethods(unittest.TestCase):
         p = _valid_problem(solution="abc")
         self.assertEqual(p.evaluate_solution(None), 0.0)
 
+    def test_solution_normalized_once(self):
+        from unittest import mock
+        import scoring
+        p = _valid_problem(solution="  Café ")
+        self.assertEqual(p._normalized_solution, "cafe")
+        with mock.patch.object(scoring, "normalize", wraps=scoring.normalize) as normalize:
+            self.assertEqual(p.evaluate_solution("CAFE"), 1.0)
+        normalize.assert_called_once_with("CAFE")
+
     def test_to_dict(self):
         p = _valid_problem(name="X", problem_type="matrix")
         d = p.to_dict()
@@ -119,10 +128,22 @@ class TestRecordValidation(unittest.TestCase):
         with self.assertRaises(ValueError):
             Record(p, "r", 0, 1.1)
 
+    def test_miss_not_str_raises(self):
+        p = _valid_problem()
+        with self.assertRaises(TypeError):
+            Record(p, "r", 0, 0.5, 1)
+
 
 class TestRecordMethods(unittest.TestCase):
     """Record to_dict and correct property."""
 
+    def test_to_dict_miss_only_when_set(self):
+        p = _valid_problem()
+        self.assertNotIn("miss", Record(p, "ans", 100, 1.0).to_dict())
+        d = Record(p, "anz", 100, 0.5, "slip").to_dict()
+        self.assertEqual(list(d), ["problem", "response", "miss", "response_ms", "score", "correct"])
+        self.assertIsNone(p.classify_miss("anz"))
+
     def test_to_dict_includes_correct(self):
         p = _valid_problem()
         r = Record(p, "ans", 100, 1.0)
@@ -0,0 +1,123 @@
+"""Unit tests for corpus module: extraction, the golden corpus and the check report."""
+
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import corpus
+from corpus import (build_rows, check_distances, check_scores, pairs_from_records, pairs_from_sessions,
+                    read_corpus, write_corpus)
+from problems import NumberCalculate
+
+_OLD = ("2025-08-01 20:23355"
+        "type=word reverse, memorize=alone >> prompt=< solution=enola exposure_ms=1000 "
+        "response=enolq, response_ms=4739, correct=False"
+        "type=calculus, memorize=13 7 prompt=* solution=91 exposure_ms=2000 response=91, response_ms=5308, correct=True"
+        "2025-08-01 20:46332"
+        "type=dream, memorize=a b prompt=> solution=a b exposure_ms=2000 response=a, b, response_ms=900, correct=False")
+
+
+class TestExtraction(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_pairs_from_records(self):
+        (self.path / "records.txt").write_text(_OLD, encoding="utf-8")
+        self.assertEqual(list(pairs_from_records(self.path / "records.txt")), [
+            ("Word Backward", "alone >>", "<", "enola", "enolq"),
+            ("Number Calculate", "13 7", "*", "91", "91"),
+            ("dream", "a b", ">", "a b", "a, b"),
+        ])
+
+    def test_pairs_from_sessions(self):
+        problem = NumberCalculate("Number Calculate", "3 + 9", "?", "12", 3000).to_dict()
+        session = {"records": [{"problem": problem, "response": "12.0", "response_ms": 1, "score": 1.0},
+                               {"problem": {"name": "Broken"}, "response": "x", "response_ms": 1, "score": 0.0}]}
+        path = self.path / "sessions.json.gzip"
+        path.write_bytes(gzip.compress((json.dumps(session) + "\n").encode("utf-8")))
+        self.assertEqual(list(pairs_from_sessions(path)), [("Number Calculate", "3 + 9", "?", "12", "12.0")])
+
+    def test_build_rows_dedupes_and_scores(self):
+        pair = ("Number Calculate", "3 + 9", "?", "12", "12.0")
+        rows = build_rows([pair, pair, ("Word List", "a", "?", "", "x"), ("Retired", "m", "?", "abcd", "abce")])
+        self.assertEqual(rows, [list(pair) + [1.0], ["Retired", "m", "?", "abcd", "abce", 0.75]])
+
+    def test_write_read_roundtrip(self):
+        rows = [["Number", "1", ">", "1", "1", 1.0], ["Pseudoword", "é", ">", "é", "e", 1.0]]
+        for name in ("corpus.jsonl", "corpus.jsonl.gz"):
+            write_corpus(rows, self.path / name)
+            self.assertEqual(read_corpus(self.path / name), rows)
+        self.assertEqual((self.path / "corpus.jsonl.gz").read_bytes()[:2], b"\x1f\x8b")
+
+
+class TestGoldenCorpus(unittest.TestCase):
+    """The shipped corpus of real answers: current scorers and distances must reproduce it."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rows = read_corpus()
+
+    def test_scores_stable(self):
+        report = check_scores(self.rows, repeat=1)
+        self.assertEqual(report["changes"], [])
+        self.assertEqual(sum(s["pairs"] for s in report["scorers"]), len(self.rows))
+
+    def test_distances_agree(self):
+        report = check_distances(self.rows, repeat=1)
+        self.assertEqual(report["mismatches"], [])
+        self.assertEqual(set(report["pairs_per_sec"]),
+                         {"dp", "levenshtein_distance", "distance_at_most", "levenshtein_many", "osa_distance"})
+
+
+class TestCheckCommand(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "corpus.jsonl"
+        write_corpus([["Number Calculate", "3 + 9", "?", "12", "12.0", 0.5],
+                      ["Number", "12", ">", "12", "12", 1.0],
+                      ["Number", "12", ">", "", "12", 1.0]], self.path)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _main(self, *args):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = corpus.main(list(args))
+        return code, out.getvalue()
+
+    def test_changes_fail_the_check(self):
+        code, out = self._main("check", str(self.path), "--repeat", "1")
+        self.assertEqual(code, 1)
+        self.assertIn("CHANGED Number Calculate: '12' <- '12.0': 0.5 -> 1.0", out)
+        self.assertIn("Distances: all agree", out)
+
+    def test_accept_updates_scores(self):
+        code, _ = self._main("check", str(self.path), "--repeat", "1", "--accept")
+        self.assertEqual(code, 0)
+        self.assertEqual([row[5] for row in read_corpus(self.path)], [1.0, 1.0])
+        code, out = self._main("check", str(self.path), "--repeat", "1")
+        self.assertEqual(code, 0)
+        self.assertIn("Scores: all match the corpus.", out)
+
+    def test_build(self):
+        records = Path(self.dir.name) / "records.txt"
+        records.write_text(_OLD, encoding="utf-8")
+        out_path = Path(self.dir.name) / "built.jsonl.gz"
+        code, out = self._main("build", "-o", str(out_path), "--records", str(records),
+                               "--sessions", str(records) + ".missing")
+        self.assertEqual(code, 0)
+        self.assertIn("Wrote 3 pairs", out)
+        self.assertEqual(len(read_corpus(out_path)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Unit tests for fuzz module: invariants, sharding and failure reporting."""
+
+import os
+import unittest
+from unittest.mock import patch
+
+from classes import Problem
+from fuzz import _offline, _shards, check_problem, fuzz_shard, run_fuzz
+from problems import Number, NumberCalculate
+
+
+class TestCheckProblem(unittest.TestCase):
+    """check_problem: sound problems pass, broken invariants are described."""
+
+    def test_sound_problem(self):
+        pb = Problem(name="N", memorize="12", prompt=">", solution="12", exposure_ms=1000)
+        self.assertIsNone(check_problem(pb))
+
+    def test_solution_not_scoring_one(self):
+        pb = Problem(name="N", memorize="12", prompt=">", solution="12", exposure_ms=1000)
+        with patch.object(Problem, "evaluate_solution", return_value=0.5):
+            self.assertIn("0.5", check_problem(pb))
+
+    def test_blank_field_after_creation(self):
+        pb = Problem(name="N", memorize="12", prompt=">", solution="12", exposure_ms=1000)
+        pb.prompt = "  "
+        self.assertEqual(check_problem(pb), "prompt is empty")
+
+
+class TestFuzzShard(unittest.TestCase):
+    """fuzz_shard / run_fuzz: counting, reproducible failures, inline mode."""
+
+    def test_shards_cover_range(self):
+        self.assertEqual(list(_shards(10, 25, 10)), [(10, 20), (20, 30), (30, 35)])
+
+    def test_shard_counts_every_class_and_seed(self):
+        checked, failures = fuzz_shard(0, 20, ["Number", "NumberCalculate"])
+        self.assertEqual(checked, 40)
+        self.assertEqual(failures, [])
+
+    def test_exceptions_reported_with_seed(self):
+        with patch.object(NumberCalculate, "create", side_effect=RuntimeError("boom")):
+            checked, failures = fuzz_shard(5, 8, ["NumberCalculate"])
+        self.assertEqual(checked, 3)
+        self.assertEqual([f["seed"] for f in failures], [5, 6, 7])
+        self.assertIn("boom", failures[0]["error"])
+
+    def test_max_failures_stops_early(self):
+        with patch.object(Number, "create", side_effect=ValueError("bad")):
+            report = run_fuzz(seeds=50, workers=1, class_names=["Number"], shard_size=10, max_failures=3)
+        self.assertEqual(len(report["failures"]), 3)
+
+    def test_run_fuzz_inline(self):
+        report = run_fuzz(seeds=30, workers=1, class_names=["Number"], shard_size=7)
+        self.assertEqual(report["checked"], 30)
+        self.assertEqual(report["failures"], [])
+
+    def test_run_fuzz_validates_arguments(self):
+        with self.assertRaises(ValueError):
+            run_fuzz(seeds=0)
+
+    def test_offline_hides_and_restores_key(self):
+        with patch.dict(os.environ, {"GNEWS_KEY": "secret"}):
+            with _offline():
+                self.assertNotIn("GNEWS_KEY", os.environ)
+            self.assertEqual(os.environ["GNEWS_KEY"], "secret")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Unit tests for normalize module: the fast paths agree with unidecode."""
+
+import random
+import unittest
+from unittest import mock
+
+import normalize
+from normalize import FOLD_TABLE, SHARP_S_TABLE, fold
+from unidecode import unidecode
+
+
+class TestFold(unittest.TestCase):
+    def test_table_matches_unidecode(self):
+        for code, replacement in FOLD_TABLE.items():
+            self.assertEqual(replacement, unidecode(chr(code)), repr(chr(code)))
+
+    def test_random_text_matches_unidecode(self):
+        rng = random.Random(11)
+        alphabet = "abcXYZ 019,.'" + "éèàçôœßÄÖü’«»—… " + "жЖλΩ東京ął€"
+        for _ in range(2000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(fold(text), unidecode(text), repr(text))
+
+    def test_ascii_and_latin_skip_unidecode(self):
+        with mock.patch.object(normalize, "unidecode", wraps=unidecode) as slow:
+            self.assertEqual(fold("B3 c1"), "B3 c1")
+            self.assertEqual(fold("Crème brûlée, Straße"), "Creme brulee, Strasse")
+            slow.assert_not_called()
+            self.assertEqual(fold("Москва é"), "Moskva e")
+            slow.assert_called_once()
+
+    def test_normalize(self):
+        self.assertEqual(normalize.normalize("  Œuvre\n"), "oeuvre")
+        self.assertEqual(normalize.normalize(42), "42")
+
+    def test_sharp_s(self):
+        self.assertEqual("Straße für".translate(SHARP_S_TABLE), "Strasse für")
+
+
+if __name__ == "__main__":
+    unittest.main()
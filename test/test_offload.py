@@ -0,0 +1,105 @@
+"""Unit tests for offload module: heavy-class dispatch and prefetching."""
+
+import threading
+import unittest
+
+from classes import Problem
+from offload import ProblemExecutor, create_many, generation_pool, is_free_threaded, prefetched
+from problems import Anagram, FlightInfo, Number, Road, SentenceCompletion
+
+
+class _ThreadRecordingProblem(Problem):
+    heavy = 'io'
+    threads: list = []
+
+    @classmethod
+    def create(cls, **kwargs):
+        cls.threads.append(threading.current_thread().name)
+        return Problem("Io", "m", "?", "s", 1000)
+
+
+class TestHeavyFlags(unittest.TestCase):
+    """The slow generators are flagged; cheap ones are not."""
+
+    def test_flags(self):
+        self.assertEqual(Anagram.heavy, 'cpu')
+        self.assertEqual(Road.heavy, 'cpu')
+        self.assertEqual(FlightInfo.heavy, 'io')
+        self.assertEqual(SentenceCompletion.heavy, 'io')
+        self.assertIsNone(Number.heavy)
+        self.assertIsNone(Problem.heavy)
+
+
+class TestProblemExecutor(unittest.TestCase):
+    """ProblemExecutor: inline, thread and process dispatch."""
+
+    def test_light_class_created_inline(self):
+        with ProblemExecutor() as ex:
+            future = ex.submit(Number, number_length=5)
+            self.assertTrue(future.done())
+            self.assertEqual(len(future.result().memorize), 5)
+            self.assertIsNone(ex._processes)
+            self.assertIsNone(ex._threads)
+
+    def test_inline_exception_captured_in_future(self):
+        class Broken(Problem):
+            @classmethod
+            def create(cls, **kwargs):
+                raise RuntimeError("boom")
+
+        with ProblemExecutor() as ex:
+            with self.assertRaises(RuntimeError):
+                ex.submit(Broken).result()
+
+    def test_io_class_runs_on_worker_thread(self):
+        _ThreadRecordingProblem.threads = []
+        with ProblemExecutor() as ex:
+            pb = ex.submit(_ThreadRecordingProblem).result(timeout=10)
+        self.assertEqual(pb.name, "Io")
+        self.assertTrue(_ThreadRecordingProblem.threads[0].startswith("problem-io"))
+
+    def test_cpu_class_runs_in_process(self):
+        with ProblemExecutor() as ex:
+            pb = ex.submit(Road).result(timeout=60)
+            self.assertIsNotNone(ex._processes)
+        self.assertIsInstance(pb, Problem)
+        self.assertEqual(pb.name, Road.display_name())
+        self.assertEqual(pb.evaluate_solution(pb.solution), 1.0)
+
+    def test_invalid_worker_counts(self):
+        with self.assertRaises(ValueError):
+            ProblemExecutor(process_workers=0)
+
+
+class TestPrefetched(unittest.TestCase):
+    """prefetched: order preserved, finite sources drained."""
+
+    def test_order_and_drain(self):
+        classes = [Number, _ThreadRecordingProblem, Number]
+        with ProblemExecutor() as ex:
+            names = [pb.name for pb in prefetched(classes, ex, lookahead=2)]
+        self.assertEqual(names, [Number.display_name(), "Io", Number.display_name()])
+
+    def test_negative_lookahead_raises(self):
+        with self.assertRaises(ValueError):
+            list(prefetched([Number], ProblemExecutor(), lookahead=-1))
+
+
+class TestGenerationPool(unittest.TestCase):
+    """generation_pool: thread pool only on free-threaded builds."""
+
+    def test_pool_kind_matches_build(self):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        with generation_pool(1) as pool:
+            expected = ThreadPoolExecutor if is_free_threaded() else ProcessPoolExecutor
+            self.assertIsInstance(pool, expected)
+            self.assertEqual(pool.submit(create_many, Number, 3).result(timeout=60), 3)
+
+    def test_gil_build_is_not_free_threaded(self):
+        from unittest.mock import patch
+        with patch("offload.sysconfig.get_config_var", return_value=0):
+            self.assertFalse(is_free_threaded())
+
+
+if __name__ == "__main__":
+    unittest.main()
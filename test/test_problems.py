@@ -38,7 +38,10 @@ from problems import (
     SentenceCompletion,
     NumberBackward,
     NameAttributePairs,
+    Pseudoword,
     create_problems_dict,
+    create_seeded,
+    regenerate,
 )
 
 
@@ -161,6 +164,11 @@ class TestProblemCreate(unittest.TestCase):
     def test_name_attribute_pairs(self):
         self._test_create(NameAttributePairs)
 
+    def test_pseudoword(self):
+        self._test_create(Pseudoword)
+        pb = Pseudoword.create(length=11, language="german")
+        self.assertEqual(len(pb.memorize), 11)
+
 
 class TestProblemEvaluateNone(unittest.TestCase):
     """Test evaluate_solution with None returns 0.0."""
@@ -300,6 +308,15 @@ class TestProblemEvaluateCorrect(unittest.TestCase):
         self.assertEqual(pb.evaluate_solution("A1"), 1.0)
         self.assertEqual(pb.evaluate_solution("1A"), 1.0)
 
+    def test_matrix_memory_large_grid_multiple_marks(self):
+        pb = MatrixMemory.create(grid_size=16, num_marked=12)
+        self.assertEqual(len(pb.memorize.splitlines()), 16)
+        self.assertEqual(pb.memorize.count("X"), 12)
+        self.assertEqual(pb.evaluate_solution(pb.solution), 1.0)
+        cells = pb.solution.split()
+        self.assertEqual(pb.evaluate_solution(" ".join(reversed(cells))), 1.0)
+        self.assertAlmostEqual(pb.evaluate_solution(" ".join(cells[:6])), 0.5)
+
     def test_color_sequence_single(self):
         pb = ColorSequence("Color Sequence", "R G B", "Color at 1?", "R", 3000, "")
         self.assertEqual(pb.evaluate_solution("R"), 1.0)
@@ -308,6 +325,22 @@ class TestProblemEvaluateCorrect(unittest.TestCase):
     def test_color_sequence_full(self):
         pb = ColorSequence("Color Sequence", "R G B", "Full sequence?", "R G B", 3000, "")
         self.assertEqual(pb.evaluate_solution("R G B"), 1.0)
+        self.assertEqual(pb.evaluate_solution("red green blue"), 1.0)
+        self.assertEqual(pb.evaluate_solution("rgb"), 1.0)
+        self.assertAlmostEqual(pb.evaluate_solution("r b"), 2 / 3)
+
+    def test_word_list_scores_items(self):
+        pb = WordList("Word List", "propre coin comete oubli", ">", "propre coin comete oubli", 4000, "single line")
+        self.assertEqual(pb.evaluate_solution("propre, coin, comete, oubli"), 1.0)
+        self.assertAlmostEqual(pb.evaluate_solution("propre coing comete oubli"), 0.95)
+        self.assertEqual(pb.evaluate_solution("propre comete oubli"), 0.75)
+        self.assertEqual(pb.evaluate_solution(None), 0.0)
+
+    def test_number_list_run_together_uses_characters(self):
+        pb = NumberList("Number List", "12 34 56 78", ">", "12 34 56 78", 2000, "single line")
+        self.assertIsInstance(NumberList.create(), NumberList)
+        self.assertAlmostEqual(pb.evaluate_solution("12345678"), 1 - 3 / 11)
+        self.assertEqual(pb.evaluate_solution("12 34 65 78"), 0.75)
 
     def test_sentence_completion(self):
         pb = SentenceCompletion(
@@ -441,12 +474,44 @@ class TestProblemEvaluateIncorrect(unittest.TestCase):
         pb = MatrixMemory("Matrix Memory", "X . .\n. . .\n. . .", "Which cell?", "A1", 3000, "")
         self.assertLess(pb.evaluate_solution("B2"), 1.0)
 
+    def test_matrix_memory_partial_credit(self):
+        pb = MatrixMemory("Matrix Memory", "X . X\n. . .\n. . .", "Which cells?", "A1 C1", 3000, "")
+        self.assertEqual(pb.evaluate_solution("A1 B2"), 1 / 3)
+        self.assertEqual(pb.evaluate_solution("A1 C1 Z9"), 2 / 3)
+
     def test_levenshtein_partial(self):
         pb = Problem("test", "abc", "?", "abcdef", 1000, "")
         score = pb.evaluate_solution("abcde")
         self.assertGreater(score, 0)
         self.assertLess(score, 1.0)
 
+    def test_recall_problems_count_transpositions_once(self):
+        pb = Number("Number", "123456", ">", "123456", 3000)
+        self.assertAlmostEqual(pb.evaluate_solution("123546"), 1 - 1 / 6)
+        pb = RandomLetters("Random Letters", "stgvbxaf", ">", "stgvbxaf", 2000)
+        self.assertEqual(pb.evaluate_solution("stvgbxaf"), 0.875)
+        self.assertEqual(Problem("T", "m", ">", "stgvbxaf", 2000).evaluate_solution("stvgbxaf"), 0.75)
+        for cls in (Number, NumberLong, RandomLetters, RandomLettersAndNumbers):
+            self.assertIsInstance(cls.create(), cls)
+
+    def test_word_problems_classify_misses(self):
+        from similarity import miss_index
+        random.seed(3)
+        pb = WordPairs.create()
+        self.assertIsInstance(pb, WordPairs)
+        solution = pb.normalized_solution
+        other = next(w for w in miss_index([solution]).words if w != solution)
+        self.assertEqual(pb.classify_miss(other), "intrusion")
+        self.assertEqual(pb.classify_miss(solution[:-1] + "#"), "slip")
+        self.assertIsNone(pb.classify_miss(solution.upper()))
+        self.assertIsNone(pb.classify_miss(None))
+        lst = WordList.create()
+        words = lst.normalized_solution.split()
+        other = next(w for w in miss_index(words).words if w not in words)
+        self.assertEqual(lst.classify_miss(" ".join(words[:-1] + [other])), "intrusion")
+        self.assertIsNone(lst.classify_miss(" ".join(reversed(words))))
+        self.assertIsNone(Number.create().classify_miss("123"))
+
     def test_flight_info_wrong(self):
         pb = FlightInfo.create(num_flights=1)
         self.assertLess(pb.evaluate_solution("wrong answer"), 1.0)
@@ -574,14 +639,93 @@ class TestUtils(unittest.TestCase):
         from utils import levenshtein_distance
         self.assertEqual(levenshtein_distance("ab", "a"), 1)
 
-    def test_load_frequencies(self):
-        from utils import load_frequencies
-        freqs = load_frequencies()
-        self.assertIn("approach", freqs)
-        self.assertIn("tower", freqs)
-        self.assertIn("ground", freqs)
-        self.assertIsInstance(freqs["approach"], list)
-        self.assertGreater(len(freqs["approach"]), 0)
+    def test_levenshtein_distance_matches_dp(self):
+        import random
+        from utils import _levenshtein_dp, levenshtein_distance
+        rng = random.Random(7)
+        for _ in range(500):
+            a = "".join(rng.choice("abcé ") for _ in range(rng.randint(0, 90)))
+            b = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 90)))
+            self.assertEqual(levenshtein_distance(a, b), _levenshtein_dp(a, b), (a, b))
+
+    def test_osa_distance(self):
+        from utils import osa_distance
+        self.assertEqual(osa_distance("stvgbxaf", "stgvbxaf"), 1)
+        self.assertEqual(osa_distance("ab", "ba"), 1)
+        self.assertEqual(osa_distance("ca", "abc"), 3)
+        self.assertEqual(osa_distance("kitten", "sitting"), 3)
+        self.assertEqual(osa_distance("", "abc"), 3)
+
+    def test_osa_distance_matches_dp(self):
+        import random
+        from utils import _osa_dp, osa_distance
+        rng = random.Random(9)
+        for _ in range(800):
+            a = "".join(rng.choice("abcé") for _ in range(rng.randint(0, 80)))
+            b = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 80)))
+            self.assertEqual(osa_distance(a, b), _osa_dp(a, b), (a, b))
+
+    def test_incremental_distance_matches_full(self):
+        import random
+        from utils import IncrementalDistance, levenshtein_distance
+        rng = random.Random(5)
+        for target in ("", "kitten", "a" * 70 + "b"):
+            tracker = IncrementalDistance(target)
+            self.assertEqual(tracker.distance, len(target))
+            for _ in range(120):
+                if tracker.text and rng.random() < 0.3:
+                    tracker.pop()
+                else:
+                    tracker.push(rng.choice("abiknst"))
+                self.assertEqual(tracker.distance, levenshtein_distance(tracker.text, target))
+
+    def test_incremental_distance_transpositions(self):
+        import random
+        from utils import IncrementalDistance, osa_distance
+        rng = random.Random(6)
+        for target in ("", "ca", "4815162342", "ab" * 40):
+            tracker = IncrementalDistance(target, transpositions=True)
+            for _ in range(150):
+                if tracker.text and rng.random() < 0.3:
+                    tracker.pop()
+                else:
+                    tracker.push(rng.choice("abc12458"))
+                self.assertEqual(tracker.distance, osa_distance(tracker.text, target), (tracker.text, target))
+        tracker = IncrementalDistance("4815", transpositions=True)
+        for char in "8415":
+            tracker.push(char)
+        self.assertEqual(tracker.distance, 1)
+
+    def test_incremental_distance_score(self):
+        from classes import Problem
+        from utils import IncrementalDistance
+        tracker = IncrementalDistance("sitting")
+        for char in "kitten":
+            tracker.push(char)
+        problem = Problem("T", "m", "p", "sitting", 1000)
+        self.assertEqual(tracker.score, problem.evaluate_solution("kitten"))
+        self.assertEqual(IncrementalDistance("").score, 1.0)
+        self.assertEqual(IncrementalDistance("ab").pop(), 2)
+
+    def test_distance_at_most(self):
+        from utils import distance_at_most
+        self.assertEqual(distance_at_most("kitten", "sitting", 3), 3)
+        self.assertIsNone(distance_at_most("kitten", "sitting", 2))
+        self.assertIsNone(distance_at_most("a", "abcd", 2))
+        self.assertEqual(distance_at_most("same", "same", 0), 0)
+        with self.assertRaises(ValueError):
+            distance_at_most("a", "b", -1)
+
+    def test_distance_at_most_matches_dp(self):
+        import random
+        from utils import _levenshtein_dp, distance_at_most
+        rng = random.Random(11)
+        for _ in range(300):
+            a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 40)))
+            b = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 40)))
+            d = _levenshtein_dp(a, b)
+            for k in (0, 1, 2, 3, 6, 20):
+                self.assertEqual(distance_at_most(a, b, k), d if d <= k else None, (a, b, k))
 
     def test_rnd_number(self):
         from utils import rnd_number
@@ -712,6 +856,25 @@ class TestProblemCoverageBranches(unittest.TestCase):
         self.assertGreater(pb.evaluate_solution("tsilen"), 0.0)
         self.assertLess(pb.evaluate_solution("tsilen"), 1.0)
 
+    def test_anagram_accepts_other_dictionary_anagram(self):
+        import problems
+        orig_words = problems.words
+        try:
+            problems.words = [[], ["listen", "silent", "enlist"]]
+            problems._normalized_dicts.pop(1, None)
+            pb = Anagram("Anagram", "tinsel (English)", ">", "listen", 3000, "single line")
+            self.assertEqual(pb._dict_index, 1)
+            self.assertEqual(pb.evaluate_solution("Enlist"), 1.0)
+            self.assertLess(pb.evaluate_solution("tinsel"), 1.0)
+        finally:
+            problems.words = orig_words
+            problems._normalized_dicts.pop(1, None)
+
+    def test_matrix_memory_caches_solution_board(self):
+        pb = MatrixMemory("Matrix Memory", ". X .\n. . .\n. . X", "?", "B1 C3", 3000, "matrix")
+        self.assertEqual(pb._prepared[0], 3)
+        self.assertEqual(pb.evaluate_solution("c3 1b"), 1.0)
+
     def test_sentence_completion_create_many_seeds(self):
         for seed in range(60):
             random.seed(seed)
@@ -774,5 +937,66 @@ class TestProblemCoverageBranches(unittest.TestCase):
             self.assertEqual(d, {})
 
 
+class TestSentenceCompletionClaims(unittest.TestCase):
+    """SentenceCompletion hands out each headline once under concurrent create()."""
+
+    def test_sentence_completion_claims_each_headline_once(self):
+        from concurrent.futures import ThreadPoolExecutor
+        headlines = [f"Headline number {i} about things" for i in range(50)]
+        saved = SentenceCompletion._used_sentences
+        try:
+            SentenceCompletion._used_sentences = frozenset()
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                claimed = list(pool.map(lambda _: SentenceCompletion._claim_unused(headlines), range(60)))
+            picked = [c for c in claimed if c is not None]
+            self.assertEqual(len(picked), 50)
+            self.assertEqual(set(picked), set(headlines))
+            self.assertIsInstance(SentenceCompletion._used_sentences, frozenset)
+        finally:
+            SentenceCompletion._used_sentences = saved
+
+
+class TestSeededCreation(unittest.TestCase):
+    """create_seeded / regenerate: same seed gives the same problem."""
+
+    def test_same_seed_same_problem(self):
+        a = create_seeded(Number, 1234, number_length=6)
+        b = regenerate("Number", {"number_length": 6}, 1234)
+        self.assertEqual(a.to_dict(), b.to_dict())
+        self.assertEqual(a._origin, {"generator": "Number", "params": {"number_length": 6}, "seed": 1234})
+
+    def test_global_random_state_untouched(self):
+        random.seed(7)
+        expected = [random.random() for _ in range(3)]
+        random.seed(7)
+        create_seeded(WordList, 99)
+        self.assertEqual([random.random() for _ in range(3)], expected)
+
+    def test_independent_of_global_random(self):
+        """Every reproducible generator draws only from its seeded rng, never the random module."""
+        from unittest.mock import patch
+        classes = [cls for cls in create_problems_dict() if cls.reproducible]
+        expected = {cls: create_seeded(cls, 5).to_dict() for cls in classes}
+        names = ("random", "randint", "randrange", "choice", "choices", "sample", "shuffle", "uniform",
+                 "getrandbits", "seed", "getstate", "setstate")
+        patches = [patch.object(random, name, side_effect=AssertionError(f"global random.{name}"))
+                   for name in names]
+        for p in patches:
+            p.start()
+        try:
+            for cls in classes:
+                self.assertEqual(create_seeded(cls, 5).to_dict(), expected[cls], cls.__name__)
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_unknown_generator(self):
+        self.assertIsNone(regenerate("NoSuchProblem", {}, 1))
+
+    def test_network_generator_not_reproducible(self):
+        self.assertFalse(SentenceCompletion.reproducible)
+        self.assertTrue(Number.reproducible)
+
+
 if __name__ == "__main__":
     unittest.main()
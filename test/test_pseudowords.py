@@ -0,0 +1,67 @@
+"""Unit tests for pseudowords module: n-gram tables and generation."""
+
+import random
+import unittest
+
+from pseudowords import LANGUAGES, NgramModel, model_for, pseudoword
+
+
+class TestNgramModel(unittest.TestCase):
+    """NgramModel: lengths, transitions seen in training, real-word rejection."""
+
+    def test_exact_lengths(self):
+        model = NgramModel(["banana", "bandana", "cabana"])
+        rng = random.Random(0)
+        for length in (1, 2, 5, 30):
+            self.assertEqual(len(model.generate(length, rng)), length)
+
+    def test_only_trained_trigrams_inside_words(self):
+        corpus = ["stone", "store", "story", "stare"]
+        model = NgramModel(corpus)
+        trigrams = {("^^" + w)[i:i + 3] for w in corpus for i in range(len(w))}
+        rng = random.Random(1)
+        for _ in range(200):
+            word = model.generate(5, rng)
+            for i in range(5):
+                self.assertIn(("^^" + word)[i:i + 3], trigrams, word)
+
+    def test_final_character_from_word_endings(self):
+        model = NgramModel(["ab", "cb", "ad"])
+        rng = random.Random(2)
+        self.assertTrue(all(model.generate(4, rng)[-1] in "bd" for _ in range(100)))
+
+    def test_real_words_rejected(self):
+        model = NgramModel(["ab", "ba"], order=1)
+        rng = random.Random(3)
+        for _ in range(20):
+            self.assertIn(model.pseudoword(2, rng, max_tries=50), ("aa", "bb"))
+
+    def test_lower_orders(self):
+        rng = random.Random(4)
+        self.assertEqual(len(NgramModel(["abc"], order=1).generate(6, rng)), 6)
+        self.assertEqual(len(NgramModel(["abc"], order=2).generate(6, rng)), 6)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            NgramModel([])
+        with self.assertRaises(ValueError):
+            NgramModel(["a"]).generate(0)
+
+
+class TestLanguageModels(unittest.TestCase):
+    """model_for trains each dictionary once."""
+
+    def test_every_language(self):
+        for language in LANGUAGES:
+            word = pseudoword(8, language, random.Random(5))
+            self.assertEqual(len(word), 8)
+            self.assertTrue(word.isalpha(), word)
+            self.assertIs(model_for(language), model_for(language))
+
+    def test_unknown_language(self):
+        with self.assertRaises(ValueError):
+            model_for("klingon")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Unit tests for rescore module: records rescored in place, files streamed through gzip."""
+
+import gzip
+import io
+import json
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+import rescore
+from classes import Problem
+from problems import Anagram, NumberCalculate, WordList, create_seeded
+from rescore import rescore_file, rescore_line, rescore_session
+from sessions import _compact_problem
+
+
+def _record(problem_dict, response, score):
+    return {"problem": problem_dict, "response": response, "response_ms": 900,
+            "score": score, "correct": score >= 1.0}
+
+
+def _session(records):
+    correct = sum(1 for r in records if r["correct"])
+    return {"date": "2025-01-15 12:00:00", "duration_seconds": 60, "total_questions": len(records),
+            "correct_answers": correct, "score_percentage": round(correct / len(records) * 100, 1),
+            "records": records}
+
+
+def _number_calculate():
+    return NumberCalculate("Number Calculate", "3 + 9", "?", "12", 3000).to_dict()
+
+
+class TestRescoreSession(unittest.TestCase):
+    def test_current_scorer_applied(self):
+        # Scored 0.5 when answers were compared as text; Numeric now accepts it.
+        session = _session([_record(_number_calculate(), "12.0", 0.5)])
+        stats = rescore_session(session)
+        record = session["records"][0]
+        self.assertEqual((record["score"], record["correct"]), (1.0, True))
+        self.assertEqual((session["correct_answers"], session["score_percentage"]), (1, 100.0))
+        self.assertEqual(stats, {"sessions": 1, "records": 1, "changed": 1, "flipped": 1, "skipped": 0})
+
+    def test_miss_dropped_when_correct(self):
+        record = dict(_record(_number_calculate(), "12.0", 0.5), miss="other")
+        session = _session([record, dict(_record(_number_calculate(), "13", 0.5), miss="other")])
+        rescore_session(session)
+        self.assertNotIn("miss", session["records"][0])
+        self.assertEqual(session["records"][1]["miss"], "other")
+
+    def test_unchanged_records(self):
+        session = _session([_record(_number_calculate(), "12", 1.0), _record(_number_calculate(), "", 0.0)])
+        stats = rescore_session(session)
+        self.assertEqual((stats["changed"], stats["flipped"], stats["skipped"]), (0, 0, 0))
+
+    def test_unknown_type_skipped(self):
+        problem = Problem("Retired Problem", "m", "?", "abcd", 3000).to_dict()
+        session = _session([_record(problem, "abce", 0.0)])
+        stats = rescore_session(session)
+        self.assertEqual(stats["skipped"], 1)
+        self.assertEqual(session["records"][0]["score"], 0.0)
+
+    def test_stream_records_skipped(self):
+        problem = Problem("N Back Stream", "A B C D", "2-back stream", "none", 500, "stream").to_dict()
+        session = _session([_record(problem, "", 1.0)])
+        stats = rescore_session(session)
+        self.assertEqual(stats["skipped"], 1)
+        self.assertEqual((session["records"][0]["score"], session["correct_answers"]), (1.0, 1))
+
+    def test_anagram_dictionary_restored(self):
+        import problems
+        orig_words = problems.words
+        try:
+            problems.words = [[], ["care", "acre", "race"]]
+            problems._normalized_dicts.pop(1, None)
+            problem = Anagram("Anagram", "rcae (English)", ">", "care", 3000, "single line").to_dict()
+            session = _session([_record(problem, "acre", 1.0)])
+            stats = rescore_session(session)
+            self.assertEqual((stats["changed"], session["records"][0]["score"]), (0, 1.0))
+        finally:
+            problems.words = orig_words
+            problems._normalized_dicts.pop(1, None)
+
+    def test_unrebuildable_records_skipped(self):
+        stale = {"name": "Word List", "generator": "WordList", "params": {}, "seed": 1, "checksum": "00000000"}
+        session = _session([_record(stale, "x", 0.5), _record({"name": "Broken"}, "x", 0.25)])
+        stats = rescore_session(session)
+        self.assertEqual(stats["skipped"], 2)
+        self.assertEqual([r["score"] for r in session["records"]], [0.5, 0.25])
+
+    def test_seed_only_problem_kept_compact(self):
+        random.seed(2)
+        problem = create_seeded(WordList, 1234)
+        compact = _compact_problem(problem)
+        self.assertIn("seed", compact)
+        line, stats = rescore_line(json.dumps(_session([_record(compact, problem.solution, 0.0)])))
+        record = json.loads(line)["records"][0]
+        self.assertEqual(record["problem"], compact)
+        self.assertEqual(record["score"], 1.0)
+        self.assertEqual(stats["skipped"], 0)
+
+    def test_key_order_preserved(self):
+        session = _session([_record(_number_calculate(), "12", 1.0)])
+        line, _ = rescore_line(json.dumps(session))
+        self.assertEqual(list(json.loads(line)), list(session))
+        self.assertEqual(list(json.loads(line)["records"][0]), list(session["records"][0]))
+
+
+class TestRescoreFile(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "sessions.json.gzip"
+        self.sessions = [_session([_record(_number_calculate(), answer, 0.5)]) for answer in ("12.0", "13", "12")]
+        content = "".join(json.dumps(s, ensure_ascii=False) + "\n" for s in self.sessions)
+        self.path.write_bytes(gzip.compress(content.encode("utf-8")))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _read(self, path):
+        return [json.loads(line) for line in gzip.decompress(path.read_bytes()).decode("utf-8").splitlines()]
+
+    def test_in_place(self):
+        seen = []
+        totals = rescore_file(self.path, workers=1, progress=lambda t, f: seen.append((t["sessions"], f)))
+        self.assertEqual((totals["sessions"], totals["records"], totals["changed"], totals["flipped"]), (3, 3, 2, 2))
+        self.assertEqual([s for s, _ in seen], [1, 2, 3])
+        self.assertEqual(seen[-1][1], 1.0)
+        scores = [s["records"][0]["score"] for s in self._read(self.path)]
+        self.assertEqual(scores[0], 1.0)
+        self.assertLess(scores[1], 1.0)
+        self.assertEqual(scores[2], 1.0)
+        self.assertFalse(list(Path(self.dir.name).glob("*.tmp")))
+
+    def test_output_and_pool_agree_with_inline(self):
+        inline = Path(self.dir.name) / "inline.json.gzip"
+        pooled = Path(self.dir.name) / "pooled.json.gzip"
+        rescore_file(self.path, inline, workers=1)
+        rescore_file(self.path, pooled, workers=2)
+        self.assertEqual(self._read(inline), self._read(pooled))
+        self.assertEqual(self._read(self.path), self.sessions)
+
+    def test_plain_text_input(self):
+        plain = Path(self.dir.name) / "plain.jsonl"
+        plain.write_text("\n" + json.dumps(self.sessions[0]) + "\n\n", encoding="utf-8")
+        out = Path(self.dir.name) / "out.json.gzip"
+        totals = rescore_file(plain, out, workers=1)
+        self.assertEqual(totals["sessions"], 1)
+        self.assertEqual(self._read(out)[0]["records"][0]["score"], 1.0)
+
+    def test_dry_run_writes_nothing(self):
+        before = self.path.read_bytes()
+        totals = rescore_file(self.path, workers=1, dry_run=True)
+        self.assertEqual(totals["changed"], 2)
+        self.assertEqual(self.path.read_bytes(), before)
+
+    def test_failure_leaves_input_untouched(self):
+        before = self.path.read_bytes()
+        with self.assertRaises(RuntimeError):
+            rescore_file(self.path, workers=1, progress=lambda t, f: (_ for _ in ()).throw(RuntimeError()))
+        self.assertEqual(self.path.read_bytes(), before)
+        self.assertFalse(list(Path(self.dir.name).glob("*.tmp")))
+
+    def test_main(self):
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            self.assertEqual(rescore.main([str(self.path), "-j", "1", "-q"]), 0)
+        self.assertIn("Rescored 3 records in 3 sessions", out.getvalue())
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(rescore.main([str(self.path) + ".missing"]), 1)
+            self.assertEqual(rescore.main([str(self.path), "-j", "0"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for scoring module: each scorer, the registry, and batch scoring."""
+
+import random
+import unittest
+
+import scoring
+from classes import Problem
+from problems import (ColorSequence, MatrixMemory, NBack, NumberCalculate, Sternberg, WordList,
+                      create_problems_dict)
+from scoring import (CellSet, EditDistance, Numeric, Scorer, TokenAligned, YesNo, normalize,
+                     scorer_for)
+
+
+def _problem(solution, cls=Problem, memorize="m"):
+    return cls("T", memorize, "p", solution, 1000)
+
+
+class TestScorers(unittest.TestCase):
+    def test_normalize(self):
+        self.assertEqual(normalize("  Éclair "), "eclair")
+        self.assertEqual(normalize(12), "12")
+
+    def test_edit_distance_is_default(self):
+        pb = _problem("abcd")
+        self.assertIsInstance(Problem.scorer, EditDistance)
+        self.assertEqual(pb.evaluate_solution("abcd"), 1.0)
+        self.assertEqual(pb.evaluate_solution("abce"), 0.75)
+        self.assertEqual(pb.evaluate_solution(None), 0.0)
+
+    def test_edit_distance_transpositions(self):
+        pb = _problem("stgvbxaf")
+        self.assertEqual(EditDistance(transpositions=True).score(pb, "stvgbxaf"), 0.875)
+        self.assertEqual(EditDistance().score(pb, "stvgbxaf"), 0.75)
+        self.assertEqual(repr(EditDistance(transpositions=True)), "EditDistance(transpositions=True)")
+
+    def test_yes_no(self):
+        pb = _problem("yes", NBack)
+        self.assertIsInstance(NBack.scorer, YesNo)
+        self.assertIsInstance(Sternberg.scorer, YesNo)
+        self.assertEqual(pb.evaluate_solution(" Y "), 1.0)
+        self.assertEqual(pb.evaluate_solution("n"), 0.0)
+        self.assertEqual(pb.evaluate_solution("yse"), YesNo().score(pb, "yse"))
+        self.assertGreater(pb.evaluate_solution("yse"), 0.0)
+
+    def test_numeric(self):
+        pb = _problem("12", NumberCalculate)
+        self.assertEqual(pb._prepared, 12.0)
+        self.assertEqual(pb.evaluate_solution("12.0"), 1.0)
+        self.assertEqual(pb.evaluate_solution("+12"), 1.0)
+        self.assertLess(pb.evaluate_solution("13"), 1.0)
+        self.assertEqual(pb.evaluate_solution("twelve"), EditDistance().score(pb, "twelve"))
+
+    def test_numeric_solution_not_a_number(self):
+        pb = _problem("abc", NumberCalculate)
+        self.assertIsNone(pb._prepared)
+        self.assertEqual(pb.evaluate_solution("abc"), 1.0)
+
+    def test_cell_set(self):
+        pb = MatrixMemory("Matrix Memory", ". X\nX .", "?", "B1 A2", 3000)
+        self.assertIsInstance(MatrixMemory.scorer, CellSet)
+        self.assertEqual(pb.evaluate_solution("a2, b1"), 1.0)
+        self.assertEqual(pb.evaluate_solution("A2"), 0.5)
+
+    def test_token_aligned(self):
+        pb = _problem("one two three", WordList)
+        self.assertEqual(pb._prepared.items, ("one", "two", "three"))
+        self.assertEqual(pb.evaluate_solution("one, two; three"), 1.0)
+        self.assertAlmostEqual(pb.evaluate_solution("one three"), 2 / 3)
+        self.assertEqual(pb.evaluate_solution("onetwothree"), EditDistance().score(pb, "onetwothree"))
+
+    def test_token_aligned_aliases_and_runs(self):
+        scorer = ColorSequence.scorer
+        pb = _problem("r g b y", ColorSequence)
+        self.assertEqual(scorer.score(pb, "red green blue yellow"), 1.0)
+        self.assertEqual(scorer.score(pb, "rgby"), 1.0)
+        self.assertEqual(TokenAligned().score(pb, "rgby"), EditDistance().score(pb, "rgby"))
+
+    def test_base_scorer(self):
+        with self.assertRaises(NotImplementedError):
+            Scorer().score(_problem("a"), "a")
+        self.assertIsNone(Scorer().prepare(_problem("a")))
+        self.assertEqual(repr(Numeric()), "Numeric()")
+        self.assertIn("run_alphabet='bgry'", repr(ColorSequence.scorer))
+
+
+class TestScoreMany(unittest.TestCase):
+    def test_score_many_matches_score(self):
+        random.seed(7)
+        for cls in create_problems_dict():
+            problems = [cls.create() for _ in range(5)]
+            responses = [problems[0].solution, None, "", "a", problems[-1].solution[::-1]]
+            self.assertEqual(cls.scorer.score_many(problems, responses),
+                             [cls.scorer.score(pb, r) for pb, r in zip(problems, responses)], cls.__name__)
+
+
+class TestScorerFor(unittest.TestCase):
+    def test_by_class_and_display_name(self):
+        self.assertIs(scorer_for("WordList"), WordList.scorer)
+        self.assertIs(scorer_for(WordList.display_name()), WordList.scorer)
+        self.assertIs(scorer_for("NBack"), NBack.scorer)
+
+    def test_unknown_name_gets_default(self):
+        self.assertIs(scorer_for("No Such Problem"), scoring.DEFAULT)
+
+    def test_every_problem_class_registered(self):
+        for cls in create_problems_dict():
+            self.assertIs(scorer_for(cls.__name__), cls.scorer)
+
+    def test_concurrent_first_lookups(self):
+        from concurrent.futures import ThreadPoolExecutor
+        saved = scoring._by_name
+        scoring._by_name = None
+        try:
+            with ThreadPoolExecutor(8) as pool:
+                found = list(pool.map(scoring.problem_class, ["Word List"] * 64))
+            self.assertEqual(found, [WordList] * 64)
+        finally:
+            scoring._by_name = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
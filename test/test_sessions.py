@@ -8,10 +8,14 @@ from datetime import datetime
 from pathlib import Path
 
 from classes import Problem, Record
+from problems import NumberCalculate
 
 from sessions import (
+    SessionView,
+    _compact_problem,
     _read_file_content,
     _read_sessions,
+    expand_problem,
     format_score,
     load_session_statistics,
     save_session_data,
@@ -106,6 +110,77 @@ class TestReadSessions(unittest.TestCase):
         self.assertEqual(out[0]["records"][0]["response"], "gzip")
 
 
+class TestSessionView(unittest.TestCase):
+    """SessionView decodes only what is accessed and matches json.loads."""
+
+    def _line(self, records):
+        return json.dumps(_make_session_dict(records), ensure_ascii=False)
+
+    def test_header_read_without_decoding_records(self):
+        view = SessionView(self._line([_make_record_dict()]))
+        self.assertEqual(view["total_questions"], 1)
+        self.assertEqual(view.get("missing", 7), 7)
+        self.assertIsNone(view._data)
+
+    def test_record_views_fast_path(self):
+        name = 'Quote "x" \\ café'
+        records = [
+            _make_record_dict(problem_dict=_make_problem(name=name).to_dict(), response='"response_ms": 1}', response_ms=5, score=0.25),
+            _make_record_dict(response_ms=7, score=1.0),
+        ]
+        view = SessionView(self._line(records))
+        views = view.record_views()
+        self.assertIsNone(view._data)
+        self.assertEqual([(r.name, r.score, r.correct, r.response_ms) for r in views],
+                         [(name, 0.25, False, 5), ("Test", 1.0, True, 7)])
+
+    def test_record_without_score_falls_back(self):
+        rec = _make_record_dict()
+        del rec["score"]
+        views = SessionView(self._line([rec])).record_views()
+        self.assertEqual(len(views), 1)
+        self.assertIsNone(views[0].score)
+        self.assertTrue(views[0].correct)
+
+    def test_null_score_falls_back(self):
+        records = [dict(_make_record_dict(response_ms=3), score=None), _make_record_dict(score=0.5)]
+        views = SessionView(self._line(records)).record_views()
+        self.assertEqual([(r.score, r.response_ms) for r in views], [(None, 3), (0.5, 1000)])
+
+    def test_reordered_keys_fall_back(self):
+        # The first record keeps its name up front but not its tail, the second
+        # the other way round: one name and one tail match, from different records.
+        first = _make_record_dict(problem_dict=_make_problem(name="First").to_dict(), response_ms=3, score=0.5)
+        first = {k: first[k] for k in ("problem", "response", "score", "response_ms", "correct")}
+        second = _make_record_dict(problem_dict=_make_problem(name="Second").to_dict(), response_ms=9, score=1.0)
+        second["problem"] = {k: v for k, v in reversed(second["problem"].items())}
+        views = SessionView(self._line([first, second])).record_views()
+        self.assertEqual([(r.name, r.score, r.correct, r.response_ms) for r in views],
+                         [("First", 0.5, False, 3), ("Second", 1.0, True, 9)])
+
+    def test_materialize_and_to_dict(self):
+        rec = _make_record_dict(response="b a", response_ms=1200, score=1.0)
+        view = SessionView(self._line([rec]))
+        record = view.record_views()[0].materialize()
+        self.assertIsInstance(record, Record)
+        self.assertEqual(record.problem, _make_problem())
+        self.assertEqual(record.response_ms, 1200)
+        self.assertEqual(view.to_dict(), _make_session_dict([rec]))
+        self.assertEqual(dict(view), _make_session_dict([rec]))
+
+    def test_materialize_uses_problem_class(self):
+        problem = _make_problem(name="Number Calculate", memorize="3 + 9", solution="12")
+        rec = _make_record_dict(problem.to_dict(), response="12.0", score=1.0)
+        record = SessionView(self._line([rec])).record_views()[0].materialize()
+        self.assertIsInstance(record.problem, NumberCalculate)
+        self.assertEqual(record.problem.evaluate_solution("12.0"), 1.0)
+
+    def test_materialize_stale_is_none(self):
+        stale = {"name": "Number", "generator": "Number", "params": {}, "seed": 1, "checksum": "00000000"}
+        rec = dict(_make_record_dict(), problem=stale)
+        self.assertIsNone(SessionView(self._line([rec])).record_views()[0].materialize())
+
+
 # --- format_score ------------------------------------------------------------------
 
 
@@ -290,6 +365,97 @@ class TestSaveSessionData(unittest.TestCase):
         finally:
             sessions_mod._SESSIONS_FILE = original
 
+    def test_compact_save_stores_seed_for_seeded_problems(self):
+        import sessions as sessions_mod
+        from problems import Number, create_seeded
+        original = sessions_mod._SESSIONS_FILE
+        try:
+            sessions_mod._SESSIONS_FILE = self.path
+            seeded = create_seeded(Number, 42)
+            plain = _make_problem(name="Plain")
+            records = [Record(seeded, "1", 800, 0.0), Record(plain, "b a", 900, 1.0)]
+            start = datetime(2025, 2, 1, 10, 0, 0)
+            save_session_data(start, start.timestamp(), 2, 1, records, compact=True)
+            stored = [r["problem"] for r in json.loads(_read_file_content(self.path))["records"]]
+            self.assertEqual(stored[0]["generator"], "Number")
+            self.assertEqual(stored[0]["seed"], 42)
+            self.assertNotIn("memorize", stored[0])
+            self.assertIn("payload", stored[0])
+            self.assertEqual(stored[1], plain.to_dict())
+            self.assertEqual(expand_problem(stored[0]), seeded.to_dict())
+            self.assertEqual(expand_problem(stored[1]), plain.to_dict())
+        finally:
+            sessions_mod._SESSIONS_FILE = original
+
+    def test_extra_fields_precede_records(self):
+        import sessions as sessions_mod
+        original = sessions_mod._SESSIONS_FILE
+        try:
+            sessions_mod._SESSIONS_FILE = self.path
+            records = [Record(_make_problem(), "b a", 900, 1.0)]
+            start = datetime(2025, 2, 1, 10, 0, 0)
+            save_session_data(start, start.timestamp(), 1, 1, records, extra={"nback_stream": {"hits": 3}})
+            view = _read_sessions(self.path)[0]
+            self.assertEqual(view["nback_stream"], {"hits": 3})
+            self.assertIsNone(view._data)
+            self.assertEqual(len(view.record_views()), 1)
+        finally:
+            sessions_mod._SESSIONS_FILE = original
+
+    def test_miss_stored_before_response_ms(self):
+        import sessions as sessions_mod
+        original = sessions_mod._SESSIONS_FILE
+        try:
+            sessions_mod._SESSIONS_FILE = self.path
+            records = [Record(_make_problem(), "b c", 900, 0.5, "slip"), Record(_make_problem(), "b a", 800, 1.0)]
+            start = datetime(2025, 2, 1, 10, 0, 0)
+            save_session_data(start, start.timestamp(), 2, 1, records)
+            stored = json.loads(_read_file_content(self.path))["records"]
+            self.assertEqual(list(stored[0]), ["problem", "response", "miss", "response_ms", "score", "correct"])
+            self.assertNotIn("miss", stored[1])
+            view = _read_sessions(self.path)[0]
+            views = view.record_views()
+            self.assertIsNone(view._data)  # the fast path still reads every record
+            self.assertEqual([v.score for v in views], [0.5, 1.0])
+            self.assertEqual(views[0].materialize().miss, "slip")
+            self.assertIsNone(views[1].materialize().miss)
+        finally:
+            sessions_mod._SESSIONS_FILE = original
+
+
+class TestExpandProblem(unittest.TestCase):
+    """expand_problem falls back to the payload copy, or flags entries it cannot rebuild."""
+
+    def test_generator_changed_after_save(self):
+        from unittest import mock
+        from problems import Number, create_seeded
+        seeded = create_seeded(Number, 42)
+        compact = _compact_problem(seeded)
+        self.assertIn("seed", compact)
+        changed = classmethod(lambda cls, number_length=6, rng=None, **kwargs:
+                              Number(cls.display_name(), "0" * number_length, ">", "0" * number_length, 3000))
+        with mock.patch.object(Number, "create", changed):
+            self.assertEqual(expand_problem(compact), seeded.to_dict())
+            rec = dict(_make_record_dict(), problem=compact)
+            line = json.dumps(_make_session_dict([rec]))
+            record = SessionView(line).record_views()[0].materialize()
+        self.assertEqual(record.problem.solution, seeded.solution)
+
+    def test_payload_not_matching_checksum_is_stale(self):
+        entry = {"name": "Number", "generator": "Number", "params": {}, "seed": 1, "checksum": "00000000",
+                 "payload": {"memorize": "1", "prompt": ">", "solution": "1", "exposure_ms": 3000}}
+        self.assertTrue(expand_problem(entry)["stale"])
+
+    def test_checksum_mismatch_is_stale(self):
+        entry = {"name": "Number", "generator": "Number", "params": {}, "seed": 1, "checksum": "00000000"}
+        self.assertTrue(expand_problem(entry)["stale"])
+
+    def test_missing_generator_is_stale(self):
+        entry = {"name": "Gone", "generator": "Gone", "params": {}, "seed": 1, "checksum": "00000000"}
+        expanded = expand_problem(entry)
+        self.assertTrue(expanded["stale"])
+        self.assertEqual(expanded["name"], "Gone")
+
 
 # --- Full JSON round-trip (integration) ------------------------------------------
 
@@ -0,0 +1,141 @@
+"""Unit tests for similarity module: deletion index and confusable-free sampling."""
+
+import random
+import unittest
+from unittest import mock
+
+from problems import NameAttributePairs, WordNumberPairs, WordPairs
+import similarity
+import utils
+from similarity import (INTRUSION, NEAR_WORD, OTHER, SLIP, DeletionIndex, classify_miss, deletion_variants,
+                        index_for, language_index, miss_index, sample_distinct, worst_miss)
+from utils import levenshtein_distance
+
+_CORPUS = ["rocky", "rocks", "rock", "frock", "leeds", "seeds", "lends", "metals", "petals",
+           "metal", "jill", "jilt", "hill", "abcd", "abdc", "stone", "tones"]
+
+
+def _confusable(sample, d=1):
+    return [(a, b) for i, a in enumerate(sample) for b in sample[i + 1:] if levenshtein_distance(a, b) <= d]
+
+
+class TestDeletionIndex(unittest.TestCase):
+    """neighbours() agrees with a brute-force scan."""
+
+    def test_deletion_variants(self):
+        self.assertEqual(deletion_variants("abc", 1), {"abc", "bc", "ac", "ab"})
+        self.assertIn("a", deletion_variants("abc", 2))
+
+    def test_neighbours_match_brute_force(self):
+        for d in (1, 2):
+            index = DeletionIndex(_CORPUS, d)
+            for word in _CORPUS + ["rockz", "xyz"]:
+                expected = {w for w in _CORPUS if w != word and levenshtein_distance(w, word) <= d}
+                self.assertEqual(index.neighbours(word), expected, (word, d))
+
+    def test_transposition_is_not_distance_one(self):
+        self.assertNotIn("abdc", DeletionIndex(_CORPUS, 1).neighbours("abcd"))
+
+    def test_duplicates_collapsed(self):
+        self.assertEqual(len(DeletionIndex(["a", "b", "a"])), 2)
+
+    def test_nearest_matches_brute_force(self):
+        index = DeletionIndex(_CORPUS, 2)
+        for word in _CORPUS + ["rockz", "xyz", ""]:
+            for k in (0, 1, 2):
+                expected = sorted(((w, levenshtein_distance(w, word)) for w in _CORPUS
+                                   if levenshtein_distance(w, word) <= k), key=lambda p: (p[1], p[0]))
+                self.assertEqual(index.nearest(word, k), expected, (word, k))
+
+    def test_nearest_bound(self):
+        index = DeletionIndex(_CORPUS, 1)
+        self.assertEqual(index.nearest("rocky")[0], ("rocky", 0))
+        with self.assertRaises(ValueError):
+            index.nearest("rock", 2)
+
+    def test_contains(self):
+        index = DeletionIndex(_CORPUS, 1)
+        self.assertIn("rock", index)
+        self.assertNotIn("roc", index)  # a deletion variant, not a word
+
+    def test_index_cached_per_list(self):
+        corpus = list(_CORPUS)
+        self.assertIs(index_for(corpus), index_for(corpus))
+        self.assertIsNot(index_for(corpus), index_for(corpus, 2))
+
+
+class TestClassifyMiss(unittest.TestCase):
+    def setUp(self):
+        self.index = DeletionIndex(_CORPUS, 1)
+
+    def test_labels(self):
+        self.assertIsNone(classify_miss("stone", ["stone"], self.index))
+        self.assertEqual(classify_miss("tones", ["stone"], self.index), INTRUSION)
+        self.assertEqual(classify_miss("stona", ["stone"], self.index), SLIP)
+        self.assertEqual(classify_miss("jilx", ["stone"], self.index), NEAR_WORD)
+        self.assertEqual(classify_miss("qwerty", ["stone"], self.index), OTHER)
+
+    def test_expected_word_outside_the_index(self):
+        self.assertEqual(classify_miss("plumo", ["plume"], self.index), SLIP)
+
+    def test_tie_goes_to_slip(self):
+        # "rocki" is one edit from both "rocky" (expected) and "rocks".
+        self.assertEqual(classify_miss("rocki", ["rocky"], self.index), SLIP)
+
+    def test_worst_miss(self):
+        self.assertEqual(worst_miss([SLIP, OTHER, INTRUSION]), INTRUSION)
+        self.assertEqual(worst_miss([OTHER, None]), OTHER)
+        self.assertIsNone(worst_miss([None]))
+
+    def test_language_index(self):
+        index = language_index("english")
+        self.assertIs(index, language_index("english"))
+        self.assertEqual(index.max_distance, 1)
+        self.assertTrue(all(w.isascii() for w in index.words[:500]))
+        self.assertTrue(any(len(w) == 3 for w in index.words))
+        self.assertTrue(any(len(w) >= 7 for w in index.words))
+
+    def test_only_app_word_lists_indexed(self):
+        with mock.patch.dict(similarity._language_indexes, clear=True), \
+                mock.patch.object(utils, "_read_dict", wraps=utils._read_dict) as read:
+            similarity.preload_miss_indexes().join()
+            self.assertEqual(set(similarity._language_indexes), set(utils.APP_LANGUAGES))
+        paths = [call.args[0] for call in read.call_args_list]
+        self.assertEqual(sorted(paths), sorted(utils._APP_DICT_PATHS))
+        self.assertNotIn("/usr/share/dict/words", paths)
+
+    def test_miss_index_follows_the_expected_language(self):
+        self.assertIs(miss_index(["maison", "pomme"]), language_index("french"))
+        self.assertIs(miss_index(["house", "apple"]), language_index("english"))
+        self.assertIs(miss_index(["qwxz"]), language_index(utils.APP_LANGUAGES[0]))
+
+
+class TestSampleDistinct(unittest.TestCase):
+    """sample_distinct never returns words within the distance of each other."""
+
+    def test_no_confusable_pairs(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            sample = sample_distinct(_CORPUS, 5, rng=rng)
+            self.assertEqual(len(set(sample)), 5)
+            self.assertEqual(_confusable(sample), [])
+
+    def test_dense_list_falls_back_to_distinct(self):
+        sample = sample_distinct(["aa", "ab", "ac"], 3, rng=random.Random(1), max_tries=5)
+        self.assertEqual(sorted(sample), ["aa", "ab", "ac"])
+
+    def test_too_large_sample(self):
+        with self.assertRaises(ValueError):
+            sample_distinct(["a", "a", "b"], 3)
+
+    def test_pair_generators_avoid_confusable_words(self):
+        random.seed(5)
+        for cls in (WordPairs, NameAttributePairs, WordNumberPairs):
+            for _ in range(100):
+                pb = cls.create()
+                sample = [w for tok in pb.memorize.split() for w in tok.split(":") if not w.isdigit()]
+                self.assertEqual(_confusable(sample), [], pb.memorize)
+
+
+if __name__ == "__main__":
+    unittest.main()
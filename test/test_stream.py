@@ -0,0 +1,120 @@
+"""Unit tests for stream module: weighted source and composable stages."""
+
+import random
+import unittest
+from functools import partial
+
+from classes import Problem
+from problems import Number, NumberCalculate, WordList
+from stream import (
+    batch,
+    dedupe,
+    difficulty,
+    pipeline,
+    problem_stream,
+    spaced,
+    take,
+    weighted_classes,
+    where,
+)
+
+
+def _make_problem(name="Test", memorize="a b", exposure_ms=3000):
+    return Problem(name=name, memorize=memorize, prompt="?", solution="b a", exposure_ms=exposure_ms)
+
+
+class TestSource(unittest.TestCase):
+    """weighted_classes / problem_stream: infinite, weighted, lazy."""
+
+    def test_empty_problems_raises(self):
+        with self.assertRaises(ValueError):
+            next(weighted_classes({}))
+
+    def test_zero_weight_class_never_drawn(self):
+        classes = list(take(weighted_classes({Number: 1.0, WordList: 0.0}, random.Random(1)), 200))
+        self.assertEqual(set(classes), {Number})
+
+    def test_seeded_rng_is_reproducible(self):
+        problems = {Number: 0.5, NumberCalculate: 0.5}
+        a = [pb.to_dict() for pb in take(problem_stream(problems, random.Random(3)), 5)]
+        b = [pb.to_dict() for pb in take(problem_stream(problems, random.Random(3)), 5)]
+        self.assertEqual([d["name"] for d in a], [d["name"] for d in b])
+
+    def test_stream_is_lazy(self):
+        calls = []
+
+        class Counting(Problem):
+            @classmethod
+            def create(cls, **kwargs):
+                calls.append(1)
+                return _make_problem()
+
+        stream = problem_stream({Counting: 1.0})
+        self.assertEqual(calls, [])
+        list(take(stream, 3))
+        self.assertEqual(len(calls), 3)
+
+    def test_create_kwargs_forwarded(self):
+        pb = next(problem_stream({Number: 1.0}, number_length=11))
+        self.assertEqual(len(pb.memorize), 11)
+
+    def test_seeded_stream_records_origin(self):
+        pb = next(problem_stream({Number: 1.0}, rng=random.Random(3), seeded=True, number_length=4))
+        self.assertEqual(pb._origin["generator"], "Number")
+        self.assertEqual(pb._origin["params"], {"number_length": 4})
+
+
+class TestStages(unittest.TestCase):
+    """dedupe, where, difficulty, spaced, take, batch, pipeline."""
+
+    def test_dedupe_drops_repeats_in_window(self):
+        items = [_make_problem(memorize=m) for m in "aabac"]
+        self.assertEqual([pb.memorize for pb in dedupe(items)], ["a", "b", "c"])
+
+    def test_dedupe_window_expires(self):
+        items = [_make_problem(memorize=m) for m in "abab"]
+        self.assertEqual([pb.memorize for pb in dedupe(items, window=1)], ["a", "b", "a", "b"])
+
+    def test_dedupe_patience_prevents_stall(self):
+        items = [_make_problem(memorize="same")] * 10
+        self.assertEqual(len(list(dedupe(items, patience=3))), 3)
+
+    def test_where_and_difficulty(self):
+        items = [_make_problem(exposure_ms=ms) for ms in (1000, 3000, 6000)]
+        self.assertEqual([pb.exposure_ms for pb in difficulty(items, max_exposure_ms=3000)], [1000, 3000])
+        self.assertEqual([pb.exposure_ms for pb in difficulty(items, min_exposure_ms=2000)], [3000, 6000])
+        self.assertEqual(len(list(where(items, lambda pb: pb.exposure_ms == 6000))), 1)
+
+    def test_spaced_separates_same_type(self):
+        names = "AABBAB"
+        out = [pb.name for pb in spaced(_make_problem(name=n) for n in names)]
+        self.assertEqual(sorted(out), sorted(names))
+        for prev, cur in zip(out, out[1:]):
+            self.assertNotEqual(prev, cur)
+
+    def test_spaced_single_type_still_flows(self):
+        items = (_make_problem(name="A") for _ in range(100))
+        self.assertEqual(len(list(take(spaced(items, max_pending=4), 10))), 10)
+
+    def test_batch(self):
+        self.assertEqual(list(batch(range(5), 2)), [[0, 1], [2, 3], [4]])
+        with self.assertRaises(ValueError):
+            list(batch(range(5), 0))
+
+    def test_pipeline_composes_stages(self):
+        stream = pipeline(
+            problem_stream({Number: 0.5, NumberCalculate: 0.5}, random.Random(0)),
+            dedupe,
+            partial(spaced, gap=1),
+            partial(take, n=6),
+            partial(batch, size=3),
+        )
+        batches = list(stream)
+        self.assertEqual([len(b) for b in batches], [3, 3])
+        flat = [pb.name for b in batches for pb in b]
+        for prev, cur in zip(flat, flat[1:]):
+            self.assertNotEqual(prev, cur)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for streaming module: drift-free scheduling and N-back scoring."""
+
+import random
+import time
+import unittest
+
+from streaming import StimulusScheduler, make_sequence, run_stream, score_stream, targets
+
+
+class FakeClock:
+    """Clock advanced only by sleep() and by a fixed cost per reading."""
+
+    def __init__(self, tick=0.0001):
+        self.now = 100.0
+        self.tick = tick
+
+    def __call__(self):
+        self.now += self.tick
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestStimulusScheduler(unittest.TestCase):
+    def test_deadlines_do_not_drift(self):
+        clock = FakeClock()
+        scheduler = StimulusScheduler(0.5, clock=clock, sleep=clock.sleep)
+        scheduler.begin()
+        start = scheduler.start
+        for i in range(20):
+            scheduler.wait_until(scheduler.deadline(i))
+            clock.now += 0.03  # slow drawing after every onset
+        self.assertEqual(scheduler.deadline(19), start + 19 * 0.5)
+        self.assertLess(max(scheduler.lateness), 0.001)
+
+    def test_late_start_catches_up(self):
+        clock = FakeClock()
+        scheduler = StimulusScheduler(0.1, clock=clock, sleep=clock.sleep)
+        scheduler.begin()
+        clock.now += 0.25  # stalled past two deadlines
+        released = [scheduler.wait_until(scheduler.deadline(i)) for i in range(5)]
+        self.assertGreater(scheduler.lateness[0], 0.2)
+        self.assertLess(scheduler.lateness[4], 0.001)
+        self.assertAlmostEqual(released[4], scheduler.start + 0.4, places=3)
+
+    def test_deadline_requires_begin(self):
+        with self.assertRaises(RuntimeError):
+            StimulusScheduler(0.1).deadline(0)
+
+    def test_rejects_non_positive_period(self):
+        with self.assertRaises(ValueError):
+            StimulusScheduler(0)
+
+    def test_real_clock_never_early(self):
+        # Only ordering is asserted: how late a wait returns depends on the machine's load.
+        scheduler = StimulusScheduler(0.01)
+        scheduler.begin()
+        released = [scheduler.wait_until(scheduler.deadline(i), poll=lambda timeout_s: time.sleep(timeout_s))
+                    for i in range(10)]
+        self.assertEqual(released, sorted(released))
+        for i, now in enumerate(released):
+            self.assertGreaterEqual(now, scheduler.deadline(i))
+        self.assertEqual(len(scheduler.lateness), 10)
+        self.assertTrue(all(late >= 0 for late in scheduler.lateness))
+
+
+class TestSequence(unittest.TestCase):
+    def test_length_and_target_rate(self):
+        rng = random.Random(3)
+        seq = make_sequence(2, 2000, match_rate=0.3, rng=rng)
+        self.assertEqual(len(seq), 2000)
+        rate = sum(targets(seq, 2)) / (2000 - 2)
+        self.assertAlmostEqual(rate, 0.3, delta=0.04)
+
+    def test_first_positions_are_never_targets(self):
+        seq = make_sequence(3, 10, match_rate=1.0, rng=random.Random(1))
+        self.assertEqual(targets(seq, 3), [False] * 3 + [True] * 7)
+
+    def test_rejects_short_sequences(self):
+        with self.assertRaises(ValueError):
+            make_sequence(3, 3)
+
+
+class TestScoreStream(unittest.TestCase):
+    def test_counts(self):
+        seq = list("ABAB" "CA")  # 2-back targets at 2 and 3
+        result = score_stream(seq, 2, {2: 400, 4: 300})
+        self.assertEqual((result.hits, result.misses, result.false_alarms, result.correct_rejections), (1, 1, 1, 3))
+        self.assertEqual(result.hit_rts_ms, [400])
+        self.assertEqual(result.mean_hit_rt_ms, 400)
+        self.assertAlmostEqual(result.score, 4 / 6)
+        self.assertEqual(result.stimuli[4]["outcome"], "false_alarm")
+        self.assertEqual(result.to_dict()["hits"], 1)
+
+
+class TestRunStream(unittest.TestCase):
+    def test_presses_attributed_to_stimulus_on_screen(self):
+        clock = FakeClock()
+        scheduler = StimulusScheduler(0.5, clock=clock, sleep=clock.sleep)
+        shown = []
+        press_at = {1: 0.2, 3: 0.45}  # stimulus index -> seconds after onset
+
+        def read_key(timeout_s):
+            clock.now += timeout_s
+            if shown:
+                index = len(shown) - 1
+                elapsed = clock.now - (scheduler.deadline(index))
+                if index in press_at and elapsed >= press_at[index]:
+                    del press_at[index]
+                    return True
+            return None
+
+        responses = run_stream(list("ABAB"), scheduler, shown.append, lambda: None, read_key, lead_in_s=0.1)
+        self.assertEqual(shown, list("ABAB"))
+        self.assertEqual(sorted(responses), [1, 3])
+        self.assertAlmostEqual(responses[1], 200, delta=10)
+        self.assertAlmostEqual(responses[3], 450, delta=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,13 +4,18 @@ import argparse
 import curses
 import datetime
 import os
-import random
 import sys
 import time
 
-from classes import Record
-from problems import create_problems_dict
+from classes import Problem, Record
+from offload import ProblemExecutor, prefetched
+from problems import NBack, create_problems_dict
+from scoring import EditDistance
 from sessions import save_session_data, format_score, load_session_statistics
+from similarity import preload_miss_indexes
+from stream import problem_stream, take, weighted_classes
+from streaming import StimulusScheduler, make_sequence, run_stream, score_stream
+from utils import IncrementalDistance
 
 checkmark = "\u2713"  # ✓
 cross = "\u2717"  # ✗
@@ -127,6 +132,19 @@ def display_memorize_phase(
         curses.napms(step_ms)
 
 
+def live_tracker(pb: Problem) -> IncrementalDistance | None:
+    """Closeness tracker for pb's answer, or None when its scorer is not an edit distance.
+
+    Only EditDistance scores agree with a keystroke-by-keystroke distance;
+    for the other scorers (yes/no, numbers, cell sets, anagrams) the line
+    would disagree with the final score, and for yes/no give the answer away.
+    """
+    scorer = pb.scorer
+    if type(scorer) is not EditDistance:
+        return None
+    return IncrementalDistance(pb.normalized_solution, scorer.transpositions)
+
+
 def display_response_phase(
     stdscr,
     prompt: str,
@@ -136,8 +154,13 @@ def display_response_phase(
     correct_count: int,
     session_time: float,
     session_start: float,
+    tracker: IncrementalDistance | None = None,
 ) -> tuple[str, int]:
-    """Display the response phase with increasing timer."""
+    """Display the response phase with increasing timer.
+
+    With a tracker (live_tracker), a closeness line under the answer is
+    updated on every keystroke.
+    """
     height, width = stdscr.getmaxyx()
     stdscr.clear()
 
@@ -170,11 +193,20 @@ def display_response_phase(
         pass
 
     timer_y = center_y + 3
+    closeness_y = center_y + 2
     input_cursor_x = input_x + len(input_text)
     start_time_ns = time.time_ns()
     user_input = ""
 
+    def show_closeness():
+        stdscr.move(closeness_y, 0)
+        stdscr.clrtoeol()
+        color = curses.color_pair(2) if tracker.score >= 0.7 else curses.color_pair(1)
+        display_centered_text(stdscr, closeness_y, f"Closeness: {tracker.score:.0%}", color)
+
     display_centered_text(stdscr, timer_y, "Response time: 0ms", curses.color_pair(1))
+    if tracker is not None:
+        show_closeness()
     stdscr.move(input_y, input_cursor_x)
     stdscr.refresh()
 
@@ -210,9 +242,15 @@ def display_response_phase(
                 stdscr.move(input_y, input_x)
                 stdscr.clrtoeol()
                 stdscr.addstr(input_y, input_x, input_text + user_input)
+                if tracker is not None:
+                    tracker.pop()
+                    show_closeness()
         elif 32 <= key <= 126:
             user_input += chr(key)
             stdscr.addch(input_y, input_cursor_x + len(user_input) - 1, key)
+            if tracker is not None:
+                tracker.push(chr(key).lower())
+                show_closeness()
 
         stdscr.move(input_y, input_cursor_x + len(user_input))
         stdscr.refresh()
@@ -258,11 +296,102 @@ def display_feedback_phase(
     stdscr.timeout(-1)
 
 
-def main(stdscr, max_nr: int, selected_problems: dict | None) -> None:
+def init_screen(stdscr) -> None:
+    """Colors used by the display helpers; hides the cursor and clears the screen."""
+    curses.start_color()
+    curses.use_default_colors()
+    curses.init_pair(1, curses.COLOR_RED, -1)
+    curses.init_pair(2, curses.COLOR_GREEN, -1)
+    curses.init_pair(3, curses.COLOR_BLUE, -1)
+    curses.curs_set(0)
+    stdscr.clear()
+
+
+def run_nback_stream(stdscr, n_back: int, length: int, period_ms: int):
+    """Show a letter every period_ms; the player presses SPACE when it matches the one n_back earlier.
+
+    Returns (StreamResult, scheduler jitter in ms).
+    """
+    height = stdscr.getmaxyx()[0]
+    center_y = height // 2
+    seq = make_sequence(n_back, length)
+    scheduler = StimulusScheduler(period_ms / 1000)
+
+    def show(item):
+        display_centered_text(stdscr, center_y, item)
+        stdscr.refresh()
+
+    def hide():
+        stdscr.move(center_y, 0)
+        stdscr.clrtoeol()
+        stdscr.refresh()
+
+    def read_key(timeout_s):
+        stdscr.timeout(max(0, int(timeout_s * 1000)))
+        return True if stdscr.getch() == ord(" ") else None
+
+    stdscr.clear()
+    display_centered_text(stdscr, 1, f"{n_back}-back stream | {length} letters every {period_ms}ms", curses.color_pair(3))
+    display_centered_text(stdscr, 2, f"Press SPACE when a letter matches the one {n_back} back", curses.color_pair(2))
+    stdscr.refresh()
+    responses = run_stream(seq, scheduler, show, hide, read_key)
+    stdscr.timeout(-1)
+    return score_stream(seq, n_back, responses), scheduler.jitter_ms()
+
+
+def nback_stream_main(stdscr, n_back: int, length: int, period_ms: int) -> None:
+    """One streaming N-back run, saved as a session with a single record plus per-stimulus details."""
+    try:
+        curses.endwin()
+        print(f"Streaming {n_back}-back: {length} letters, one every {period_ms}ms.")
+        input("Press Enter to start...")
+        start_time = time.time()
+        test_date = datetime.datetime.now()
+        init_screen(stdscr)
+        result, jitter = run_nback_stream(stdscr, n_back, length, period_ms)
+    finally:
+        try:
+            curses.curs_set(1)
+            curses.endwin()
+            curses.reset_shell_mode()
+        except curses.error:
+            pass
+
+    target_positions = [str(s["index"] + 1) for s in result.stimuli if s["target"]]
+    responded = [str(s["index"] + 1) for s in result.stimuli if s["rt_ms"] is not None]
+    problem = Problem(
+        f"{NBack.display_name()} Stream",
+        " ".join(result.sequence),
+        f"{n_back}-back stream",
+        " ".join(target_positions) or "none",
+        period_ms,
+        "stream",
+    )
+    record = Record(problem, " ".join(responded), result.mean_hit_rt_ms, result.score)
+    details = dict(result.to_dict(), period_ms=period_ms, jitter_ms=jitter)
+    save_session_data(test_date, start_time, 1, int(result.score >= 1.0), [record], extra={"nback_stream": details})
+
+    print(f"\nHits: {result.hits}  Misses: {result.misses}  False alarms: {result.false_alarms}  "
+          f"Correct rejections: {result.correct_rejections}")
+    print(f"Accuracy: {result.score:.1%}  Mean hit RT: {result.mean_hit_rt_ms}ms")
+    print(f"Stimulus timing: mean {jitter['mean']:.2f}ms, max {jitter['max']:.2f}ms late")
+
+
+def main(
+    stdscr,
+    max_nr: int,
+    selected_problems: dict | None,
+    offload: bool = False,
+    compact: bool = False,
+    live_score: bool = False,
+) -> None:
     global records
 
     problems = selected_problems if selected_problems else all_problems
     records = []
+    executor = ProblemExecutor(seeded=compact) if offload else None
+    if any(cls.classify_misses for cls in problems):
+        preload_miss_indexes()  # ready long before the first wrong answer
 
     try:
         curses.endwin()
@@ -273,20 +402,16 @@ def main(stdscr, max_nr: int, selected_problems: dict | None) -> None:
         start_time = time.time()
         test_date = datetime.datetime.now()
 
-        curses.start_color()
-        curses.use_default_colors()
-        curses.init_pair(1, curses.COLOR_RED, -1)
-        curses.init_pair(2, curses.COLOR_GREEN, -1)
-        curses.init_pair(3, curses.COLOR_BLUE, -1)
-        curses.curs_set(0)
-
-        stdscr.clear()
+        init_screen(stdscr)
         nr = 0
         total_score = 0.0
 
-        while nr < max_nr:
-            problem_class = random.choices(list(problems.keys()), list(problems.values()))[0]
-            pb = problem_class.create()
+        if executor is not None:
+            stream = prefetched(weighted_classes(problems), executor)
+        else:
+            stream = problem_stream(problems, seeded=compact)
+
+        for pb in take(stream, max_nr):
             memorize, prompt, solution, exposure_ms = (
                 pb.memorize,
                 pb.prompt,
@@ -304,18 +429,22 @@ def main(stdscr, max_nr: int, selected_problems: dict | None) -> None:
 
             curses.curs_set(1)
             user_input, response_ms = display_response_phase(
-                stdscr, prompt, nr + 1, max_nr, current_avg, correct_count, session_time, start_time
+                stdscr, prompt, nr + 1, max_nr, current_avg, correct_count, session_time, start_time,
+                live_tracker(pb) if live_score else None,
             )
             curses.curs_set(0)
 
             score = pb.evaluate_solution(user_input)
             total_score += score
-            records.append(Record(pb, user_input, response_ms, score))
+            miss = pb.classify_miss(user_input) if score < 1.0 else None
+            records.append(Record(pb, user_input, response_ms, score, miss))
 
             display_feedback_phase(stdscr, score, solution, user_input, response_ms, exposure_ms)
             nr += 1
 
     finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
         try:
             curses.curs_set(1)
             curses.endwin()
@@ -325,7 +454,7 @@ def main(stdscr, max_nr: int, selected_problems: dict | None) -> None:
 
     final_percentage = (total_score / nr * 100) if nr > 0 else 0
     n_perfect = sum(1 for r in records if r.score >= 1.0)
-    save_session_data(test_date, start_time, nr, n_perfect, records)
+    save_session_data(test_date, start_time, nr, n_perfect, records, compact=compact)
 
     print(f"\n{format_score(nr, n_perfect, records, total_score, final_percentage)}")
     print("\n" + "=" * 50)
@@ -366,6 +495,31 @@ def main(stdscr, max_nr: int, selected_problems: dict | None) -> None:
 def parse_args():
     parser = argparse.ArgumentParser(description="Immersive Memory Training Application")
     parser.add_argument("-n", "--questions", type=int, default=10, help="Number of questions (default: 10)")
+    parser.add_argument(
+        "--offload",
+        action="store_true",
+        help="Prepare upcoming problems in the background, running slow generators in worker processes/threads",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Store problems in the history with their (generator, seed), regenerated when read",
+    )
+    parser.add_argument(
+        "--live-score",
+        action="store_true",
+        help="Show how close the answer is to the solution while typing (edit-distance problems only)",
+    )
+    parser.add_argument(
+        "--nback-stream",
+        type=int,
+        metavar="N",
+        help="Run a streaming N-back session at level N instead of the problem mix",
+    )
+    parser.add_argument("--stimuli", type=int, default=30, help="Letters in a streaming N-back run (default: 30)")
+    parser.add_argument(
+        "--period-ms", type=int, default=500, help="Time between streaming N-back letters (default: 500)"
+    )
     return parser.parse_args()
 
 
@@ -376,11 +530,21 @@ if __name__ == "__main__":
         print("Error: Number of questions must be positive")
         sys.exit(1)
 
+    if args.nback_stream is not None:
+        if args.nback_stream < 1 or args.stimuli <= args.nback_stream or args.period_ms <= 0:
+            print("Error: --nback-stream needs N >= 1, --stimuli > N and a positive --period-ms")
+            sys.exit(1)
+        curses.wrapper(lambda stdscr: nback_stream_main(stdscr, args.nback_stream, args.stimuli, args.period_ms))
+        os.system("stty sane")
+        sys.exit(0)
+
     selected_problems = select_problems_interactively()
     if not selected_problems:
         print("No problems selected. Exiting.")
         sys.exit(0)
 
-    curses.wrapper(lambda stdscr: main(stdscr, args.questions, selected_problems))
+    curses.wrapper(
+        lambda stdscr: main(stdscr, args.questions, selected_problems, args.offload, args.compact, args.live_score)
+    )
 
     os.system("stty sane")
@@ -4,6 +4,8 @@ import random
 import sys
 from pathlib import Path
 
+from normalize import SHARP_S_TABLE
+
 _UTILS_DIR = Path(__file__).resolve().parent
 
 # Try to load .env from project root or news app (same GNEWS_KEY as apps/news)
@@ -37,11 +39,26 @@ def _dict_path(name: str) -> Path:
 
 _APP_DICT_NAMES = ('common_english_words.txt', 'common_french_words.txt', 'german_words.txt')
 _APP_DICT_PATHS = [str(_DICTS_DIR / name) for name in _APP_DICT_NAMES]
+APP_LANGUAGES = ('english', 'french', 'german')  # of _APP_DICT_NAMES, in order
 dict_paths = ['/usr/share/dict/words'] + _APP_DICT_PATHS
 
 words = []
 
 
+def _read_dict(dict_path: str) -> list[str]:
+    """Lowercased alphabetic words of one dictionary file; German ß is spelled ss."""
+    with open(dict_path) as f:
+        words_tmp = [w.strip().lower() for w in f if w.strip().isalpha()]
+    if "german" in dict_path:
+        words_tmp = [w.translate(SHARP_S_TABLE) for w in words_tmp]
+    return words_tmp
+
+
+def app_dict_words(language: str) -> list[str]:
+    """Every word of the app's own dictionary for language, without load_dicts' length range."""
+    return _read_dict(_APP_DICT_PATHS[APP_LANGUAGES.index(language)])
+
+
 def load_dicts(word_length_min=4, word_length_max=6):
     if words:
         return
@@ -54,11 +71,7 @@ def load_dicts(word_length_min=4, word_length_max=6):
             print(f"Error: dictionary file not found: {path}", file=sys.stderr)
             sys.exit(1)
     for dict_path in dict_paths:
-        with open(dict_path) as f:
-            words_tmp = [w.strip().lower() for w in f if w.strip().isalpha()]
-            if "german" in dict_path:
-                words_tmp = [w.replace('ß', 'ss') for w in words_tmp]
-            words.append([w for w in words_tmp if word_length_min <= len(w) <= word_length_max])
+        words.append([w for w in _read_dict(dict_path) if word_length_min <= len(w) <= word_length_max])
     if not words or all(len(w) == 0 for w in words):
         print("Error: all dictionary files are empty or contain no words in length range 4–6.", file=sys.stderr)
         sys.exit(1)
@@ -67,44 +80,20 @@ def load_dicts(word_length_min=4, word_length_max=6):
 load_dicts()
 
 
-def _pick_word_list(min_size: int) -> list[str]:
+def _pick_word_list(min_size: int, rng=None) -> list[str]:
     """Pick a non-empty word list. Raises ValueError if none available."""
     available = [w for w in words if len(w) >= min_size]
     if not available:
         raise ValueError("No word list with enough entries")
-    return random.choice(available)
+    return (rng or random).choice(available)
 
 
-def rnd_number(number_length: int) -> str:
+def rnd_number(number_length: int, rng=None) -> str:
     """Generate a random number of a given length. Requires number_length >= 0."""
     if number_length < 0:
         raise ValueError("number_length must be non-negative")
-    return ''.join([random.choice('0123456789') for _ in range(number_length)])
-
-
-def load_frequencies() -> dict[str, list[str]]:
-    """Load frequencies from dicts/frequencies.txt. Returns empty lists if file missing."""
-    path = _UTILS_DIR / 'dicts/frequencies.txt'
-    frequencies: dict[str, list[str]] = {'approach': [], 'tower': [], 'ground': []}
-    if not path.exists():
-        return frequencies
-    try:
-        with open(path) as f:
-            lines = f.readlines()
-    except OSError:
-        return frequencies
-    current_section = None
-    for line in lines:
-        line = line.strip()
-        if line.startswith('# Approach frequencies'):
-            current_section = 'approach'
-        elif line.startswith('# Tower frequencies'):
-            current_section = 'tower'
-        elif line.startswith('# Ground frequencies'):
-            current_section = 'ground'
-        elif line and current_section and not line.startswith('#'):
-            frequencies[current_section].append(line)
-    return frequencies
+    rng = rng or random
+    return ''.join([rng.choice('0123456789') for _ in range(number_length)])
 
 
 GNEWS_URL = "https://gnews.io/api/v4/top-headlines"
@@ -137,10 +126,265 @@ def fetch_gnews_headlines(topic: str = "general", max_items: int = 10) -> list[s
         return []
 
 
+def _trim_affixes(s1, s2):
+    """s1 and s2 without their common prefix and suffix, which never change the distance."""
+    if s1 == s2:
+        return '', ''
+    start = 0
+    end = min(len(s1), len(s2))
+    while start < end and s1[start] == s2[start]:
+        start += 1
+    while end > start and s1[end - 1 - len(s2) + len(s1)] == s2[end - 1]:
+        end -= 1
+    return s1[start:end + len(s1) - len(s2)], s2[start:end]
+
+
+def _myers(text, pattern, bound):
+    """Bit-parallel distance of pattern (the shorter, non-empty) to text, or None once it must exceed bound."""
+    m = len(pattern)
+    peq = {}  # character -> bits of its positions in pattern
+    bit = 1
+    for c in pattern:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1
+
+    pv, mv, score = mask, 0, m
+    # The last-row score drops by at most one per remaining text character.
+    slack = bound + len(text)
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        slack -= 1
+        if score > slack:
+            return None
+        ph = (ph << 1 | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score
+
+
+def _banded(s1, s2, k):
+    """Ukkonen's band: DP cells within k of the diagonal only, stopping once a row exceeds k.
+
+    s1 is the longer string. Cell (i, j) lives at band[j - i + k]; cells outside
+    the band are at least k + 1, which is all an "at most k" answer needs.
+    """
+    n, m = len(s1), len(s2)
+    width = 2 * k + 1
+    over = k + 1
+    prev = [over] * (width + 1)
+    for t in range(k, min(width, k + m + 1)):
+        prev[t] = t - k
+    for i in range(1, n + 1):
+        cur = [over] * (width + 1)
+        c1 = s1[i - 1]
+        row_min = over
+        for t in range(max(0, k - i), min(width, m - i + k + 1)):
+            j = i + t - k
+            if j == 0:
+                value = i
+            else:
+                value = prev[t] + (c1 != s2[j - 1])
+                if prev[t + 1] < value:
+                    value = prev[t + 1] + 1
+                if t and cur[t - 1] < value:
+                    value = cur[t - 1] + 1
+                if value > over:
+                    value = over
+            cur[t] = value
+            if value < row_min:
+                row_min = value
+        if row_min > k:
+            return None
+        prev = cur
+    distance = prev[m - n + k]
+    return distance if distance <= k else None
+
+
+# Band half-widths up to this are cheaper as a banded DP than as bit vectors.
+_BAND_MAX_K = 2
+
+
+def distance_at_most(s1, s2, k):
+    """The Levenshtein distance of s1 and s2 if it is at most k, else None.
+
+    Work stops as soon as the bound is certainly exceeded: the length
+    difference is checked first, the common prefix and suffix are dropped,
+    and the rest runs either inside Ukkonen's diagonal band of half-width k
+    (O(k * n)) or as bit vectors with an early exit.
+    """
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if len(s1) - len(s2) > k:
+        return None
+    s1, s2 = _trim_affixes(s1, s2)
+    if not s2:
+        return len(s1) if len(s1) <= k else None
+    if k <= _BAND_MAX_K:
+        return _banded(s1, s2, k)
+    return _myers(s1, s2, k)
+
+
 def levenshtein_distance(s1, s2):
-    """Calculate the Levenshtein distance between two strings"""
+    """Calculate the Levenshtein distance between two strings.
+
+    Bit-parallel (Myers 1999, in Hyyrö's formulation): one column of the DP
+    matrix is kept as vertical +1/-1 delta bit vectors over the shorter
+    string, packed in Python ints, so each character of the longer string
+    costs a handful of integer operations on ceil(m / 64) machine words.
+    """
     if len(s1) < len(s2):
-      return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+    s1, s2 = _trim_affixes(s1, s2)
+    if not s2:
+        return len(s1)
+    return _myers(s1, s2, len(s1))
+
+
+def _osa(text, pattern):
+    """Bit-parallel optimal string alignment distance of pattern (the shorter, non-empty) to text.
+
+    Hyyrö's 2003 extension of _myers: a cell is also reachable diagonally
+    from two rows and columns back when the two characters are swapped, which
+    adds one term (tr) to the zero-delta vector d0 of each column.
+    """
+    m = len(pattern)
+    peq = {}
+    bit = 1
+    for c in pattern:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1
+
+    pv, mv, d0, previous_eq, score = mask, 0, 0, 0, m
+    for c in text:
+        eq = peq.get(c, 0)
+        # c matches one row below where the previous text character matched.
+        tr = ((~d0 & eq) << 1) & previous_eq
+        d0 = (((eq & pv) + pv) ^ pv) | eq | mv | tr
+        ph = mv | (~(d0 | pv) & mask)
+        mh = pv & d0
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1 | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(d0 | ph) & mask)
+        mv = ph & d0
+        previous_eq = eq
+    return score
+
+
+def osa_distance(s1, s2):
+    """Levenshtein distance in which swapping two adjacent characters is one edit, not two.
+
+    This is the optimal string alignment (restricted Damerau) distance: no
+    substring is edited twice, so "ca" -> "abc" is 3, not 2. It suits recall
+    of digits and letters, where most slips are transpositions ("stvgbxaf"
+    for "stgvbxaf" is 1). Same cost as levenshtein_distance.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    s1, s2 = _trim_affixes(s1, s2)
+    if not s2:
+        return len(s1)
+    return _osa(s1, s2)
+
+
+class IncrementalDistance:
+    """Levenshtein distance between a fixed target and text typed one character at a time.
+
+    The target's positions are the bit vectors of levenshtein_distance, and
+    the (pv, mv, distance) state after every typed prefix is kept on a stack:
+    push() runs one step of the recurrence on ceil(len(target) / 64) machine
+    words, pop() (backspace) drops back to the saved state, and distance and
+    score are read off the top without recomputation.
+
+    With transpositions the distance is osa_distance's: each state also keeps
+    the step's d0 and match vector for the transposition term.
+    """
+
+    def __init__(self, target: str, transpositions: bool = False):
+        self.target = target
+        self.transpositions = transpositions
+        self._peq = {}
+        bit = 1
+        for c in target:
+            self._peq[c] = self._peq.get(c, 0) | bit
+            bit <<= 1
+        self._mask = bit - 1
+        self._last = bit >> 1
+        self._states = [(self._mask, 0, len(target), 0, 0)]
+        self._typed = []
+
+    @property
+    def text(self) -> str:
+        return ''.join(self._typed)
+
+    @property
+    def distance(self) -> int:
+        return self._states[-1][2]
+
+    @property
+    def score(self) -> float:
+        """Problem.evaluate_solution's formula for the text typed so far."""
+        max_length = max(len(self._typed), len(self.target))
+        if max_length == 0:
+            return 1.0
+        return max(0.0, 1.0 - self.distance / max_length)
+
+    def push(self, char: str) -> int:
+        """Append one character; returns the new distance."""
+        pv, mv, score, previous_d0, previous_eq = self._states[-1]
+        mask = self._mask
+        eq = d0 = 0
+        if mask:
+            eq = self._peq.get(char, 0)
+            d0 = (((eq & pv) + pv) ^ pv) | eq | mv
+            if self.transpositions:
+                d0 |= ((~previous_d0 & eq) << 1) & previous_eq
+            ph = mv | (~(d0 | pv) & mask)
+            mh = pv & d0
+            if ph & self._last:
+                score += 1
+            elif mh & self._last:
+                score -= 1
+            ph = (ph << 1 | 1) & mask
+            mh = (mh << 1) & mask
+            pv = mh | (~(d0 | ph) & mask)
+            mv = ph & d0
+        else:
+            score += 1
+        self._states.append((pv, mv, score, d0, eq))
+        self._typed.append(char)
+        return score
+
+    def pop(self) -> int:
+        """Remove the last typed character (no-op on empty text); returns the new distance."""
+        if self._typed:
+            self._typed.pop()
+            self._states.pop()
+        return self.distance
+
+
+def _levenshtein_dp(s1, s2):
+    """Row-by-row dynamic programming Levenshtein distance; the reference for levenshtein_distance."""
+    if len(s1) < len(s2):
+      return _levenshtein_dp(s2, s1)
     
     if len(s2) == 0:
       return len(s1)
@@ -156,3 +400,17 @@ def levenshtein_distance(s1, s2):
       previous_row = current_row
     
     return previous_row[-1]
+
+
+def _osa_dp(s1, s2):
+    """Dynamic programming optimal string alignment distance; the reference for osa_distance."""
+    rows = [list(range(len(s2) + 1))]
+    for i, c1 in enumerate(s1, 1):
+        row = [i]
+        for j, c2 in enumerate(s2, 1):
+            value = min(rows[-1][j] + 1, row[j - 1] + 1, rows[-1][j - 1] + (c1 != c2))
+            if i > 1 and j > 1 and c1 == s2[j - 2] and s1[i - 2] == c2:
+                value = min(value, rows[-2][j - 2] + 1)
+            row.append(value)
+        rows.append(row)
+    return rows[-1][-1]